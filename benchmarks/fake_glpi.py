@@ -0,0 +1,451 @@
+"""In-process fake GLPI REST API used by the benchmarks and load tests."""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+API_PREFIX = "/apirest.php/"
+DEFAULT_RANGE = (0, 49)
+SEARCH_OPTIONS: Dict[int, Tuple[str, str]] = {
+    1: ("name", "Title"),
+    2: ("id", "ID"),
+    3: ("priority", "Priority"),
+    10: ("urgency", "Urgency"),
+    11: ("impact", "Impact"),
+    12: ("status", "Status"),
+    14: ("type", "Type"),
+    15: ("date", "Opening date"),
+    16: ("closedate", "Closing date"),
+    17: ("solvedate", "Resolution date"),
+    19: ("date_mod", "Last update"),
+    21: ("content", "Description"),
+    80: ("entities_id", "Entity"),
+}
+DEFAULT_SEARCH_DISPLAY = (1, 2, 12, 19)
+_NUMERIC = re.compile(r"^\d+$")
+
+
+class FakeGLPIServer:
+    """Threaded HTTP server that mimics the parts of the GLPI API the client uses.
+
+    Items are generated lazily per itemtype. ``latency`` (plus up to
+    ``jitter`` seconds) is slept before every response, ``payload_bytes``
+    pads each item's ``content`` and ``max_range`` is the ``Accept-Range``
+    limit enforced on listings and searches.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        items: int = 500,
+        payload_bytes: int = 256,
+        max_range: int = 1000,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.initial_items = items
+        self.payload_bytes = payload_bytes
+        self.max_range = max_range
+        self._lock = threading.Lock()
+        self._store: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        self._next_id: Dict[str, int] = {}
+        self._documents: Dict[int, bytes] = {}
+        self._sessions: Dict[str, str] = {}
+        self.requests: Counter = Counter()
+        self.logins: Counter = Counter()
+        self.entity_changes: Counter = Counter()
+        self.profile_changes: Counter = Counter()
+        self._server = _Server((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeGLPIServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fake-glpi", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeGLPIServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def request_counts(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.requests)
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.requests.clear()
+
+    # -- data -----------------------------------------------------------------
+
+    def _items(self, item_type: str) -> Dict[int, Dict[str, Any]]:
+        store = self._store.get(item_type)
+        if store is None:
+            count = self.initial_items if item_type in ("Ticket", "Change") else 0
+            store = {id_: self._generate(item_type, id_) for id_ in range(1, count + 1)}
+            self._store[item_type] = store
+            self._next_id[item_type] = count + 1
+        return store
+
+    def _generate(self, item_type: str, id_: int) -> Dict[str, Any]:
+        filler = f"{item_type} {id_} " * (self.payload_bytes // 8 + 1)
+        return {
+            "id": id_,
+            "name": f"{item_type} #{id_}",
+            "content": filler[: self.payload_bytes],
+            "status": 1 + id_ % 6,
+            "priority": 1 + id_ % 5,
+            "urgency": 1 + id_ % 5,
+            "impact": 1 + id_ % 5,
+            "type": 1 + id_ % 2,
+            "entities_id": 0,
+            "date": "2024-01-01 00:00:00",
+            "date_mod": f"2024-01-01 00:{id_ // 60 % 60:02d}:{id_ % 60:02d}",
+            "closedate": None,
+            "solvedate": None,
+            "is_deleted": 0,
+        }
+
+    def _create(self, item_type: str, values: Dict[str, Any]) -> Dict[str, Any]:
+        store = self._items(item_type)
+        id_ = self._next_id[item_type]
+        self._next_id[item_type] = id_ + 1
+        store[id_] = {**self._generate(item_type, id_), **values, "id": id_}
+        return {"id": id_, "message": ""}
+
+    # -- request dispatch -----------------------------------------------------
+
+    def handle(
+        self, method: str, path: str, query: List[Tuple[str, str]], headers: Any, body: bytes
+    ) -> Tuple[int, Dict[str, str], Any]:
+        if self.latency or self.jitter:
+            time.sleep(self.latency + random.uniform(0, self.jitter))
+        endpoint = path[len(API_PREFIX):] if path.startswith(API_PREFIX) else path.lstrip("/")
+        endpoint = endpoint.strip("/")
+        parts = endpoint.split("/")
+        with self._lock:
+            key = "/".join("{id}" if _NUMERIC.match(part) else part for part in parts)
+            self.requests[f"{method} {key}"] += 1
+
+            if endpoint == "initSession":
+                token = f"fake-{len(self._sessions) + 1}-{random.getrandbits(32):08x}"
+                user = headers.get("Authorization", "").partition(" ")[2]
+                self._sessions[token] = user
+                self.logins[user] += 1
+                return 200, {}, {"session_token": token}
+            token = headers.get("Session-Token")
+            if token not in self._sessions:
+                return 401, {}, ["ERROR_SESSION_TOKEN_INVALID", "session_token seems invalid"]
+            if endpoint == "killSession":
+                self._sessions.pop(token, None)
+                return 200, {}, {}
+            if endpoint == "changeActiveEntities" and method == "POST":
+                entity = _json_body(body).get("entities_id")
+                self.entity_changes[(self._sessions[token], entity)] += 1
+                return 200, {}, True
+            if endpoint == "changeActiveProfile" and method == "POST":
+                profile = _json_body(body).get("profiles_id")
+                self.profile_changes[(self._sessions[token], profile)] += 1
+                return 200, {}, True
+            if parts[0] in _SESSION_ENDPOINTS:
+                return 200, {}, _SESSION_ENDPOINTS[parts[0]]
+            if parts[0] == "listSearchOptions" and len(parts) == 2:
+                return 200, {}, _search_options(parts[1])
+            if parts[0] == "search" and len(parts) == 2:
+                return self._search(parts[1], query)
+            if parts[0] == "Document" and method == "POST":
+                return self._upload(body)
+            if parts[0] == "Document" and method == "GET" and len(parts) == 2:
+                if "octet-stream" in headers.get("Accept", ""):
+                    return 200, {"Content-Type": "application/octet-stream"}, self._documents.get(
+                        int(parts[1]), b""
+                    )
+
+            payload = _json_body(body)
+            if method == "GET":
+                return self._get(parts, query)
+            if method == "POST" and len(parts) == 1:
+                entries = payload.get("input", {})
+                if isinstance(entries, list):
+                    return 201, {}, [self._create(parts[0], entry) for entry in entries]
+                return 201, {}, self._create(parts[0], entries)
+            if method in ("PUT", "PATCH"):
+                return self._update(parts, payload)
+            if method == "DELETE":
+                return self._delete(parts, payload)
+        return 400, {}, ["ERROR_BAD_REQUEST", f"Unsupported {method} {endpoint}"]
+
+    def _get(self, parts: List[str], query: List[Tuple[str, str]]):
+        item_type = parts[0]
+        store = self._items(item_type)
+        if len(parts) == 2 and _NUMERIC.match(parts[1]):
+            item = store.get(int(parts[1]))
+            if item is None:
+                return 404, {}, ["ERROR_ITEM_NOT_FOUND", "Item not found"]
+            return 200, {}, item
+        if len(parts) == 3 and _NUMERIC.match(parts[1]):
+            parent_id = int(parts[1])
+            foreign_key = f"{item_type.lower()}s_id"
+            rows = [
+                item
+                for item in self._items(parts[2]).values()
+                if item.get("items_id") == parent_id or item.get(foreign_key) == parent_id
+            ]
+            return self._paged(parts[2], rows, query)
+
+        params = dict(query)
+        rows = list(store.values())
+        if params.get("is_deleted") not in ("1", "true", "True"):
+            rows = [row for row in rows if not row.get("is_deleted")]
+        for name, value in query:
+            match = re.match(r"searchText\[(\w+)\]", name)
+            if match:
+                rows = [row for row in rows if value.lower() in str(row.get(match.group(1), "")).lower()]
+        sort = params.get("sort", "id")
+        rows.sort(
+            key=lambda row: (row.get(sort) is None, str(row.get(sort))),
+            reverse=params.get("order", "ASC").upper() == "DESC",
+        )
+        return self._paged(item_type, rows, query)
+
+    def _paged(self, item_type: str, rows: List[Dict[str, Any]], query: List[Tuple[str, str]]):
+        start, end = _parse_range(dict(query).get("range"))
+        total = len(rows)
+        if total and start >= total:
+            return 400, {}, ["ERROR_RANGE_EXCEED_TOTAL", "Provided range exceed total count of data"]
+        end = min(end, start + self.max_range - 1, max(total - 1, 0))
+        page = rows[start:end + 1]
+        headers = {
+            "Content-Range": f"{start}-{end}/{total}",
+            "Accept-Range": f"{item_type} {self.max_range}",
+        }
+        return (206 if len(page) < total else 200), headers, page
+
+    def _search(self, item_type: str, query: List[Tuple[str, str]]):
+        store = self._items(item_type)
+        criteria: Dict[int, Dict[str, str]] = {}
+        force_display: List[int] = []
+        for name, value in query:
+            match = re.match(r"criteria\[(\d+)\]\[(\w+)\]", name)
+            if match:
+                criteria.setdefault(int(match.group(1)), {})[match.group(2)] = value
+            elif name == "forcedisplay[]":
+                force_display.append(int(value))
+        params = dict(query)
+
+        rows = []
+        candidates = store.values()
+        if criteria and all(
+            c.get("field") == "2" and c.get("searchtype") == "equals"
+            and (index == 0 or c.get("link", "AND").upper().startswith("OR"))
+            for index, (_, c) in enumerate(sorted(criteria.items()))
+        ):
+            ids = dict.fromkeys(int(c["value"]) for _, c in sorted(criteria.items()))
+            candidates = [store[id_] for id_ in ids if id_ in store]
+        for item in candidates:
+            matched: Optional[bool] = None
+            for _, criterion in sorted(criteria.items()):
+                hit = _matches(item, criterion)
+                if matched is None:
+                    matched = hit
+                elif criterion.get("link", "AND").upper().startswith("OR"):
+                    matched = matched or hit
+                else:
+                    matched = matched and hit
+            if matched is None or matched:
+                rows.append(item)
+
+        start, end = _parse_range(params.get("range"))
+        total = len(rows)
+        end = min(end, start + self.max_range - 1, max(total - 1, 0))
+        uid_cols = params.get("uid_cols") in ("True", "true", "1")
+        columns = list(dict.fromkeys([*DEFAULT_SEARCH_DISPLAY, *force_display]))
+        data = []
+        for item in rows[start:end + 1]:
+            row = {}
+            for option in columns:
+                field = SEARCH_OPTIONS.get(option, (None,))[0]
+                column = f"{item_type}.{field}" if uid_cols else str(option)
+                row[column] = item.get(field) if field else None
+            data.append(row)
+        headers = {
+            "Content-Range": f"{start}-{end}/{total}",
+            "Accept-Range": f"{item_type} {self.max_range}",
+        }
+        payload = {
+            "totalcount": total,
+            "count": len(data),
+            "sort": [1],
+            "order": ["ASC"],
+            "data": data,
+            "content-range": headers["Content-Range"],
+        }
+        return (206 if len(data) < total else 200), headers, payload
+
+    def _update(self, parts: List[str], payload: Dict[str, Any]):
+        store = self._items(parts[0])
+        entries = payload.get("input", {})
+        if not isinstance(entries, list):
+            entries = [entries]
+        results = []
+        for entry in entries:
+            id_ = int(parts[1]) if len(parts) == 2 else int(entry.get("id", 0))
+            item = store.get(id_)
+            if item is None:
+                results.append({str(id_): False, "message": "Item not found"})
+                continue
+            item.update({key: value for key, value in entry.items() if key != "id"})
+            results.append({str(id_): True, "message": ""})
+        return 200, {}, results
+
+    def _delete(self, parts: List[str], payload: Dict[str, Any]):
+        store = self._items(parts[0])
+        entries = payload.get("input", {})
+        if not isinstance(entries, list):
+            entries = [entries]
+        ids = [int(parts[1])] if len(parts) == 2 else [int(e.get("id", 0)) for e in entries]
+        results = []
+        for id_ in ids:
+            item = store.get(id_)
+            if item is None:
+                results.append({str(id_): False, "message": "Item not found"})
+            elif payload.get("force_purge"):
+                del store[id_]
+                results.append({str(id_): True, "message": ""})
+            else:
+                item["is_deleted"] = 1
+                results.append({str(id_): True, "message": ""})
+        return 200, {}, results
+
+    def _upload(self, body: bytes):
+        created = self._create("Document", {"name": "upload"})
+        self._documents[created["id"]] = body
+        return 201, {}, {**created, "upload_result": {"filename": [{"size": len(body)}]}}
+
+
+_SESSION_ENDPOINTS: Dict[str, Any] = {
+    "getFullSession": {
+        "session": {
+            "glpiID": 2,
+            "glpiname": "glpi",
+            "glpiactiveprofile": {"id": 4, "name": "Super-Admin"},
+            "glpiactive_entity": 0,
+        }
+    },
+    "getMyProfiles": {"myprofiles": [{"id": 4, "name": "Super-Admin", "entities": []}]},
+    "getActiveProfile": {"active_profile": {"id": 4, "name": "Super-Admin"}},
+    "getMyEntities": {"myentities": [{"id": 0, "name": "Root entity"}]},
+    "getActiveEntities": {
+        "active_entity": {"id": 0, "active_entity_recursive": True, "active_entities": []}
+    },
+    "getGlpiConfig": {"cfg_glpi": {"version": "10.0.0"}},
+    "changeActiveProfile": {},
+    "changeActiveEntities": {},
+}
+
+
+def _search_options(item_type: str) -> Dict[str, Any]:
+    options: Dict[str, Any] = {"common": {"name": "Characteristics"}}
+    for option, (field, label) in SEARCH_OPTIONS.items():
+        options[str(option)] = {
+            "name": label,
+            "table": f"glpi_{item_type.lower()}s",
+            "field": field,
+            "uid": f"{item_type}.{field}",
+        }
+    return options
+
+
+def _matches(item: Dict[str, Any], criterion: Dict[str, str]) -> bool:
+    field = SEARCH_OPTIONS.get(int(criterion.get("field", 0)), (None,))[0]
+    if field is None:
+        return False
+    actual = "" if item.get(field) is None else str(item.get(field))
+    expected = criterion.get("value", "")
+    searchtype = criterion.get("searchtype", "contains")
+    if searchtype == "equals":
+        return actual == expected
+    if searchtype == "notequals":
+        return actual != expected
+    return expected.strip("^$").lower() in actual.lower()
+
+
+def _parse_range(value: Optional[str]) -> Tuple[int, int]:
+    if not value:
+        return DEFAULT_RANGE
+    start, _, end = value.partition("-")
+    return int(start), int(end or start)
+
+
+def _json_body(body: bytes) -> Dict[str, Any]:
+    if not body:
+        return {}
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+class _Server(ThreadingHTTPServer):
+    # Concurrent tool calls open many connections at once; the default
+    # backlog of 5 makes the kernel drop SYNs and adds 1s retransmits.
+    request_queue_size = 256
+
+
+def _make_handler(server: FakeGLPIServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def _dispatch(self):
+            url = urlsplit(self.path)
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            status, headers, payload = server.handle(
+                self.command, url.path, parse_qsl(url.query, keep_blank_values=True),
+                self.headers, body,
+            )
+            if isinstance(payload, bytes):
+                data = payload
+            else:
+                data = json.dumps(payload).encode("utf-8")
+                headers.setdefault("Content-Type", "application/json; charset=UTF-8")
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+        def log_message(self, format, *args):  # noqa: A002 - http.server API
+            pass
+
+    return Handler
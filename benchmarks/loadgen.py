@@ -0,0 +1,361 @@
+"""Concurrent stdio load generator for the MCP server.
+
+Launches ``python -m mcp_glpi.server`` against the fake GLPI server and
+drives it with parallel ``tools/call`` requests over JSON-RPC on stdio.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import click
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if SRC_DIR.exists() and str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from benchmarks.fake_glpi import FakeGLPIServer  # noqa: E402
+from benchmarks.run import SCENARIOS, _percentile  # noqa: E402
+
+PROTOCOL_VERSION = "2024-11-05"
+DEFAULT_MIX = "list_tickets=4,get_tickets=2,create_ticket=1,update_ticket=1,add_ticket_comment=1"
+TOOL_ARGUMENTS = {}
+for _scenario in SCENARIOS:
+    TOOL_ARGUMENTS.setdefault(_scenario.tool, _scenario.arguments)
+
+
+def parse_mix(value: str) -> List[Tuple[str, int]]:
+    mix = []
+    for part in value.split(","):
+        if not part.strip():
+            continue
+        tool, _, weight = part.partition("=")
+        tool = tool.strip()
+        if tool not in TOOL_ARGUMENTS:
+            raise ValueError(f"No arguments defined for tool {tool!r}")
+        mix.append((tool, int(weight or 1)))
+    if not mix:
+        raise ValueError("Tool mix is empty")
+    return mix
+
+
+def read_rss_bytes(pid: int) -> Optional[int]:
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as handle:
+            for line in handle:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    try:
+        import psutil  # type: ignore
+    except ImportError:
+        return None
+    try:
+        return psutil.Process(pid).memory_info().rss
+    except psutil.Error:
+        return None
+
+
+class StdioClient:
+    """Minimal JSON-RPC client for an MCP server speaking newline-delimited JSON."""
+
+    def __init__(self, process: asyncio.subprocess.Process):
+        self.process = process
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._write_lock = asyncio.Lock()
+        self._reader = asyncio.create_task(self._read_loop())
+
+    async def _read_loop(self) -> None:
+        assert self.process.stdout is not None
+        while True:
+            line = await self.process.stdout.readline()
+            if not line:
+                break
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            future = self._pending.pop(message.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(message)
+        error = ConnectionError("MCP server closed stdout")
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+    async def _send(self, message: Dict[str, Any]) -> None:
+        assert self.process.stdin is not None
+        async with self._write_lock:
+            self.process.stdin.write(json.dumps(message).encode("utf-8") + b"\n")
+            await self.process.stdin.drain()
+
+    async def request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        id_ = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[id_] = future
+        await self._send({"jsonrpc": "2.0", "id": id_, "method": method, "params": params})
+        return await future
+
+    async def notify(self, method: str, params: Optional[Dict[str, Any]] = None) -> None:
+        await self._send({"jsonrpc": "2.0", "method": method, "params": params or {}})
+
+    async def initialize(self) -> Dict[str, Any]:
+        response = await self.request(
+            "initialize",
+            {
+                "protocolVersion": PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "mcp-glpi-loadgen", "version": "1.0"},
+            },
+        )
+        await self.notify("notifications/initialized")
+        return response
+
+    async def close(self) -> None:
+        if self.process.stdin is not None:
+            self.process.stdin.close()
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout=10)
+        except asyncio.TimeoutError:
+            self.process.kill()
+            await self.process.wait()
+        self._reader.cancel()
+
+
+def _is_error(message: Dict[str, Any]) -> bool:
+    if "error" in message:
+        return True
+    result = message.get("result") or {}
+    if result.get("isError"):
+        return True
+    for content in result.get("content") or []:
+        if content.get("type") != "text":
+            continue
+        try:
+            payload = json.loads(content.get("text", ""))
+        except ValueError:
+            continue
+        if isinstance(payload, dict) and payload.get("ok") is False:
+            return True
+    return False
+
+
+async def run_load(
+    glpi_url: str,
+    mix: Sequence[Tuple[str, int]],
+    concurrency: int = 8,
+    duration: float = 30.0,
+    sample_interval: float = 1.0,
+    server_args: Sequence[str] = (),
+    server_log: Optional[str] = None,
+) -> Dict[str, Any]:
+    env = {
+        **os.environ,
+        "GLPI_URL": glpi_url,
+        "GLPI_APP_TOKEN": os.environ.get("GLPI_APP_TOKEN", "loadgen-app-token"),
+        "GLPI_USER_TOKEN": os.environ.get("GLPI_USER_TOKEN", "loadgen-user-token"),
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC_DIR), os.environ.get("PYTHONPATH")])),
+    }
+    stderr = open(server_log, "ab") if server_log else asyncio.subprocess.DEVNULL
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "mcp_glpi.server",
+        *server_args,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=stderr,
+        env=env,
+    )
+    client = StdioClient(process)
+    tools = [tool for tool, _ in mix]
+    weights = [weight for _, weight in mix]
+    samples: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    rss: List[Dict[str, Any]] = []
+    counter = itertools.count()
+
+    try:
+        started = time.perf_counter()
+        await asyncio.wait_for(client.initialize(), timeout=60)
+        startup_seconds = time.perf_counter() - started
+        deadline = time.perf_counter() + duration
+
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                tool = random.choices(tools, weights)[0]
+                arguments = TOOL_ARGUMENTS[tool](next(counter))
+                start = time.perf_counter()
+                try:
+                    message = await client.request(
+                        "tools/call", {"name": tool, "arguments": arguments}
+                    )
+                    failed = _is_error(message)
+                except ConnectionError:
+                    errors[tool] += 1
+                    return
+                samples[tool].append(time.perf_counter() - start)
+                if failed:
+                    errors[tool] += 1
+
+        async def sample_rss() -> None:
+            load_started = time.perf_counter()
+            while True:
+                rss.append(
+                    {
+                        "t": round(time.perf_counter() - load_started, 3),
+                        "rss_bytes": read_rss_bytes(process.pid),
+                    }
+                )
+                await asyncio.sleep(sample_interval)
+
+        sampler = asyncio.create_task(sample_rss())
+        load_started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+        elapsed = time.perf_counter() - load_started
+        sampler.cancel()
+        rss.append({"t": round(elapsed, 3), "rss_bytes": read_rss_bytes(process.pid)})
+    finally:
+        await client.close()
+        if server_log:
+            stderr.close()
+
+    all_samples = [value for values in samples.values() for value in values]
+    calls = len(all_samples)
+    rss_values = [point["rss_bytes"] for point in rss if point["rss_bytes"] is not None]
+    return {
+        "concurrency": concurrency,
+        "duration_seconds": round(elapsed, 3),
+        "startup_seconds": round(startup_seconds, 3),
+        "calls": calls,
+        "errors": sum(errors.values()),
+        "error_rate": round(sum(errors.values()) / calls, 4) if calls else None,
+        "throughput_per_second": round(calls / elapsed, 3) if elapsed else None,
+        "latency_seconds": _latency_summary(all_samples),
+        "tools": {
+            tool: {
+                "calls": len(values),
+                "errors": errors.get(tool, 0),
+                "latency_seconds": _latency_summary(values),
+            }
+            for tool, values in sorted(samples.items())
+        },
+        "rss": {
+            "start_bytes": rss_values[0] if rss_values else None,
+            "peak_bytes": max(rss_values) if rss_values else None,
+            "end_bytes": rss_values[-1] if rss_values else None,
+            "samples": rss,
+        },
+    }
+
+
+def _latency_summary(values: Sequence[float]) -> Dict[str, Optional[float]]:
+    if not values:
+        return {"p50": None, "p95": None, "p99": None, "max": None}
+    return {
+        "p50": round(_percentile(values, 0.50), 6),
+        "p95": round(_percentile(values, 0.95), 6),
+        "p99": round(_percentile(values, 0.99), 6),
+        "max": round(max(values), 6),
+    }
+
+
+def _format_report(report: Dict[str, Any]) -> List[str]:
+    def ms(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value * 1000:.2f}ms"
+
+    latency = report["latency_seconds"]
+    lines = [
+        f"calls {report['calls']} in {report['duration_seconds']}s"
+        f" ({report['throughput_per_second']}/s) with concurrency {report['concurrency']}",
+        f"latency p50 {ms(latency['p50'])}  p95 {ms(latency['p95'])}"
+        f"  p99 {ms(latency['p99'])}  max {ms(latency['max'])}",
+        f"errors {report['errors']} (rate {report['error_rate']})",
+    ]
+    rss = report["rss"]
+    if rss["peak_bytes"] is not None:
+        lines.append(
+            "server RSS start {:.1f}MiB  peak {:.1f}MiB  end {:.1f}MiB".format(
+                rss["start_bytes"] / 1_048_576,
+                rss["peak_bytes"] / 1_048_576,
+                rss["end_bytes"] / 1_048_576,
+            )
+        )
+    for tool, stats in report["tools"].items():
+        tool_latency = stats["latency_seconds"]
+        lines.append(
+            f"  {tool:<22} calls {stats['calls']:>6}  errors {stats['errors']:>4}"
+            f"  p50 {ms(tool_latency['p50'])}  p99 {ms(tool_latency['p99'])}"
+        )
+    return lines
+
+
+@click.command()
+@click.option("--mix", default=DEFAULT_MIX, show_default=True, help="Herramientas y pesos: tool=peso,...")
+@click.option("--concurrency", "-c", type=int, default=8, show_default=True)
+@click.option("--duration", "-d", type=float, default=30.0, show_default=True, help="Segundos de carga")
+@click.option("--sample-interval", type=float, default=1.0, show_default=True, help="Segundos entre muestras de RSS")
+@click.option("--latency", type=float, default=0.0, show_default=True, help="Latencia simulada de GLPI (segundos)")
+@click.option("--items", type=int, default=2000, show_default=True)
+@click.option("--glpi-url", default=None, help="Usar un GLPI existente en lugar del servidor simulado")
+@click.option("--server-log", type=click.Path(dir_okay=False), default=None, help="Archivo para el stderr del servidor")
+@click.option("--output", "-o", type=click.Path(dir_okay=False), default=None, help="Archivo JSON de resultados")
+@click.argument("server_args", nargs=-1)
+def main(
+    mix: str,
+    concurrency: int,
+    duration: float,
+    sample_interval: float,
+    latency: float,
+    items: int,
+    glpi_url: Optional[str],
+    server_log: Optional[str],
+    output: Optional[str],
+    server_args: Sequence[str],
+) -> None:
+    """Genera carga concurrente sobre el servidor MCP via stdio."""
+
+    try:
+        tool_mix = parse_mix(mix)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--mix")
+
+    def run(url: str) -> Dict[str, Any]:
+        return asyncio.run(
+            run_load(
+                url,
+                tool_mix,
+                concurrency=concurrency,
+                duration=duration,
+                sample_interval=sample_interval,
+                server_args=server_args,
+                server_log=server_log,
+            )
+        )
+
+    if glpi_url:
+        report = run(glpi_url)
+    else:
+        with FakeGLPIServer(latency=latency, items=items) as server:
+            report = run(server.url)
+
+    for line in _format_report(report):
+        click.echo(line)
+    if output:
+        Path(output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
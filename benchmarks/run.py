@@ -0,0 +1,342 @@
+"""Benchmark tool calls against the fake GLPI server and compare with a baseline."""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import click
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if SRC_DIR.exists() and str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from benchmarks.fake_glpi import FakeGLPIServer  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+RESULTS_VERSION = 1
+
+
+@dataclass
+class Scenario:
+    name: str
+    tool: str
+    arguments: Callable[[int], Dict[str, Any]]
+    iterations: int = 200
+    track_memory: bool = False
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario("list_tickets", "list_tickets", lambda i: {"limit": 50, "offset": i % 5 * 50}),
+    Scenario(
+        "list_tickets_large",
+        "list_tickets",
+        lambda i: {"limit": 1000, "output": "raw"},
+        iterations=10,
+        track_memory=True,
+    ),
+    Scenario("get_tickets", "get_tickets", lambda i: {"ids": list(range(i % 50 + 1, i % 50 + 21))}),
+    Scenario("create_ticket", "create_ticket", lambda i: {"name": f"Bench {i}", "content": "x"}),
+    Scenario(
+        "update_ticket",
+        "update_ticket",
+        lambda i: {"ticket_id": i % 100 + 1, "fields": {"status": 2}},
+    ),
+    Scenario(
+        "add_ticket_comment",
+        "add_ticket_comment",
+        lambda i: {"ticket_id": i % 100 + 1, "content": "bench"},
+    ),
+    Scenario(
+        "batch_updates",
+        "batch",
+        lambda i: {
+            "operations": [
+                {"tool": "update_ticket", "arguments": {"ticket_id": n, "fields": {"urgency": 3}}}
+                for n in range(1, 11)
+            ]
+        },
+        iterations=50,
+    ),
+    Scenario(
+        "bulk_update_tickets",
+        "bulk_update_tickets",
+        lambda i: {"ids": list(range(1, 201)), "fields": {"priority": 4}},
+        iterations=20,
+    ),
+]
+
+
+def configure_environment(url: str) -> None:
+    os.environ["GLPI_URL"] = url
+    os.environ.setdefault("GLPI_APP_TOKEN", "bench-app-token")
+    os.environ.setdefault("GLPI_USER_TOKEN", "bench-user-token")
+    from mcp_glpi.common.config import get_config
+
+    get_config.cache_clear()
+
+
+def _percentile(samples: Sequence[float], q: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_scenario(scenario: Scenario, concurrency: int, iterations: Optional[int] = None) -> Dict[str, Any]:
+    from glpi_client.utils import start_trace
+    from mcp_glpi.GLPiHandler import CommandHandler
+
+    total = iterations or scenario.iterations
+
+    def call(index: int) -> Dict[str, Any]:
+        with start_trace() as trace:
+            start = time.perf_counter()
+            response = CommandHandler(scenario.tool, scenario.arguments(index)).execute()
+            duration = time.perf_counter() - start
+        try:
+            ok = bool(json.loads(response[0].text).get("ok", True))
+        except (ValueError, AttributeError, IndexError):
+            ok = True
+        return {"duration": duration, "ok": ok, "round_trips": trace.round_trips}
+
+    call(-1)  # warm up imports, search option caches and the connection pool
+    if scenario.track_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        samples = list(executor.map(call, range(total)))
+    elapsed = time.perf_counter() - started
+    peak_memory = None
+    if scenario.track_memory:
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    durations = [sample["duration"] for sample in samples]
+    round_trips = [sample["round_trips"] for sample in samples]
+    return {
+        "tool": scenario.tool,
+        "calls": total,
+        "concurrency": concurrency,
+        "errors": sum(1 for sample in samples if not sample["ok"]),
+        "throughput_per_second": round(total / elapsed, 3) if elapsed else None,
+        "latency_seconds": {
+            "mean": round(statistics.fmean(durations), 6),
+            "p50": round(_percentile(durations, 0.50), 6),
+            "p95": round(_percentile(durations, 0.95), 6),
+            "p99": round(_percentile(durations, 0.99), 6),
+            "max": round(max(durations), 6),
+        },
+        "http_calls_per_call": {
+            "mean": round(statistics.fmean(round_trips), 3),
+            "max": max(round_trips),
+        },
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def run_benchmarks(
+    scenarios: Sequence[Scenario],
+    concurrency: int = 4,
+    iterations: Optional[int] = None,
+    latency: float = 0.0,
+    items: int = 2000,
+    payload_bytes: int = 256,
+    max_range: int = 1000,
+    replay: Optional[str] = None,
+    replay_latency_scale: Optional[float] = None,
+) -> Dict[str, Any]:
+    if replay:
+        results = _run_replayed(scenarios, concurrency, iterations, replay, replay_latency_scale)
+        server_meta: Dict[str, Any] = {"replay": replay, "latency_scale": replay_latency_scale}
+    else:
+        with FakeGLPIServer(
+            latency=latency, items=items, payload_bytes=payload_bytes, max_range=max_range
+        ) as server:
+            configure_environment(server.url)
+            results = {}
+            try:
+                for scenario in scenarios:
+                    server.reset_counts()
+                    results[scenario.name] = run_scenario(scenario, concurrency, iterations)
+                    results[scenario.name]["server_requests"] = server.request_counts()
+            finally:
+                _close_pooled_sessions()
+        server_meta = {
+            "latency": latency,
+            "items": items,
+            "payload_bytes": payload_bytes,
+            "max_range": max_range,
+        }
+    return {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "server": server_meta,
+        },
+        "scenarios": results,
+    }
+
+
+def _run_replayed(
+    scenarios: Sequence[Scenario],
+    concurrency: int,
+    iterations: Optional[int],
+    cassette: str,
+    latency_scale: Optional[float],
+) -> Dict[str, Any]:
+    from glpi_client.core import ReplayTransport, set_default_transport
+
+    transport = ReplayTransport(cassette, latency_scale=latency_scale)
+    configure_environment("http://glpi.replay")
+    set_default_transport(lambda: transport)
+    try:
+        return {
+            scenario.name: run_scenario(scenario, concurrency, iterations)
+            for scenario in scenarios
+        }
+    finally:
+        _close_pooled_sessions()
+        set_default_transport(None)
+
+
+def _close_pooled_sessions() -> None:
+    from mcp_glpi.glpi.pool import close_session_pool
+
+    close_session_pool()
+
+
+def compare_results(
+    results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.25
+) -> List[str]:
+    """Return a human readable line per metric that regressed beyond ``tolerance``.
+
+    HTTP calls per tool call are compared strictly: any extra round trip is a
+    regression regardless of the tolerance.
+    """
+
+    regressions: List[str] = []
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            continue
+        if current["http_calls_per_call"]["mean"] > previous["http_calls_per_call"]["mean"]:
+            regressions.append(
+                f"{name}: http_calls_per_call {previous['http_calls_per_call']['mean']}"
+                f" -> {current['http_calls_per_call']['mean']}"
+            )
+        for quantile in ("p50", "p99"):
+            before = previous["latency_seconds"][quantile]
+            after = current["latency_seconds"][quantile]
+            if before and after > before * (1 + tolerance):
+                regressions.append(f"{name}: latency {quantile} {before:.6f}s -> {after:.6f}s")
+        before = previous.get("throughput_per_second")
+        after = current.get("throughput_per_second")
+        if before and after is not None and after < before * (1 - tolerance):
+            regressions.append(f"{name}: throughput {before}/s -> {after}/s")
+        before = previous.get("peak_memory_bytes")
+        after = current.get("peak_memory_bytes")
+        if before and after and after > before * (1 + tolerance):
+            regressions.append(f"{name}: peak memory {before} -> {after} bytes")
+        if current["errors"] > previous["errors"]:
+            regressions.append(f"{name}: errors {previous['errors']} -> {current['errors']}")
+    return regressions
+
+
+def _summary_line(name: str, result: Dict[str, Any]) -> str:
+    latency = result["latency_seconds"]
+    line = (
+        f"{name:<22} {result['throughput_per_second']:>9.1f}/s"
+        f"  p50 {latency['p50'] * 1000:7.2f}ms  p99 {latency['p99'] * 1000:7.2f}ms"
+        f"  http/call {result['http_calls_per_call']['mean']:5.1f}"
+        f"  errors {result['errors']}"
+    )
+    if result["peak_memory_bytes"] is not None:
+        line += f"  peak {result['peak_memory_bytes'] / 1_048_576:.1f}MiB"
+    return line
+
+
+@click.command()
+@click.option("--scenario", "-s", "selected", multiple=True, help="Escenarios a ejecutar (todos por defecto)")
+@click.option("--iterations", "-n", type=int, default=None, help="Llamadas por escenario")
+@click.option("--concurrency", "-c", type=int, default=4, show_default=True)
+@click.option("--latency", type=float, default=0.0, show_default=True, help="Latencia simulada de GLPI (segundos)")
+@click.option("--items", type=int, default=2000, show_default=True, help="Tickets y cambios precargados")
+@click.option("--payload-bytes", type=int, default=256, show_default=True)
+@click.option("--max-range", type=int, default=1000, show_default=True, help="Accept-Range del servidor")
+@click.option("--replay", type=click.Path(exists=True, dir_okay=False), default=None, help="Cassette grabado a reproducir en lugar del servidor simulado")
+@click.option("--replay-latency-scale", type=float, default=None, help="Factor sobre la latencia grabada (1.0 = original)")
+@click.option("--output", "-o", type=click.Path(dir_okay=False), default=None, help="Archivo JSON de resultados")
+@click.option("--baseline", type=click.Path(dir_okay=False), default=str(DEFAULT_BASELINE), show_default=True)
+@click.option("--save-baseline", is_flag=True, help="Guardar los resultados como nueva linea base")
+@click.option("--tolerance", type=float, default=0.25, show_default=True)
+def main(
+    selected: Sequence[str],
+    iterations: Optional[int],
+    concurrency: int,
+    latency: float,
+    items: int,
+    payload_bytes: int,
+    max_range: int,
+    replay: Optional[str],
+    replay_latency_scale: Optional[float],
+    output: Optional[str],
+    baseline: str,
+    save_baseline: bool,
+    tolerance: float,
+) -> None:
+    """Ejecuta los benchmarks contra un servidor GLPI simulado."""
+
+    scenarios = [s for s in SCENARIOS if not selected or s.name in selected]
+    unknown = set(selected) - {s.name for s in SCENARIOS}
+    if unknown:
+        raise click.BadParameter(f"Escenarios desconocidos: {sorted(unknown)}", param_hint="--scenario")
+
+    results = run_benchmarks(
+        scenarios,
+        concurrency=concurrency,
+        iterations=iterations,
+        latency=latency,
+        items=items,
+        payload_bytes=payload_bytes,
+        max_range=max_range,
+        replay=replay,
+        replay_latency_scale=replay_latency_scale,
+    )
+    for name, result in results["scenarios"].items():
+        click.echo(_summary_line(name, result))
+
+    if output:
+        Path(output).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    baseline_path = Path(baseline)
+    if save_baseline:
+        baseline_path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        click.echo(f"Linea base guardada en {baseline_path}")
+        return
+    if not baseline_path.exists():
+        return
+    regressions = compare_results(
+        results, json.loads(baseline_path.read_text(encoding="utf-8")), tolerance
+    )
+    if regressions:
+        click.echo("Regresiones respecto a la linea base:", err=True)
+        for line in regressions:
+            click.echo(f"  {line}", err=True)
+        sys.exit(1)
+    click.echo("Sin regresiones respecto a la linea base")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,7 @@ __license__ = "MIT"
 
 # Import main classes for easy access
 from .core import RequestHandler
-from .exceptions import GLPIError, GLPIRequestError
+from .exceptions import GLPICancelledError, GLPIError, GLPIRequestError
 from .models import SortOrder, ResponseRange
 
 # Make these available at package level
@@ -25,6 +25,7 @@ __all__ = [
     'RequestHandler',
     'GLPIError', 
     'GLPIRequestError',
+    'GLPICancelledError',
     'SortOrder',
     'ResponseRange'
 ]
\ No newline at end of file
@@ -8,6 +8,15 @@ from .session import SessionManager
 from .items import ItemManager
 from .search import SearchManager
 from .documents import DocumentManager
+from .coalescer import WriteCoalescer
+from .token_store import SessionTokenStore, set_default_token_store
+from .transport import (
+    RecordingTransport,
+    ReplayTransport,
+    RequestsTransport,
+    Transport,
+    set_default_transport,
+)
 
 __all__ = [
     'RequestHandler',
@@ -15,5 +24,13 @@ __all__ = [
     'SessionManager', 
     'ItemManager',
     'SearchManager',
-    'DocumentManager'
+    'DocumentManager',
+    'WriteCoalescer',
+    'Transport',
+    'RequestsTransport',
+    'RecordingTransport',
+    'ReplayTransport',
+    'set_default_transport',
+    'SessionTokenStore',
+    'set_default_token_store',
 ]
\ No newline at end of file
@@ -5,6 +5,7 @@ Clase base para el manejo de requests HTTP.
 import inspect
 import json
 import logging
+import threading
 import time
 from typing import Dict, Optional, Any, List, Tuple, Union
 
@@ -12,6 +13,11 @@ import requests
 
 from ..exceptions import GLPIError, GLPIRequestError
 from ..models import ResponseRange
+from .transport import Transport, default_transport
+from ..utils.cancellation import check_cancelled
+from ..utils.metrics import http_metrics
+from ..utils.pacing import wait_for_turn
+from ..utils.tracing import TracedCall, current_retry_attempt, current_trace
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +35,7 @@ class BaseHTTPHandler:
         app_token: str,
         user_api_token: str,
         verify_tls: bool = True,
+        transport: Optional[Transport] = None,
     ):
         """Inicializar el handler HTTP.
         
@@ -42,6 +49,9 @@ class BaseHTTPHandler:
             Token de usuario API  
         verify_tls : bool, default True
             Si verificar certificados TLS
+        transport : Transport, optional
+            Transporte HTTP; por defecto el configurado con
+            :func:`~glpi_client.core.transport.set_default_transport`
         """
         # Validación de parámetros
         if not host_url or not isinstance(host_url, str):
@@ -57,8 +67,9 @@ class BaseHTTPHandler:
         self.user_api_token = user_api_token.strip()
         self.__session_token = None
         self.verify_tls = verify_tls
-        self.__session = None
-        self.__response_header = None
+        self.transport = transport if transport is not None else default_transport()
+        # Por hilo: un handler compartido puede listar en paralelo
+        self.__last_response = threading.local()
 
     @property
     def session_token(self) -> str:
@@ -83,7 +94,7 @@ class BaseHTTPHandler:
 
     @property
     def response_range(self) -> ResponseRange:
-        """Retorna el ResponseRange de la última llamada a la API.
+        """Retorna el ResponseRange de la última llamada a la API de este hilo.
 
         Returns
         -------
@@ -95,20 +106,21 @@ class BaseHTTPHandler:
         GLPIError
             Si no se ha hecho ningún request o no hay información de rango
         """
-        if self.__response_header is None:
+        response_header = getattr(self.__last_response, "headers", None)
+        if response_header is None:
             raise GLPIError("No request made")
         elif (
-            "Content-Range" not in self.__response_header
-            or "Accept-Range" not in self.__response_header
+            "Content-Range" not in response_header
+            or "Accept-Range" not in response_header
         ):
             raise GLPIError("The previous request did not return a range")
         else:
             import re
-            content_range = self.__response_header["Content-Range"]
+            content_range = response_header["Content-Range"]
             match = re.match(
                 r"(?P<start>\d+)-(?P<end>\d+)/(?P<count>\d+)", content_range
             )
-            s = self.__response_header["Accept-Range"].strip().split()[1]
+            s = response_header["Accept-Range"].strip().split()[1]
             accept_range = int(s)
             return ResponseRange(
                 int(match.group("start")),
@@ -144,18 +156,15 @@ class BaseHTTPHandler:
         logger.debug(f"Headers: {headers}")
         logger.debug(f"Parameters: {parameters}")
         
-        if self.__session is None:
-            self.__session = requests.Session()
-        
         start_time = time.time()
         try:
-            response = self.__session.get(
-                url, headers=headers, verify=self.verify_tls, params=parameters, data=data
+            response = self._request(
+                "get", action, headers=headers, params=parameters, data=data
             )
             duration = time.time() - start_time
             logger.debug(f"Request completed in {duration:.2f}s with status {response.status_code}")
             
-            self.__response_header = response.headers
+            self.__last_response.headers = response.headers
             if response.status_code >= 400:
                 logger.error(f"Request failed with status {response.status_code}: {response.text}")
                 raise GLPIRequestError(response)
@@ -178,21 +187,70 @@ class BaseHTTPHandler:
         if headers is None:
             headers = {}
         headers["Session-Token"] = self.session_token
-        url = self._get_method_url(api_method_url)
         headers = self._header_dict(headers)
-        if self.__session is None:
-            self.__session = requests.Session()
         logger.debug(
             f"Calling method {method} on {api_method_url} with {data=} and {headers=}"
         )
-        response = getattr(self.__session, method)(
-            url, headers=headers, verify=self.verify_tls, json=data, files=files
+        response = self._request(
+            method, api_method_url, headers=headers, json=data, files=files
         )
         if on_error_raise:
             if response.status_code >= 400:
                 raise GLPIRequestError(response)
         return response
 
+    def _request(self, method: str, action: str, **kwargs) -> requests.Response:
+        """Envía un request HTTP por el transporte y registra sus métricas.
+
+        Todos los requests hacia GLPI pasan por este método, que mide la
+        duración, el código de estado y los bytes transferidos por endpoint,
+        y los agrega a la traza activa (ver :func:`~glpi_client.utils.start_trace`).
+
+        Si la operación fue cancelada (ver
+        :func:`~glpi_client.utils.cancellation_scope`) lanza
+        :class:`~glpi_client.exceptions.GLPICancelledError` sin enviar nada.
+        Antes de enviarlo espera su turno si hay un regulador activo (ver
+        :func:`~glpi_client.utils.pacing_scope`).
+        """
+        if action != "killSession":
+            # Closing a session must neither wait nor fail while unwinding a
+            # cancellation
+            wait_for_turn()
+            check_cancelled()
+        url = self._get_method_url(action)
+        response = None
+        start_time = time.perf_counter()
+        try:
+            response = self.transport.send(
+                method, url, verify=self.verify_tls, **kwargs
+            )
+            return response
+        finally:
+            duration = time.perf_counter() - start_time
+            bytes_sent = 0
+            bytes_received = 0
+            if response is not None:
+                body = response.request.body if response.request is not None else None
+                bytes_sent = len(body) if body else 0
+                bytes_received = len(response.content or b"")
+            status_code = response.status_code if response is not None else None
+            http_metrics.record(
+                method, action, status_code, duration, bytes_sent, bytes_received
+            )
+            trace = current_trace()
+            if trace is not None:
+                trace.record(
+                    TracedCall(
+                        method=method.upper(),
+                        endpoint=action,
+                        status_code=status_code,
+                        duration=duration,
+                        bytes_sent=bytes_sent,
+                        bytes_received=bytes_received,
+                        retry=current_retry_attempt(),
+                    )
+                )
+
     def _get_json(
         self,
         method: str,
@@ -2,8 +2,11 @@
 RequestHandler principal que combina toda la funcionalidad.
 """
 
+from typing import Optional
+
 from .search import SearchManager
 from .documents import DocumentManager
+from .transport import Transport
 
 
 class RequestHandler(SearchManager, DocumentManager):
@@ -23,6 +26,8 @@ class RequestHandler(SearchManager, DocumentManager):
     verify_tls : bool, default True
         Si tu servidor GLPI está usando TLS con un certificado malo,
         necesitarás establecer esto en False.
+    transport : Transport, optional
+        Transporte HTTP a usar (por ejemplo ``ReplayTransport``).
 
     Examples
     --------
@@ -38,7 +43,8 @@ class RequestHandler(SearchManager, DocumentManager):
         app_token: str,
         user_api_token: str,
         verify_tls: bool = True,
+        transport: Optional[Transport] = None,
     ):
         """Crea una nueva instancia de RequestHandler."""
         # Llamar al __init__ de las clases padre
-        super().__init__(host_url, app_token, user_api_token, verify_tls)
\ No newline at end of file
+        super().__init__(host_url, app_token, user_api_token, verify_tls, transport)
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""
+Agrupación de inserciones concurrentes en requests POST con arrays.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from ..utils.cancellation import cancellation_shield
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingBatch:
+    """Lote abierto de inserciones de un mismo itemtype."""
+
+    def __init__(self):
+        self.entries: List[Dict[str, Any]] = []
+        self.ready = threading.Event()
+        self.done = threading.Event()
+        self.response: Optional[List[Any]] = None
+        self.error: Optional[BaseException] = None
+
+
+class WriteCoalescer:
+    """Combina inserciones del mismo itemtype en un único POST.
+
+    El primer llamador de un lote actúa como líder: espera hasta ``window``
+    segundos (o hasta reunir ``max_batch`` ítems), envía todos los ítems
+    acumulados con una sola llamada a ``send`` y reparte a cada llamador la
+    porción de la respuesta que le corresponde.
+
+    Parameters
+    ----------
+    send : Callable[[str, List[Dict[str, Any]]], Any]
+        Función que envía el lote, normalmente ``ItemManager.add_items``
+    window : float, default 0.005
+        Tiempo máximo de espera en segundos antes de enviar un lote
+    max_batch : int, default 50
+        Cantidad de ítems que provoca el envío inmediato del lote
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, List[Dict[str, Any]]], Any],
+        window: float = 0.005,
+        max_batch: int = 50,
+    ):
+        self._send = send
+        self.window = max(0.0, window)
+        self.max_batch = max(1, max_batch)
+        self._lock = threading.Lock()
+        self._open: Dict[str, _PendingBatch] = {}
+
+    def add(
+        self, item_type: str, data: Union[Dict[str, Any], List[Dict[str, Any]]]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Agrega uno o varios ítems y espera la respuesta de su lote.
+
+        Returns
+        -------
+        Dict[str, Any] | List[Dict[str, Any]]
+            La misma forma que retornaría ``add_items`` para ``data``
+        """
+        single = not isinstance(data, list)
+        entries = [data] if single else list(data)
+        with self._lock:
+            batch = self._open.get(item_type)
+            leader = batch is None
+            if leader:
+                batch = _PendingBatch()
+                self._open[item_type] = batch
+            start = len(batch.entries)
+            batch.entries.extend(entries)
+            if len(batch.entries) >= self.max_batch:
+                self._open.pop(item_type, None)
+                batch.ready.set()
+
+        if leader:
+            batch.ready.wait(self.window)
+            with self._lock:
+                if self._open.get(item_type) is batch:
+                    del self._open[item_type]
+            self._flush(item_type, batch)
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+        result = batch.response[start:start + len(entries)]
+        return result[0] if single else result
+
+    def flush(self) -> None:
+        """Libera inmediatamente todos los lotes abiertos."""
+        with self._lock:
+            pending = list(self._open.values())
+        for batch in pending:
+            batch.ready.set()
+
+    def _flush(self, item_type: str, batch: _PendingBatch) -> None:
+        """Envía el lote y despierta a los llamadores en espera."""
+        try:
+            # The batch carries other callers' items: a cancelled leader
+            # must still send it
+            with cancellation_shield():
+                response = self._send(item_type, batch.entries)
+            if not isinstance(response, list):
+                response = [response]
+            if len(response) != len(batch.entries):
+                raise ValueError(
+                    f"Expected {len(batch.entries)} results for {item_type},"
+                    f" got {len(response)}"
+                )
+            batch.response = response
+            logger.debug(f"Coalesced {len(batch.entries)} {item_type} inserts")
+        except BaseException as err:
+            batch.error = err
+        finally:
+            batch.done.set()
@@ -21,18 +21,14 @@ class DocumentManager(SessionManager):
         """Sube un documento a GLPI."""
         manifest = json.dumps({"input": {"name": name, "_filename": [file_name]}})
 
-        url = self._get_method_url("Document/")
         headers = self._header_dict({"Session-Token": self.session_token})
-        if self._BaseHTTPHandler__session is None:
-            import requests
-            self._BaseHTTPHandler__session = requests.Session()
         if file_name is None:
             file_name = file.name
         del headers["Content-Type"]
-        r = self._BaseHTTPHandler__session.post(
-            url,
+        r = self._request(
+            "post",
+            "Document/",
             headers=headers,
-            verify=self.verify_tls,
             files={"filename[0]": (file_name, file)},
             data={"uploadManifest": manifest},
         )
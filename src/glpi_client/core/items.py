@@ -3,13 +3,16 @@ Operaciones CRUD para ítems de GLPI.
 """
 
 import logging
-from typing import Dict, Any, List, Union, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Callable, Dict, Any, List, Union, Tuple, Optional
 
 import requests
+from .coalescer import WriteCoalescer
 from .session import SessionManager
-from ..exceptions import GLPIError
+from ..exceptions import GLPIError, GLPIRequestError
 from ..models import SortOrder
-from ..utils import add_criteria_to_parameters
+from ..utils import ProgressCounter, add_criteria_to_parameters, report_progress
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +20,8 @@ logger = logging.getLogger(__name__)
 class ItemManager(SessionManager):
     """Maneja las operaciones CRUD de ítems en GLPI."""
 
+    _write_coalescer: Optional[WriteCoalescer] = None
+
     def get_item(
         self,
         item_type: str,
@@ -82,6 +87,55 @@ class ItemManager(SessionManager):
                 request_parameters.append((f"searchText[{name}]", filter_by[name]))
         return self._get_json(f"{item_type}/", parameters=request_parameters)
 
+    def get_many_items_paged(
+        self, item_type: str, start: int, limit: int, **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Retorna ``limit`` ítems desde ``start`` aunque excedan una página.
+
+        GLPI recorta cada respuesta al máximo de su ``Accept-Range``; este
+        método pide las páginas siguientes hasta completar ``limit`` o el
+        total informado en ``Content-Range``, y reporta el avance de cada
+        página (ver :func:`~glpi_client.utils.progress_scope`). Al terminar,
+        :attr:`response_range` describe la última página recibida.
+
+        Parameters
+        ----------
+        item_type : str
+            El itemtype a listar
+        start : int
+            Índice del primer ítem
+        limit : int
+            Cantidad máxima de ítems a retornar
+        **kwargs
+            Demás argumentos de :meth:`get_many_items` (salvo ``range_``)
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Los ítems de todas las páginas, en orden
+        """
+        first, last = start, start + limit - 1
+        items: List[Dict[str, Any]] = []
+        pages = 0
+        while True:
+            page = self.get_many_items(item_type, range_=(start, last), **kwargs)
+            items.extend(page)
+            pages += 1
+            try:
+                response_range = self.response_range
+            except GLPIError:
+                break
+            wanted = min(limit, max(response_range.count - first, 0))
+            report_progress(
+                len(items),
+                wanted,
+                f"Fetched page {pages} ({len(items)}/{wanted} rows)",
+            )
+            if not page or response_range.end >= min(last, response_range.count - 1):
+                break
+            start = response_range.end + 1
+        return items
+
     def get_sub_items(
         self,
         item_type: str,
@@ -125,6 +179,164 @@ class ItemManager(SessionManager):
         response = self._do_method("patch", f"{item_type}", data={"input": data})
         return response.json()
 
+    def enable_write_coalescing(self, window: float = 0.005, max_batch: int = 50) -> None:
+        """Agrupa en un único POST las inserciones concurrentes del mismo itemtype.
+
+        Parameters
+        ----------
+        window : float, default 0.005
+            Segundos que se espera a otras inserciones antes de enviar
+        max_batch : int, default 50
+            Cantidad de ítems que dispara el envío inmediato
+        """
+        self._write_coalescer = WriteCoalescer(self.add_items, window, max_batch)
+
+    def flush_writes(self) -> None:
+        """Envía de inmediato las inserciones agrupadas pendientes."""
+        if self._write_coalescer is not None:
+            self._write_coalescer.flush()
+
+    def disable_write_coalescing(self) -> None:
+        """Envía las inserciones pendientes y vuelve a un POST por llamada."""
+        try:
+            self.flush_writes()
+        finally:
+            self._write_coalescer = None
+
+    def add_items_coalesced(
+        self, item_type: str, data: Union[Dict[str, Any], List[Dict[str, Any]]]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Agrega ítems compartiendo el POST con otras inserciones concurrentes.
+
+        Sin agrupación habilitada se comporta igual que :meth:`add_items`.
+        """
+        if self._write_coalescer is None:
+            return self.add_items(item_type, data)
+        return self._write_coalescer.add(item_type, data)
+
+    def add_items_chunked(
+        self,
+        item_type: str,
+        data: List[Dict[str, Any]],
+        chunk_size: int = 25,
+        max_workers: int = 4,
+    ) -> List[Dict[str, Any]]:
+        """Agrega muchos ítems con POST por bloques enviados en paralelo.
+
+        Parameters
+        ----------
+        item_type : str
+            El itemtype a crear
+        data : List[Dict[str, Any]]
+            Payloads a enviar como ``input``
+        chunk_size : int, default 25
+            Cantidad de ítems por request POST
+        max_workers : int, default 4
+            Requests simultáneos
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Un resultado ``{"id", "ok", "message"}`` por payload, en el mismo
+            orden de ``data``; ``id`` es el identificador creado o None.
+        """
+        def send(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            response = self.add_items(item_type, chunk)
+            if not isinstance(response, list):
+                response = [response]
+            outcomes = []
+            for index in range(len(chunk)):
+                entry = response[index] if index < len(response) else {}
+                if not isinstance(entry, dict):
+                    outcomes.append({"id": None, "ok": False, "message": str(entry)})
+                    continue
+                id_ = entry.get("id")
+                ok = not isinstance(id_, bool) and str(id_).isdigit() and int(id_) > 0
+                outcomes.append(
+                    {
+                        "id": int(id_) if ok else None,
+                        "ok": ok,
+                        "message": entry.get("message", ""),
+                    }
+                )
+            return outcomes
+
+        return self._send_chunked(data, send, chunk_size, max_workers)
+
+    def update_items_chunked(
+        self,
+        item_type: str,
+        data: List[Dict[str, Any]],
+        chunk_size: int = 50,
+        max_workers: int = 4,
+    ) -> List[Dict[str, Any]]:
+        """Actualiza muchos ítems con PATCH por bloques enviados en paralelo.
+
+        Parameters
+        ----------
+        item_type : str
+            El itemtype a actualizar
+        data : List[Dict[str, Any]]
+            Payloads a enviar; cada uno debe incluir su ``id``
+        chunk_size : int, default 50
+            Cantidad de ítems por request PATCH
+        max_workers : int, default 4
+            Requests simultáneos
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Un resultado ``{"id", "ok", "message"}`` por payload, en el mismo
+            orden de ``data``. Un bloque rechazado marca todos sus ítems como
+            fallidos con el mensaje del error.
+        """
+        def send(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            response = self.update_items(item_type, chunk)
+            if not isinstance(response, list):
+                response = [response]
+            outcomes = []
+            for index, payload in enumerate(chunk):
+                entry = response[index] if index < len(response) else {}
+                id_ = payload.get("id")
+                ok = bool(entry.get(str(id_))) if isinstance(entry, dict) else False
+                message = entry.get("message", "") if isinstance(entry, dict) else str(entry)
+                outcomes.append({"id": id_, "ok": ok, "message": message})
+            return outcomes
+
+        return self._send_chunked(data, send, chunk_size, max_workers)
+
+    def _send_chunked(
+        self,
+        data: List[Dict[str, Any]],
+        send: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+        chunk_size: int,
+        max_workers: int,
+    ) -> List[Dict[str, Any]]:
+        """Envía ``data`` en bloques concurrentes y aplana los resultados en orden."""
+        chunk_size = max(1, chunk_size)
+        chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+        counter = ProgressCounter(len(data))
+
+        def guarded(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            try:
+                outcomes = send(chunk)
+            except GLPIRequestError as err:
+                logger.warning(f"Chunk of {len(chunk)} items failed: {err!r}")
+                outcomes = [
+                    {"id": payload.get("id"), "ok": False, "message": err.error_message}
+                    for payload in chunk
+                ]
+            counter.add(len(chunk))
+            return outcomes
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [
+                executor.submit(copy_context().run, guarded, chunk) for chunk in chunks
+            ]
+            results = [future.result() for future in futures]
+        return [outcome for chunk_outcomes in results for outcome in chunk_outcomes]
+
     def delete_items(
         self, item_type: str, ids: List[int], purge=False, log=True
     ) -> List[Dict[str, Any]]:
@@ -156,6 +368,14 @@ class ItemManager(SessionManager):
         }
         return self.add_items("Ticket", ticket_data)
 
+    def create_tickets(
+        self, tickets: List[Dict[str, Any]], chunk_size: int = 25, max_workers: int = 4
+    ) -> List[Dict[str, Any]]:
+        """Método de conveniencia para crear muchos tickets por bloques."""
+        return self.add_items_chunked(
+            "Ticket", tickets, chunk_size=chunk_size, max_workers=max_workers
+        )
+
     def get_all_changes(self, **kwargs) -> List[Dict[str, Any]]:
         """Método de conveniencia para obtener todos los cambios."""
         return self.get_many_items("Change", **kwargs)
@@ -3,14 +3,20 @@ Operaciones de búsqueda en GLPI.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from typing import Dict, Any, List, Optional, Tuple
 
 from .items import ItemManager
+from ..exceptions import GLPIRequestError
 from ..models import SortOrder
-from ..utils import add_criteria_to_parameters
+from ..utils import ProgressCounter, add_criteria_to_parameters
 
 logger = logging.getLogger(__name__)
 
+# Opción de búsqueda estándar del campo ``id`` en los itemtypes de GLPI
+ID_SEARCH_OPTION = 2
+
 
 class SearchManager(ItemManager):
     """Maneja las operaciones de búsqueda en GLPI."""
@@ -93,4 +99,118 @@ class SearchManager(ItemManager):
             "searchtype": "equals" if exact_match else "contains",
             "value": search_value
         }]
-        return self.search_items(item_type, filters=filters)
\ No newline at end of file
+        return self.search_items(item_type, filters=filters)
+
+    def get_items_by_ids(
+        self,
+        item_type: str,
+        ids: List[int],
+        fields: List[int] = None,
+        chunk_size: int = 25,
+        search_threshold: int = 200,
+        max_workers: int = 8,
+    ) -> Dict[str, Any]:
+        """Retorna varios ítems identificados por id en el orden solicitado.
+
+        Los conjuntos pequeños se resuelven con ``search_items`` usando
+        criterios OR sobre el campo id, en bloques de ``chunk_size`` para no
+        exceder el límite de longitud de la URL. Los conjuntos mayores que
+        ``search_threshold`` usan ``get_item`` con concurrencia acotada.
+
+        Parameters
+        ----------
+        item_type : str
+            El itemtype a consultar (por ejemplo ``Ticket``)
+        ids : List[int]
+            Identificadores solicitados; los duplicados se ignoran
+        fields : List[int], optional
+            Opciones de búsqueda a forzar en la respuesta (``forcedisplay``)
+        chunk_size : int, default 25
+            Cantidad de ids por request de búsqueda
+        search_threshold : int, default 200
+            Cantidad máxima de ids resueltos mediante búsqueda
+        max_workers : int, default 8
+            Requests ``get_item`` simultáneos en el modo concurrente
+
+        Returns
+        -------
+        Dict[str, Any]
+            ``items`` con los ítems encontrados en el orden de ``ids`` y
+            ``missing`` con los ids que GLPI no devolvió
+        """
+        ordered_ids = list(dict.fromkeys(int(id_) for id_ in ids))
+        if not ordered_ids:
+            return {"items": [], "missing": []}
+
+        if len(ordered_ids) > search_threshold:
+            found = self._get_items_concurrently(item_type, ordered_ids, max_workers)
+        else:
+            found = {}
+            counter = ProgressCounter(len(ordered_ids))
+            for start in range(0, len(ordered_ids), chunk_size):
+                chunk = ordered_ids[start:start + chunk_size]
+                found.update(self._search_items_by_ids(item_type, chunk, fields))
+                counter.add(len(chunk))
+
+        return {
+            "items": [found[id_] for id_ in ordered_ids if id_ in found],
+            "missing": [id_ for id_ in ordered_ids if id_ not in found],
+        }
+
+    def _search_items_by_ids(
+        self, item_type: str, ids: List[int], fields: Optional[List[int]]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Busca un bloque de ids con un único request de búsqueda."""
+        filters = [
+            {
+                "link": "OR",
+                "field": ID_SEARCH_OPTION,
+                "searchtype": "equals",
+                "value": id_,
+            }
+            for id_ in ids
+        ]
+        force_display = [ID_SEARCH_OPTION]
+        for option in fields or []:
+            if option not in force_display:
+                force_display.append(option)
+        json_data = self.search_items(
+            item_type,
+            filters=filters,
+            range_=(0, len(ids) - 1),
+            force_display=force_display,
+            uid_cols=True,
+        )
+        prefix = f"{item_type}."
+        found: Dict[int, Dict[str, Any]] = {}
+        for row in json_data.get("data", []):
+            item = {
+                (key[len(prefix):] if key.startswith(prefix) else key): value
+                for key, value in row.items()
+            }
+            try:
+                found[int(item["id"])] = item
+            except (KeyError, TypeError, ValueError):
+                logger.debug(f"Ignoring search row without id: {row}")
+        return found
+
+    def _get_items_concurrently(
+        self, item_type: str, ids: List[int], max_workers: int
+    ) -> Dict[int, Dict[str, Any]]:
+        """Obtiene cada id con ``get_item`` usando un pool de hilos acotado."""
+        counter = ProgressCounter(len(ids))
+
+        def fetch(id_: int) -> Optional[Dict[str, Any]]:
+            try:
+                item = self.get_item(item_type, id_)
+            except GLPIRequestError as err:
+                if err.error_code != 404:
+                    raise
+                item = None
+            counter.add(1)
+            return item
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [executor.submit(copy_context().run, fetch, id_) for id_ in ids]
+            results = [future.result() for future in futures]
+        return {id_: item for id_, item in zip(ids, results) if item is not None}
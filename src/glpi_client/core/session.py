@@ -7,6 +7,7 @@ from json import JSONDecodeError
 from typing import List, Dict, Any, Optional
 
 from .base import BaseHTTPHandler
+from .token_store import SessionTokenStore, default_token_store
 from ..exceptions import GLPIError, GLPIRequestError
 from ..utils import retry_on_failure
 
@@ -16,16 +17,69 @@ logger = logging.getLogger(__name__)
 class SessionManager(BaseHTTPHandler):
     """Maneja las operaciones de sesión con GLPI."""
 
+    _token_store: Optional[SessionTokenStore] = None
+    # Token tomado del almacén y todavía no validado por ningún request
+    _session_restored = False
+    # El token es el guardado en el almacén: al salir se conserva
+    _session_persisted = False
+    _context_changed = False
+
     @retry_on_failure(max_retries=3, delay=1.0)
     def init_session(self):
-        """Solicita un session_token para ser usado por otros métodos."""
+        """Solicita un session_token para ser usado por otros métodos.
+
+        Con un almacén configurado (ver
+        :func:`~glpi_client.core.token_store.set_default_token_store`) reutiliza
+        antes el token guardado de una ejecución anterior. Ese token se valida
+        con el primer request: si GLPI ya lo expiró se inicia una sesión nueva
+        y se reintenta ese request.
+        """
         if self._BaseHTTPHandler__session_token is not None:
             raise GLPIError("Session already initialized.")
+        store = self._token_store = default_token_store()
+        self._context_changed = False
+        credentials = (self.host_url, self.app_token, self.user_api_token)
+        if store is not None:
+            token = store.claim(*credentials)
+            if token is not None:
+                self._BaseHTTPHandler__session_token = token
+                self._session_restored = self._session_persisted = True
+                logger.info("Session restored from the session store")
+                return
         auth = f"user_token {self.user_api_token}"
         r = self._do_get("initSession", {"Authorization": auth})
-        self._BaseHTTPHandler__session_token = r.json()["session_token"]
+        token = r.json()["session_token"]
+        self._BaseHTTPHandler__session_token = token
+        self._session_restored = False
+        self._session_persisted = store is not None and store.offer(*credentials, token)
         logger.info("Session initiated successfully")
 
+    def _request(self, method: str, action: str, **kwargs):
+        response = super()._request(method, action, **kwargs)
+        if not self._session_restored or action in ("initSession", "killSession"):
+            return response
+        self._session_restored = False
+        if response.status_code != 401 or "files" in kwargs:
+            return response
+
+        logger.info("Stored session expired; starting a new session")
+        self._forget_stored_session(discard=True)
+        self._BaseHTTPHandler__session_token = None
+        self.init_session()
+        headers = dict(kwargs.get("headers") or {})
+        headers["Session-Token"] = self.session_token
+        kwargs["headers"] = headers
+        return super()._request(method, action, **kwargs)
+
+    def _forget_stored_session(self, discard: bool) -> None:
+        if self._session_persisted and self._token_store is not None:
+            credentials = (self.host_url, self.app_token, self.user_api_token)
+            if discard:
+                self._token_store.discard(*credentials)
+            else:
+                self._token_store.release(*credentials)
+        self._session_persisted = False
+
     def kill_session(self, session_id: Optional[str] = None):
         """Destruye una sesión identificada por un session_token."""
         if session_id is None:
@@ -36,6 +90,7 @@ class SessionManager(BaseHTTPHandler):
             else:
                 session_id = self._BaseHTTPHandler__session_token
                 self._BaseHTTPHandler__session_token = None
+                self._forget_stored_session(discard=True)
 
         try:
             self._do_get("killSession", {"Session-Token": session_id})
@@ -63,7 +118,16 @@ class SessionManager(BaseHTTPHandler):
             raise
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
+        """Context manager exit.
+
+        Una sesión guardada en el almacén no se destruye para que la próxima
+        ejecución la reutilice, salvo que se le haya cambiado el perfil o la
+        entidad activa.
+        """
+        if self._session_persisted and not self._context_changed:
+            self._forget_stored_session(discard=False)
+            self._BaseHTTPHandler__session_token = None
+            return False
         try:
             self.kill_session()
         except Exception as e:
@@ -90,6 +154,7 @@ class SessionManager(BaseHTTPHandler):
         )
         if r.status_code == 404:
             raise GLPIError("Profile not found")
+        self._context_changed = True
 
     def get_my_entities(self, recursive: bool = False) -> List[Dict[str, Any]]:
         """Retorna todas las entidades del usuario actual."""
@@ -111,6 +176,7 @@ class SessionManager(BaseHTTPHandler):
         )
         if r.status_code == 400:
             raise GLPIError(r.json()[1])
+        self._context_changed = True
 
     def get_full_session(self) -> Dict[str, Any]:
         """Retorna la sesión PHP completa."""
@@ -0,0 +1,199 @@
+"""
+Persistencia cifrada de session tokens entre reinicios del proceso.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # pragma: no cover - dependencia opcional
+    Fernet = None
+    InvalidToken = Exception
+
+logger = logging.getLogger(__name__)
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (OSError, ValueError):
+        # Sin permisos (o sin señales en Windows): asumir que sigue vivo
+        return True
+    return True
+
+
+class SessionTokenStore:
+    """Guarda en disco los session tokens para reutilizarlos al reiniciar.
+
+    Cada entrada se identifica por una huella de la URL y los tokens de
+    aplicación y usuario, y el session token se cifra con una clave
+    derivada de esos mismos tokens (más ``secret``, si se indica). El
+    archivo por sí solo no permite usar las sesiones guardadas.
+
+    Un token restaurado lo usa un solo handler a la vez, también entre
+    procesos: la entrada registra el PID que la tiene tomada.
+
+    Parameters
+    ----------
+    path : str
+        Archivo JSON donde se guardan las sesiones
+    secret : str, optional
+        Secreto adicional mezclado en la clave de cifrado
+
+    Raises
+    ------
+    ImportError
+        Si el paquete ``cryptography`` no está instalado
+    """
+
+    def __init__(self, path: str, secret: str = ""):
+        if Fernet is None:
+            raise ImportError(
+                "SessionTokenStore requires the 'cryptography' package"
+            )
+        self.path = path
+        self._secret = secret
+        self._lock = threading.Lock()
+
+    def fingerprint(self, host_url: str, app_token: str, user_token: str) -> str:
+        """Retorna la huella que identifica las sesiones de unas credenciales."""
+        return self._digest(b"fingerprint", host_url, app_token, user_token).hex()
+
+    def _digest(self, purpose: bytes, *parts: str) -> bytes:
+        material = b"\0".join([purpose, self._secret.encode("utf-8")])
+        material += b"\0" + "\0".join(parts).encode("utf-8")
+        return hashlib.sha256(material).digest()
+
+    def _cipher(self, host_url: str, app_token: str, user_token: str):
+        key = self._digest(b"key", host_url, app_token, user_token)
+        return Fernet(base64.urlsafe_b64encode(key))
+
+    def claim(self, host_url: str, app_token: str, user_token: str) -> Optional[str]:
+        """Toma el session token guardado para estas credenciales.
+
+        Returns
+        -------
+        str | None
+            El token, o None si no hay uno guardado o otro handler lo usa
+        """
+        fingerprint = self.fingerprint(host_url, app_token, user_token)
+        with self._lock:
+            entries = self._read()
+            entry = entries.get(fingerprint)
+            if entry is None:
+                return None
+            owner = entry.get("owner")
+            if owner is not None and _pid_alive(owner):
+                return None
+            try:
+                token = self._cipher(host_url, app_token, user_token).decrypt(
+                    entry["token"].encode("ascii")
+                ).decode("utf-8")
+            except (InvalidToken, KeyError, ValueError):
+                logger.warning("Discarding unreadable stored GLPI session")
+                del entries[fingerprint]
+                self._write(entries)
+                return None
+            entry["owner"] = os.getpid()
+            self._write(entries)
+        return token
+
+    def offer(self, host_url: str, app_token: str, user_token: str, token: str) -> bool:
+        """Guarda un token nuevo si no hay otro guardado para estas credenciales.
+
+        Returns
+        -------
+        bool
+            True si el token quedó guardado y tomado por este proceso
+        """
+        fingerprint = self.fingerprint(host_url, app_token, user_token)
+        encrypted = self._cipher(host_url, app_token, user_token).encrypt(
+            token.encode("utf-8")
+        )
+        with self._lock:
+            entries = self._read()
+            if fingerprint in entries:
+                return False
+            entries[fingerprint] = {
+                "token": encrypted.decode("ascii"),
+                "owner": os.getpid(),
+            }
+            self._write(entries)
+        return True
+
+    def release(self, host_url: str, app_token: str, user_token: str) -> None:
+        """Deja el token guardado disponible para el próximo handler."""
+        self._update(host_url, app_token, user_token, discard=False)
+
+    def discard(self, host_url: str, app_token: str, user_token: str) -> None:
+        """Elimina el token guardado (por ejemplo, porque GLPI lo expiró)."""
+        self._update(host_url, app_token, user_token, discard=True)
+
+    def _update(self, host_url: str, app_token: str, user_token: str, discard: bool) -> None:
+        fingerprint = self.fingerprint(host_url, app_token, user_token)
+        with self._lock:
+            entries = self._read()
+            entry = entries.get(fingerprint)
+            if entry is None:
+                return
+            if discard:
+                del entries[fingerprint]
+            else:
+                entry["owner"] = None
+            self._write(entries)
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                entries = json.load(handle)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable session store %s", self.path)
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _write(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".glpi-sessions-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entries, handle)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+_default_store: Optional[SessionTokenStore] = None
+
+
+def set_default_token_store(store: Optional[SessionTokenStore]) -> None:
+    """Define el almacén que consultan los handlers antes de ``initSession``.
+
+    Parameters
+    ----------
+    store : SessionTokenStore | None
+        Almacén a usar; None deshabilita la persistencia
+    """
+    global _default_store
+    _default_store = store
+
+
+def default_token_store() -> Optional[SessionTokenStore]:
+    """Retorna el almacén de sesiones configurado, si hay uno."""
+    return _default_store
@@ -0,0 +1,282 @@
+"""
+Transportes HTTP intercambiables para el handler de GLPI.
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Callable, Deque, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ..exceptions import GLPIError
+
+logger = logging.getLogger(__name__)
+
+SCRUBBED_VALUE = "***"
+# Claves JSON cuyo valor nunca se guarda en un cassette
+SCRUBBED_KEYS = frozenset(
+    {
+        "session_token",
+        "app_token",
+        "user_token",
+        "api_token",
+        "personal_token",
+        "password",
+        "cookie_token",
+        "valid_id",
+    }
+)
+# Headers de respuesta que se conservan al grabar
+RECORDED_HEADERS = ("Content-Type", "Content-Range", "Accept-Range")
+
+
+class Transport:
+    """Interfaz de los transportes usados por ``BaseHTTPHandler._request``."""
+
+    def send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Envía un request y retorna la respuesta.
+
+        Parameters
+        ----------
+        method : str
+            Método HTTP en minúsculas (``get``, ``post``...)
+        url : str
+            URL completa del endpoint
+        **kwargs
+            Argumentos aceptados por ``requests.Session.request``
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Libera los recursos del transporte."""
+
+
+class RequestsTransport(Transport):
+    """Transporte por defecto basado en ``requests.Session``.
+
+    Parameters
+    ----------
+    session : requests.Session, optional
+        Sesión a usar; se crea una al primer request si no se indica
+    """
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        self._session = session
+
+    def send(self, method: str, url: str, **kwargs) -> requests.Response:
+        if self._session is None:
+            self._session = requests.Session()
+        return getattr(self._session, method)(url, **kwargs)
+
+    def close(self) -> None:
+        if self._session is not None and hasattr(self._session, "close"):
+            self._session.close()
+
+
+class RecordingTransport(Transport):
+    """Envía los requests con otro transporte y los graba en un cassette.
+
+    Cada interacción se agrega como una línea JSON (comprimida con gzip si
+    la ruta termina en ``.gz``). No se guardan headers de request; los
+    valores de :data:`SCRUBBED_KEYS` se reemplazan en las respuestas JSON.
+
+    Parameters
+    ----------
+    path : str
+        Ruta del cassette; las interacciones se agregan al final
+    inner : Transport, optional
+        Transporte real, por defecto :class:`RequestsTransport`
+    scrub_keys : Iterable[str], optional
+        Claves adicionales a ocultar en las respuestas
+    """
+
+    def __init__(
+        self,
+        path: str,
+        inner: Optional[Transport] = None,
+        scrub_keys: Iterable[str] = (),
+    ):
+        self.path = path
+        self.inner = inner if inner is not None else RequestsTransport()
+        self.scrub_keys = SCRUBBED_KEYS | frozenset(scrub_keys)
+        self._lock = threading.Lock()
+
+    def send(self, method: str, url: str, **kwargs) -> requests.Response:
+        start = time.perf_counter()
+        response = self.inner.send(method, url, **kwargs)
+        duration = time.perf_counter() - start
+        request = response.request
+        interaction = {
+            "method": method.upper(),
+            "path": _api_path(request.url if request is not None else url),
+            "body_sha1": _body_digest(request.body if request is not None else None),
+            "status": response.status_code,
+            "headers": {
+                name: response.headers[name]
+                for name in RECORDED_HEADERS
+                if name in response.headers
+            },
+            "duration": round(duration, 6),
+            **_encode_body(response.content, self.scrub_keys),
+        }
+        line = json.dumps(interaction, separators=(",", ":")) + "\n"
+        with self._lock:
+            with _open_cassette(self.path, "a") as handle:
+                handle.write(line)
+        return response
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class ReplayTransport(Transport):
+    """Sirve respuestas grabadas por :class:`RecordingTransport`.
+
+    Las interacciones se buscan por método, ruta con query string y hash
+    del cuerpo; si no hay coincidencia exacta se usa la primera grabada
+    para el mismo método y ruta sin query. Las respuestas de una misma
+    clave se entregan en el orden grabado y, al agotarse, se repiten
+    cíclicamente (o se lanza ``GLPIError`` con ``strict=True``).
+
+    Parameters
+    ----------
+    path : str
+        Ruta del cassette
+    latency_scale : float, optional
+        Factor aplicado a la duración grabada de cada respuesta; None no
+        agrega latencia y 1.0 reproduce la latencia original
+    strict : bool, default False
+        Fallar en lugar de repetir respuestas ya entregadas
+    """
+
+    def __init__(
+        self, path: str, latency_scale: Optional[float] = None, strict: bool = False
+    ):
+        self.path = path
+        self.latency_scale = latency_scale
+        self.strict = strict
+        self._lock = threading.Lock()
+        self._exact: Dict[Tuple[str, str, Optional[str]], Deque[Dict[str, Any]]] = (
+            defaultdict(deque)
+        )
+        self._by_path: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = defaultdict(deque)
+        with _open_cassette(path, "r") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                interaction = json.loads(line)
+                path_only = interaction["path"].split("?", 1)[0]
+                self._exact[
+                    (interaction["method"], interaction["path"], interaction["body_sha1"])
+                ].append(interaction)
+                self._by_path[(interaction["method"], path_only)].append(interaction)
+        logger.info(f"Loaded {sum(len(q) for q in self._exact.values())} interactions from {path}")
+
+    def send(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.pop("verify", None)
+        prepared = requests.Request(method.upper(), url, **kwargs).prepare()
+        path = _api_path(prepared.url)
+        key = (prepared.method, path, _body_digest(prepared.body))
+        with self._lock:
+            queue = self._exact.get(key) or self._by_path.get(
+                (prepared.method, path.split("?", 1)[0])
+            )
+            if not queue:
+                raise GLPIError(f"No recorded interaction for {prepared.method} {path}")
+            interaction = queue.popleft()
+            if not self.strict:
+                queue.append(interaction)
+        if self.latency_scale:
+            time.sleep(interaction.get("duration", 0.0) * self.latency_scale)
+        return _build_response(prepared, interaction)
+
+
+_default_factory: Callable[[], Transport] = RequestsTransport
+
+
+def set_default_transport(factory: Optional[Callable[[], Transport]]) -> None:
+    """Define el transporte usado por los handlers creados sin ``transport``.
+
+    Parameters
+    ----------
+    factory : Callable[[], Transport] | None
+        Función que retorna el transporte de cada handler nuevo; None
+        restablece :class:`RequestsTransport`
+    """
+    global _default_factory
+    _default_factory = factory if factory is not None else RequestsTransport
+
+
+def default_transport() -> Transport:
+    """Retorna un transporte del tipo configurado por defecto."""
+    return _default_factory()
+
+
+def _api_path(url: str) -> str:
+    parts = urlsplit(url)
+    path = parts.path.split("/apirest.php/", 1)[-1]
+    return f"{path}?{parts.query}" if parts.query else path
+
+
+def _body_digest(body: Any) -> Optional[str]:
+    if not body:
+        return None
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if not isinstance(body, bytes) or body.startswith(b"--"):
+        # Los cuerpos multipart llevan un boundary aleatorio
+        return None
+    return hashlib.sha1(body).hexdigest()
+
+
+def _scrub(value: Any, keys: frozenset) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: SCRUBBED_VALUE if key in keys else _scrub(item, keys)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_scrub(item, keys) for item in value]
+    return value
+
+
+def _encode_body(content: bytes, keys: frozenset) -> Dict[str, Any]:
+    if not content:
+        return {"body": ""}
+    try:
+        payload = json.loads(content)
+    except (UnicodeDecodeError, ValueError):
+        return {"body_b64": base64.b64encode(content).decode("ascii")}
+    return {"json": _scrub(payload, keys)}
+
+
+def _build_response(
+    prepared: requests.PreparedRequest, interaction: Dict[str, Any]
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = interaction["status"]
+    response.headers = CaseInsensitiveDict(interaction.get("headers", {}))
+    response.url = prepared.url
+    response.request = prepared
+    response.encoding = "utf-8"
+    if "json" in interaction:
+        response._content = json.dumps(interaction["json"]).encode("utf-8")
+    elif "body_b64" in interaction:
+        response._content = base64.b64decode(interaction["body_b64"])
+    else:
+        response._content = interaction.get("body", "").encode("utf-8")
+    return response
+
+
+def _open_cassette(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, f"{mode}t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
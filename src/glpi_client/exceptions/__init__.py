@@ -2,7 +2,7 @@
 Excepciones personalizadas para GLPI Wrapper.
 """
 
-from .base import GLPIError
+from .base import GLPICancelledError, GLPIError
 from .request import GLPIRequestError
 
-__all__ = ['GLPIError', 'GLPIRequestError']
\ No newline at end of file
+__all__ = ['GLPIError', 'GLPIRequestError', 'GLPICancelledError']
\ No newline at end of file
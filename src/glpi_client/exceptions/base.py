@@ -9,4 +9,12 @@ class GLPIError(Exception):
     Esta es la excepción padre de todas las excepciones específicas del wrapper.
     Puede capturarse para manejar cualquier error relacionado con GLPI.
     """
-    pass
\ No newline at end of file
+    pass
+
+class GLPICancelledError(GLPIError):
+    """La operación fue cancelada antes de terminar.
+
+    Se lanza antes de enviar un request (o durante la espera entre
+    reintentos) cuando el token de cancelación activo fue cancelado.
+    """
+    pass
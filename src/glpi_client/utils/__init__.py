@@ -2,7 +2,37 @@
 Utilidades y helpers para GLPI Wrapper.
 """
 
+from .cancellation import (
+    CancellationToken,
+    cancellation_scope,
+    cancellation_shield,
+    check_cancelled,
+    current_cancellation,
+)
 from .decorators import retry_on_failure
 from .helpers import add_criteria_to_parameters
+from .metrics import HTTPMetrics, LatencyHistogram, http_metrics
+from .pacing import pacing_scope, wait_for_turn
+from .progress import ProgressCounter, progress_scope, report_progress
+from .tracing import RequestTrace, current_trace, start_trace
 
-__all__ = ['retry_on_failure', 'add_criteria_to_parameters']
\ No newline at end of file
+__all__ = [
+    'retry_on_failure',
+    'add_criteria_to_parameters',
+    'HTTPMetrics',
+    'LatencyHistogram',
+    'http_metrics',
+    'RequestTrace',
+    'current_trace',
+    'start_trace',
+    'CancellationToken',
+    'cancellation_scope',
+    'cancellation_shield',
+    'check_cancelled',
+    'current_cancellation',
+    'ProgressCounter',
+    'progress_scope',
+    'report_progress',
+    'pacing_scope',
+    'wait_for_turn',
+]
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""
+Cancelación cooperativa de operaciones en curso.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from ..exceptions import GLPICancelledError
+
+
+class CancellationToken:
+    """Señal thread-safe para abortar una operación desde otro hilo.
+
+    Los handlers la consultan antes de cada request y durante las esperas
+    entre reintentos; un request ya enviado no se interrumpe, pero ningún
+    request posterior (página, sub-request o reintento) llega a enviarse.
+
+    Examples
+    --------
+    >>> token = CancellationToken()
+    >>> with cancellation_scope(token):
+    ...     handler.get_all_items("Ticket")  # otro hilo llama token.cancel()
+    Traceback (most recent call last):
+    GLPICancelledError: Operation cancelled
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Marca la operación como cancelada."""
+        self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        """Lanza :class:`GLPICancelledError` si la operación fue cancelada."""
+        if self._event.is_set():
+            raise GLPICancelledError("Operation cancelled")
+
+    def sleep(self, seconds: float) -> None:
+        """Espera ``seconds`` segundos o hasta que se cancele la operación.
+
+        Raises
+        ------
+        GLPICancelledError
+            Si la operación se cancela durante la espera
+        """
+        if self._event.wait(seconds):
+            self.raise_if_cancelled()
+
+
+_current_token: ContextVar[Optional[CancellationToken]] = ContextVar(
+    "glpi_cancellation_token", default=None
+)
+
+
+def current_cancellation() -> Optional[CancellationToken]:
+    """Retorna el token de cancelación activo, si hay uno."""
+    return _current_token.get()
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken) -> Iterator[CancellationToken]:
+    """Activa ``token`` para los requests enviados dentro del bloque.
+
+    El token se propaga a los hilos que copian el contexto (fan-out con
+    ``copy_context().run``).
+    """
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+@contextmanager
+def cancellation_shield() -> Iterator[None]:
+    """Ignora la cancelación activa para los requests del bloque.
+
+    Para trabajo que debe completarse aunque la operación se cancele: enviar
+    inserciones agrupadas que incluyen ítems de otros llamadores o cerrar
+    sesiones al terminar.
+    """
+    reset = _current_token.set(None)
+    try:
+        yield
+    finally:
+        _current_token.reset(reset)
+
+
+def check_cancelled() -> None:
+    """Lanza :class:`GLPICancelledError` si el token activo fue cancelado."""
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def sleep_unless_cancelled(seconds: float) -> None:
+    """Como :func:`time.sleep`, pero se interrumpe si se cancela la operación."""
+    token = _current_token.get()
+    if token is None:
+        time.sleep(seconds)
+        return
+    token.sleep(seconds)
@@ -2,13 +2,14 @@
 Decoradores para GLPI Wrapper.
 """
 
-import time
 from functools import wraps
 from typing import Callable, TypeVar
 import logging
 
 import requests
 from ..exceptions import GLPIRequestError
+from .cancellation import sleep_unless_cancelled
+from .tracing import retry_attempt
 
 T = TypeVar('T')
 logger = logging.getLogger(__name__)
@@ -37,14 +38,15 @@ def retry_on_failure(max_retries: int = 3, delay: float = 1.0, backoff: float =
             last_exception = None
             for attempt in range(max_retries):
                 try:
-                    return func(*args, **kwargs)
+                    with retry_attempt(attempt):
+                        return func(*args, **kwargs)
                 except (requests.RequestException, GLPIRequestError) as e:
                     last_exception = e
                     if attempt == max_retries - 1:
                         break
                     sleep_time = delay * (backoff ** attempt)
                     logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {sleep_time:.1f}s")
-                    time.sleep(sleep_time)
+                    sleep_unless_cancelled(sleep_time)
             raise last_exception
         return wrapper
     return decorator
\ No newline at end of file
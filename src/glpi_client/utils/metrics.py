@@ -0,0 +1,145 @@
+"""
+Métricas de requests HTTP hacia la API de GLPI.
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_NUMERIC_SEGMENT = re.compile(r"^\d+$")
+
+
+class LatencyHistogram:
+    """Histograma de latencias con buckets acumulables al estilo Prometheus.
+
+    Parameters
+    ----------
+    buckets : Sequence[float]
+        Límites superiores (en segundos) de cada bucket, en orden creciente
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Registra una observación."""
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estima el cuantil ``q`` usando el límite superior del bucket."""
+        if self.count == 0:
+            return None
+        target = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Retorna un resumen serializable del histograma."""
+        cumulative: List[int] = []
+        running = 0
+        for bucket_count in self.counts:
+            running += bucket_count
+            cumulative.append(running)
+        return {
+            "count": self.count,
+            "sum_seconds": round(self.total, 6),
+            "max_seconds": round(self.max, 6),
+            "avg_seconds": round(self.total / self.count, 6) if self.count else None,
+            "p50_seconds": self.quantile(0.5),
+            "p95_seconds": self.quantile(0.95),
+            "p99_seconds": self.quantile(0.99),
+            "buckets": {
+                **{str(le): cumulative[i] for i, le in enumerate(self.buckets)},
+                "+Inf": cumulative[-1],
+            },
+        }
+
+
+class _EndpointStats:
+    """Acumuladores de un endpoint y método HTTP."""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.status_codes: Counter = Counter()
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+
+class HTTPMetrics:
+    """Registro thread-safe de métricas por endpoint de GLPI."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _EndpointStats] = {}
+
+    def record(
+        self,
+        method: str,
+        action: str,
+        status_code: Optional[int],
+        duration: float,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        """Registra un request completado (``status_code`` None si falló la conexión)."""
+        key = f"{method.upper()} {normalize_endpoint(action)}"
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = _EndpointStats()
+            stats.latency.observe(duration)
+            stats.status_codes[str(status_code) if status_code is not None else "error"] += 1
+            if status_code is None or status_code >= 400:
+                stats.errors += 1
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Retorna las métricas acumuladas por endpoint."""
+        with self._lock:
+            return {
+                key: {
+                    "requests": stats.latency.count,
+                    "errors": stats.errors,
+                    "status_codes": dict(stats.status_codes),
+                    "bytes_sent": stats.bytes_sent,
+                    "bytes_received": stats.bytes_received,
+                    "latency": stats.latency.snapshot(),
+                }
+                for key, stats in sorted(self._endpoints.items())
+            }
+
+    def reset(self) -> None:
+        """Descarta todas las métricas acumuladas."""
+        with self._lock:
+            self._endpoints.clear()
+
+
+def normalize_endpoint(action: str) -> str:
+    """Reemplaza los ids numéricos de la ruta para agrupar endpoints.
+
+    >>> normalize_endpoint("Ticket/42/ITILFollowup")
+    'Ticket/{id}/ITILFollowup'
+    """
+    parts = action.strip("/").split("/")
+    return "/".join("{id}" if _NUMERIC_SEGMENT.match(part) else part for part in parts)
+
+
+http_metrics = HTTPMetrics()
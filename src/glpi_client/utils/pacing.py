@@ -0,0 +1,35 @@
+"""
+Regulación del ritmo de requests de operaciones de baja prioridad.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+_current_gate: ContextVar[Optional[Callable[[], None]]] = ContextVar(
+    "glpi_pacing_gate", default=None
+)
+
+
+@contextmanager
+def pacing_scope(gate: Callable[[], None]) -> Iterator[Callable[[], None]]:
+    """Llama a ``gate`` antes de cada request enviado dentro del bloque.
+
+    ``gate`` puede bloquear para ceder capacidad de GLPI a otro trabajo
+    (por ejemplo, una operación masiva que espera mientras hay consultas
+    interactivas en curso). Como la cancelación, se propaga a los hilos que
+    copian el contexto, por lo que debe ser thread-safe y su espera debe
+    estar acotada.
+    """
+    reset = _current_gate.set(gate)
+    try:
+        yield gate
+    finally:
+        _current_gate.reset(reset)
+
+
+def wait_for_turn() -> None:
+    """Espera a que el ``gate`` activo, si hay uno, permita el request."""
+    gate = _current_gate.get()
+    if gate is not None:
+        gate()
@@ -0,0 +1,75 @@
+"""
+Reporte de avance de operaciones largas.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+# (avance, total estimado o None, mensaje)
+ProgressCallback = Callable[[float, Optional[float], str], None]
+
+_current_callback: ContextVar[Optional[ProgressCallback]] = ContextVar(
+    "glpi_progress_callback", default=None
+)
+
+
+@contextmanager
+def progress_scope(callback: ProgressCallback) -> Iterator[ProgressCallback]:
+    """Recibe en ``callback`` el avance de las operaciones del bloque.
+
+    Las operaciones paginadas o por bloques informan cuántas filas o ítems
+    llevan procesados y, si lo conocen (por ejemplo por ``Content-Range``),
+    el total estimado. El callback se invoca desde los hilos que copian el
+    contexto, por lo que debe ser thread-safe.
+
+    Examples
+    --------
+    >>> with progress_scope(lambda done, total, message: print(message)):
+    ...     handler.update_items_chunked("Ticket", payloads)
+    Processed 50/120 items
+    Processed 100/120 items
+    Processed 120/120 items
+    """
+    reset = _current_callback.set(callback)
+    try:
+        yield callback
+    finally:
+        _current_callback.reset(reset)
+
+
+def report_progress(progress: float, total: Optional[float], message: str) -> None:
+    """Informa el avance al callback activo, si hay uno."""
+    callback = _current_callback.get()
+    if callback is not None:
+        callback(progress, total, message)
+
+
+class ProgressCounter:
+    """Acumula el avance de tareas concurrentes y lo informa en orden.
+
+    Parameters
+    ----------
+    total : int
+        Cantidad total de unidades a procesar
+    unit : str, default "items"
+        Nombre de la unidad usado en el mensaje
+    """
+
+    def __init__(self, total: int, unit: str = "items"):
+        self.total = total
+        self.unit = unit
+        self._done = 0
+        self._lock = threading.Lock()
+        self._callback = _current_callback.get()
+
+    def add(self, count: int) -> None:
+        """Suma ``count`` unidades procesadas e informa el nuevo avance."""
+        if self._callback is None:
+            return
+        with self._lock:
+            self._done += count
+            self._callback(
+                self._done, self.total, f"Processed {self._done}/{self.total} {self.unit}"
+            )
@@ -0,0 +1,118 @@
+"""
+Trazas por operación de los requests enviados a GLPI.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class TracedCall:
+    """Un request HTTP registrado dentro de una traza."""
+
+    method: str
+    endpoint: str
+    status_code: Optional[int]
+    duration: float
+    bytes_sent: int
+    bytes_received: int
+    retry: int
+
+
+class RequestTrace:
+    """Colección thread-safe de los requests realizados durante una operación.
+
+    Las trazas pueden anidarse: cada request registrado en una traza hija
+    también se registra en su traza padre.
+
+    Examples
+    --------
+    >>> with start_trace() as trace:
+    ...     handler.get_item("Ticket", 1)
+    >>> assert trace.round_trips <= 3
+    """
+
+    def __init__(self, parent: Optional["RequestTrace"] = None):
+        self.parent = parent
+        self._lock = threading.Lock()
+        self._calls: List[TracedCall] = []
+
+    @property
+    def calls(self) -> List[TracedCall]:
+        """Copia de los requests registrados, en orden de finalización."""
+        with self._lock:
+            return list(self._calls)
+
+    @property
+    def round_trips(self) -> int:
+        """Cantidad de requests HTTP realizados."""
+        with self._lock:
+            return len(self._calls)
+
+    @property
+    def retries(self) -> int:
+        """Cantidad de requests que fueron reintentos."""
+        with self._lock:
+            return sum(1 for call in self._calls if call.retry > 0)
+
+    def record(self, call: TracedCall) -> None:
+        """Registra un request en esta traza y en sus trazas padre."""
+        trace: Optional[RequestTrace] = self
+        while trace is not None:
+            with trace._lock:
+                trace._calls.append(call)
+            trace = trace.parent
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Resumen serializable de la traza."""
+        calls = self.calls
+        return {
+            "round_trips": len(calls),
+            "retries": sum(1 for call in calls if call.retry > 0),
+            "total_seconds": round(sum(call.duration for call in calls), 6),
+            "bytes_sent": sum(call.bytes_sent for call in calls),
+            "bytes_received": sum(call.bytes_received for call in calls),
+            "calls": [
+                {**asdict(call), "duration": round(call.duration, 6)} for call in calls
+            ],
+        }
+
+
+_current_trace: ContextVar[Optional[RequestTrace]] = ContextVar(
+    "glpi_request_trace", default=None
+)
+_retry_attempt: ContextVar[int] = ContextVar("glpi_retry_attempt", default=0)
+
+
+def current_trace() -> Optional[RequestTrace]:
+    """Retorna la traza activa o None."""
+    return _current_trace.get()
+
+
+@contextmanager
+def start_trace() -> Iterator[RequestTrace]:
+    """Activa una nueva traza (hija de la traza activa, si existe)."""
+    trace = RequestTrace(parent=_current_trace.get())
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+def current_retry_attempt() -> int:
+    """Número de reintento en curso (0 para el primer intento)."""
+    return _retry_attempt.get()
+
+
+@contextmanager
+def retry_attempt(attempt: int) -> Iterator[None]:
+    """Marca los requests realizados dentro del bloque como reintento ``attempt``."""
+    token = _retry_attempt.set(attempt)
+    try:
+        yield
+    finally:
+        _retry_attempt.reset(token)
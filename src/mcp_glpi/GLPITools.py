@@ -1,6 +1,25 @@
-from .tool_catalog import TOOL_SPECS, build_tools
+from functools import lru_cache
+from typing import List
 
+import mcp.types as types
 
-tools = build_tools()
+from .tool_catalog import TOOL_SPECS, compile_catalog
 
-__all__ = ["TOOL_SPECS", "tools"]
+
+@lru_cache(maxsize=1)
+def get_tools() -> List[types.Tool]:
+    return list(compile_catalog().tools)
+
+
+def catalog_hash() -> str:
+    return compile_catalog().content_hash
+
+
+def __getattr__(name: str):
+    # ``tools`` is built on first access instead of at import time
+    if name == "tools":
+        return get_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["TOOL_SPECS", "catalog_hash", "get_tools", "tools"]
@@ -1,47 +1,135 @@
+import contextvars
 import html
 import json
 import logging
-from typing import Any, Callable, Dict, Optional, Sequence
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 import mcp.types as types
+from glpi_client import GLPICancelledError
+from glpi_client.utils import check_cancelled, start_trace
+from mcp_glpi.arguments import (
+    COLLECTION_ALIASES,
+    ID_ALIASES,
+    MAPPING_ALIASES,
+    ArgumentError,
+    compiled_arguments,
+)
+from mcp_glpi.batch import BatchEntry, parse_batch_entries, plan_batch_waves
+from mcp_glpi.common import lifecycle, metrics, profiling, shared_store, singleflight
 from mcp_glpi.common.config import get_config
 from mcp_glpi.glpi import changes as glpi_changes
+from mcp_glpi.glpi import pool as glpi_pool
 from mcp_glpi.glpi import session as glpi_session
 from mcp_glpi.glpi import tickets as glpi_tickets
 from mcp_glpi.tool_catalog import TOOL_SPECS
 
 logger = logging.getLogger(__name__)
 COMMAND_HANDLERS = {spec.name: spec.handler_name for spec in TOOL_SPECS}
-ID_ALIASES = {
-    "change_id": ("change_id", "id", "changes_id"),
-    "ticket_id": ("ticket_id", "id", "tickets_id"),
-    "link_id": ("link_id", "relation_id"),
-    "solution_type_id": ("solution_type_id", "solutiontypes_id"),
-}
-COLLECTION_ALIASES = {
-    "users": ("user", "user_id", "users_id"),
-    "groups": ("group", "group_id", "groups_id"),
-}
-MAPPING_ALIASES = {
-    "fields": ("updates", "data"),
-}
+READ_ONLY_TOOLS = frozenset(spec.name for spec in TOOL_SPECS if spec.read_only)
+BATCH_MAX_CONCURRENCY = 8
+TRACE_ARGUMENT = "debug_trace"
 
 
 class CommandHandler:
+    # Top level calls count as in flight; batch entries run inside their batch
+    tracks_in_flight = True
+
     def __init__(self, command: str, arguments: Optional[Dict[str, Any]] = None):
         self.command = command
         self.arguments = arguments or {}
         self.config = get_config()
+        self._error_type: Optional[str] = None
+        self.include_trace = self._get_bool_argument(TRACE_ARGUMENT, self.config.trace_responses)
+        if TRACE_ARGUMENT in self.arguments:
+            self.arguments = {k: v for k, v in self.arguments.items() if k != TRACE_ARGUMENT}
+        self.trace = None
 
     def execute(self):
+        if not self.tracks_in_flight:
+            return self._execute()
+        if not lifecycle.in_flight_calls.enter():
+            return self._error(
+                "El servidor se esta apagando; reintente la llamada.",
+                error_type="shutting_down",
+            )
+        try:
+            return self._execute()
+        finally:
+            lifecycle.in_flight_calls.exit()
+
+    def _execute(self):
         handler_name = COMMAND_HANDLERS.get(self.command)
-        if handler_name is not None:
-            return getattr(self, handler_name)()
-        return self._error(
-            f"Herramienta desconocida: {self.command}",
-            error_type="unknown_command",
+        if handler_name is None:
+            return self._error(
+                f"Herramienta desconocida: {self.command}",
+                error_type="unknown_command",
+            )
+        start = time.perf_counter()
+        with start_trace() as trace:
+            self.trace = trace
+            try:
+                compiled = compiled_arguments()[self.command]
+                self.arguments = compiled.normalize(self.arguments)
+                try:
+                    compiled.validate(self.arguments)
+                except ArgumentError as exc:
+                    return self._error(
+                        f"Invalid argument: {exc}",
+                        error_type="validation_error",
+                        details={"path": list(exc.path)},
+                    )
+                handler = getattr(self, handler_name)
+                if self._can_coalesce():
+                    key = (
+                        type(self),
+                        self.command,
+                        glpi_pool.session_identity(),
+                        compiled.cache_key(self.arguments),
+                    )
+                    # A cancelled leader must not cancel the callers sharing its result
+                    response, self._error_type = singleflight.read_calls.do(
+                        key,
+                        lambda: (self._dispatch(handler), self._error_type),
+                        retry_on=(GLPICancelledError,),
+                    )
+                    return response
+                return self._dispatch(handler)
+            except GLPICancelledError:
+                return self._error("Llamada cancelada por el cliente.", error_type="cancelled")
+            except Exception:
+                self._error_type = "exception"
+                raise
+            finally:
+                metrics.tool_metrics.record(
+                    self.command,
+                    time.perf_counter() - start,
+                    self._error_type,
+                    round_trips=trace.round_trips,
+                )
+
+    def _dispatch(self, handler: Callable[[], Any]):
+        profiler = profiling.active_profiler
+        if profiler is not None and profiler.should_profile(self.command):
+            return profiler.run(self.command, handler)
+        return handler()
+
+    def _can_coalesce(self) -> bool:
+        # Traced responses describe this call's own requests, so never share them
+        return (
+            self.command in READ_ONLY_TOOLS
+            and self.config.coalesce_reads
+            and not self.include_trace
         )
 
+    def _server_stats(self):
+        output = self.arguments.get("format", "json")
+        stats = shared_store.cluster_stats()
+        if output == "prometheus":
+            return self._success(metrics.render_prometheus(stats))
+        return self._success(stats)
+
     def _echo(self):
         message = self.arguments.get("message", "No message provided")
         return self._success({"message": message})
@@ -89,6 +177,93 @@ class CommandHandler:
 
         return self._success(result)
 
+    def _get_tickets(self):
+        return self._get_items_by_ids(glpi_tickets.get_tickets, "Error retrieving tickets")
+
+    def _get_changes(self):
+        return self._get_items_by_ids(glpi_changes.get_changes, "Error retrieving changes")
+
+    def _get_items_by_ids(self, fetcher: Callable[..., Any], runtime_message: str):
+        ids = self._get_collection_alias("ids")
+        if ids is None:
+            return self._error(
+                f"El parametro 'ids' es obligatorio para {self.command}.",
+                error_type="validation_error",
+            )
+        output = self.arguments.get("output", "dict")
+        fields = self._normalize_fields(self.arguments.get("fields"))
+        return self._run_operation(
+            runtime_message,
+            lambda: self._success(fetcher(ids=ids, output=output, fields=fields)),
+        )
+
+    def _batch(self):
+        raw_entries = self._get_from_arguments("operations", "calls", "entries")
+        sequential = self._get_bool_argument("sequential", False)
+        stop_on_error = self._get_bool_argument("stop_on_error", False)
+        max_concurrency = self._get_int_argument("max_concurrency", BATCH_MAX_CONCURRENCY)
+        try:
+            entries = parse_batch_entries(raw_entries)
+            waves = plan_batch_waves(entries, sequential=sequential)
+        except ValueError as exc:
+            return self._error(f"Invalid argument: {exc}", error_type="validation_error")
+
+        workers = max(1, min(max_concurrency or 1, BATCH_MAX_CONCURRENCY))
+        results: List[Optional[Dict[str, Any]]] = [None] * len(entries)
+        halted = False
+        with glpi_pool.shared_session(), ThreadPoolExecutor(max_workers=workers) as executor:
+            for wave in waves:
+                check_cancelled()
+                futures = {}
+                for index in wave:
+                    entry = entries[index]
+                    failed = [dep for dep in entry.depends_on if not results[dep]["ok"]]
+                    if halted or failed:
+                        results[index] = self._skipped_batch_entry(entry, failed)
+                        continue
+                    context = contextvars.copy_context()
+                    futures[index] = executor.submit(context.run, self._run_batch_entry, entry)
+                for index, future in futures.items():
+                    results[index] = future.result()
+                    if stop_on_error and not results[index]["ok"]:
+                        halted = True
+
+        succeeded = sum(1 for result in results if result["ok"])
+        return self._success(
+            {"results": results},
+            summary=f"{succeeded} de {len(results)} operaciones completadas",
+        )
+
+    def _run_batch_entry(self, entry: BatchEntry) -> Dict[str, Any]:
+        if entry.tool == self.command:
+            payload = _BatchEntryHandler(entry.tool, entry.arguments)._error(
+                "No se permite anidar herramientas batch.",
+                error_type="validation_error",
+            )
+        else:
+            handler = _BatchEntryHandler(entry.tool, entry.arguments)
+            try:
+                payload = handler.execute()
+            except Exception as exc:  # pragma: no cover - depends on remote API
+                logger.exception("Error running batch operation %s", entry.index)
+                payload = handler._error(
+                    f"Error running {entry.tool}: {exc}",
+                    error_type="runtime_error",
+                )
+        return {**entry.describe(), **payload}
+
+    def _skipped_batch_entry(self, entry: BatchEntry, failed: Sequence[int]) -> Dict[str, Any]:
+        if failed:
+            message = f"Omitida porque fallaron las operaciones {list(failed)}"
+        else:
+            message = "Omitida porque una operacion previa fallo"
+        return {
+            **entry.describe(),
+            "ok": False,
+            "command": entry.tool,
+            "error": {"type": "skipped", "message": message},
+        }
+
     def _create_change(self):
         name = self.arguments.get("name")
         if not name:
@@ -150,6 +325,20 @@ class CommandHandler:
             )
         ))
 
+    def _bulk_create_tickets(self):
+        tickets = self._get_json_argument("tickets")
+        if tickets is None:
+            return self._error(
+                "El parametro 'tickets' es obligatorio para bulk_create_tickets.",
+                error_type="validation_error",
+            )
+        chunk_size = self._get_int_argument("chunk_size", None)
+        options = {"chunk_size": chunk_size} if chunk_size else {}
+        return self._run_operation(
+            "Error creating tickets",
+            lambda: self._wrap_result(glpi_tickets.bulk_create_tickets(tickets, **options)),
+        )
+
     def _add_change_comment(self):
         additional = self._normalize_additional(self.arguments.get("additional"))
         is_private = self._get_bool_argument("is_private", False)
@@ -343,6 +532,34 @@ class CommandHandler:
             lambda: self._wrap_result(glpi_tickets.update_ticket(ticket_id=ticket_id, fields=fields)),
         )
 
+    def _bulk_update_tickets(self):
+        return self._bulk_update(glpi_tickets.bulk_update_tickets, "Error updating tickets")
+
+    def _bulk_update_changes(self):
+        return self._bulk_update(
+            glpi_changes.bulk_update_changes,
+            "Error updating changes",
+            merge_pr_links=True,
+        )
+
+    def _bulk_update(
+        self,
+        updater: Callable[..., Any],
+        runtime_message: str,
+        merge_pr_links: bool = False,
+    ):
+        updates = self._get_json_argument("updates")
+        ids = self._get_collection_alias("ids")
+        fields = self._get_mapping_argument("fields")
+        if merge_pr_links and fields is not None:
+            fields = self._merge_pr_links(fields, target_key="controlistcontent")
+        chunk_size = self._get_int_argument("chunk_size", None)
+        options = {"chunk_size": chunk_size} if chunk_size else {}
+        return self._run_operation(
+            runtime_message,
+            lambda: self._wrap_result(updater(updates, ids=ids, fields=fields, **options)),
+        )
+
     def _wrap_result(self, result: Any):
         if hasattr(result, "summary") and callable(result.summary):
             summary = result.summary()
@@ -437,6 +654,16 @@ class CommandHandler:
             return None
         return None
 
+    def _get_json_argument(self, key: str):
+        value = self.arguments.get(key)
+        if isinstance(value, str):
+            try:
+                return json.loads(value)
+            except json.JSONDecodeError:
+                logger.warning("Invalid JSON provided for %s: %s", key, value)
+                return None
+        return value
+
     def _get_mapping_alias(self, canonical_key: str):
         return self._get_mapping_argument(canonical_key, MAPPING_ALIASES[canonical_key])
 
@@ -505,9 +732,11 @@ class CommandHandler:
         }
         if summary is not None:
             payload["summary"] = summary
+        self._attach_trace(payload)
         return self._json_response(payload)
 
     def _error(self, message: str, error_type: str = "error", details: Any = None):
+        self._error_type = error_type
         payload: Dict[str, Any] = {
             "ok": False,
             "command": self.command,
@@ -518,8 +747,13 @@ class CommandHandler:
         }
         if details is not None:
             payload["error"]["details"] = details
+        self._attach_trace(payload)
         return self._json_response(payload)
 
+    def _attach_trace(self, payload: Dict[str, Any]) -> None:
+        if self.include_trace and self.trace is not None:
+            payload["trace"] = self.trace.as_dict()
+
     def _json_response(self, payload: Dict[str, Any]):
         return [
             types.TextContent(
@@ -531,8 +765,19 @@ class CommandHandler:
     def _run_operation(self, runtime_message: str, operation: Callable[[], Any]):
         try:
             return operation()
+        except GLPICancelledError:
+            raise
         except ValueError as exc:
             return self._error(f"Invalid argument: {exc}", error_type="validation_error")
         except Exception as exc:  # pragma: no cover - depends on remote API
             logger.exception(runtime_message)
             return self._error(f"{runtime_message}: {exc}", error_type="runtime_error")
+
+
+class _BatchEntryHandler(CommandHandler):
+    """CommandHandler that keeps responses as dictionaries for batch aggregation."""
+
+    tracks_in_flight = False
+
+    def _json_response(self, payload: Dict[str, Any]):
+        return payload
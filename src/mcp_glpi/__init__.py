@@ -4,6 +4,7 @@
 __all__ = [
     "GLPiHandler",
     "GLPITools",
+    "batch",
     "server",
     "common",
     "glpi",
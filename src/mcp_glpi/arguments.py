@@ -0,0 +1,172 @@
+"""Argument validators and coercers compiled from the tool catalog schemas."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+import jsonschema
+
+from mcp_glpi.tool_catalog import TOOL_SPECS, ToolSpec, _thaw
+
+ID_ALIASES = {
+    "change_id": ("change_id", "id", "changes_id"),
+    "ticket_id": ("ticket_id", "id", "tickets_id"),
+    "link_id": ("link_id", "relation_id"),
+    "solution_type_id": ("solution_type_id", "solutiontypes_id"),
+}
+COLLECTION_ALIASES = {
+    "ids": ("ticket_ids", "change_ids", "id"),
+    "users": ("user", "user_id", "users_id"),
+    "groups": ("group", "group_id", "groups_id"),
+}
+MAPPING_ALIASES = {
+    "fields": ("updates", "data"),
+}
+
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "y"})
+_FALSE_STRINGS = frozenset({"0", "false", "no", "n"})
+
+
+class ArgumentError(ValueError):
+    """Arguments rejected by a tool's input schema."""
+
+    def __init__(self, message: str, path: Tuple[Any, ...] = ()):
+        super().__init__(message)
+        self.path = path
+
+
+def _coerce_int(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            return value
+    return value
+
+
+def _coerce_bool(value: Any) -> Any:
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        return bool(value)
+    return value
+
+
+def _coerce_json(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return value
+    return value
+
+
+def _coercer_for(schema: Mapping[str, Any]) -> Optional[Callable[[Any], Any]]:
+    """Pick the coercion for a property from the types its schema accepts.
+
+    Strings are only converted when the schema does not accept them as-is;
+    values that cannot be converted are left untouched for the validator
+    to report.
+    """
+
+    types_: Any = schema.get("type")
+    if types_ is None and "anyOf" in schema:
+        types_ = [option.get("type") for option in schema["anyOf"]]
+    if isinstance(types_, str):
+        types_ = [types_]
+    accepted = frozenset(t for t in types_ or () if t and t != "null")
+    if "boolean" in accepted:
+        return _coerce_bool
+    if "string" in accepted or not accepted:
+        return None
+    if accepted == {"integer"}:
+        return _coerce_int
+    if accepted & {"array", "object"}:
+        return _coerce_json
+    return None
+
+
+@dataclass(frozen=True)
+class CompiledArguments:
+    """Alias resolution, coercion and validation compiled for one tool."""
+
+    name: str
+    validator: Any
+    properties: Tuple[str, ...]
+    aliases: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    coercers: Tuple[Tuple[str, Callable[[Any], Any]], ...]
+
+    def normalize(self, arguments: Mapping[str, Any]) -> Dict[str, Any]:
+        """Copy ``arguments`` with canonical keys filled from their aliases
+        and values coerced to the types declared in the schema."""
+
+        normalized = dict(arguments)
+        for canonical, keys in self.aliases:
+            if normalized.get(canonical) is not None:
+                continue
+            for key in keys:
+                if normalized.get(key) is not None:
+                    normalized[canonical] = normalized[key]
+                    break
+        for key, coercer in self.coercers:
+            if key in normalized:
+                normalized[key] = coercer(normalized[key])
+        return normalized
+
+    def cache_key(self, arguments: Mapping[str, Any]) -> str:
+        """Canonical JSON of the declared properties of normalized arguments."""
+
+        declared = {key: arguments[key] for key in self.properties if key in arguments}
+        return json.dumps(declared, sort_keys=True, separators=(",", ":"), default=str)
+
+    def validate(self, arguments: Mapping[str, Any]) -> None:
+        error = jsonschema.exceptions.best_match(self.validator.iter_errors(arguments))
+        if error is not None:
+            path = tuple(error.absolute_path)
+            location = ".".join(str(part) for part in path)
+            message = f"{location}: {error.message}" if location else error.message
+            raise ArgumentError(message, path)
+
+
+def compile_spec(spec: ToolSpec) -> CompiledArguments:
+    schema = _thaw(spec.input_schema)
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    properties = schema.get("properties", {})
+
+    aliases = []
+    for table in (ID_ALIASES, COLLECTION_ALIASES, MAPPING_ALIASES):
+        for canonical, keys in table.items():
+            if canonical not in properties:
+                continue
+            # A declared property never acts as an alias of another one
+            # (bulk tools accept both ``fields`` and ``updates``)
+            keys = tuple(k for k in keys if k != canonical and k not in properties)
+            if keys:
+                aliases.append((canonical, keys))
+
+    coercers = []
+    for key, property_schema in properties.items():
+        coercer = _coercer_for(property_schema)
+        if coercer is not None:
+            coercers.append((key, coercer))
+    return CompiledArguments(
+        name=spec.name,
+        validator=validator_cls(schema),
+        properties=tuple(properties),
+        aliases=tuple(aliases),
+        coercers=tuple(coercers),
+    )
+
+
+@lru_cache(maxsize=1)
+def compiled_arguments() -> Dict[str, CompiledArguments]:
+    """Compile every tool of the catalog once per process."""
+    return {spec.name: compile_spec(spec) for spec in TOOL_SPECS}
@@ -0,0 +1,115 @@
+"""Parsing and scheduling helpers for the batch tool."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+MAX_BATCH_OPERATIONS = 100
+
+
+@dataclass
+class BatchEntry:
+    index: int
+    tool: str
+    arguments: Dict[str, Any]
+    entry_id: Optional[str] = None
+    depends_on: List[int] = field(default_factory=list)
+
+    def describe(self) -> Dict[str, Any]:
+        described: Dict[str, Any] = {"index": self.index, "tool": self.tool}
+        if self.entry_id is not None:
+            described["id"] = self.entry_id
+        return described
+
+
+def parse_batch_entries(raw_entries: Any) -> List[BatchEntry]:
+    if not isinstance(raw_entries, (list, tuple)) or not raw_entries:
+        raise ValueError("operations must be a non-empty list")
+    if len(raw_entries) > MAX_BATCH_OPERATIONS:
+        raise ValueError(f"operations cannot contain more than {MAX_BATCH_OPERATIONS} entries")
+
+    entries: List[BatchEntry] = []
+    raw_dependencies: List[Sequence[Any]] = []
+    ids: Dict[str, int] = {}
+    for index, raw in enumerate(raw_entries):
+        if not isinstance(raw, dict):
+            raise ValueError(f"operation #{index} must be an object")
+        tool = raw.get("tool")
+        if not isinstance(tool, str) or not tool.strip():
+            raise ValueError(f"operation #{index} requires a 'tool' name")
+        arguments = raw.get("arguments") or {}
+        if not isinstance(arguments, dict):
+            raise ValueError(f"arguments of operation #{index} must be an object")
+        entry_id = raw.get("id")
+        if entry_id is not None:
+            entry_id = str(entry_id)
+            if entry_id in ids:
+                raise ValueError(f"duplicated operation id: {entry_id}")
+            ids[entry_id] = index
+        depends_on = raw.get("depends_on") or []
+        if not isinstance(depends_on, (list, tuple)):
+            depends_on = [depends_on]
+        raw_dependencies.append(depends_on)
+        entries.append(
+            BatchEntry(index=index, tool=tool.strip(), arguments=arguments, entry_id=entry_id)
+        )
+
+    for entry, dependencies in zip(entries, raw_dependencies):
+        entry.depends_on = [
+            _resolve_dependency(dependency, ids, len(entries), entry.index)
+            for dependency in dependencies
+        ]
+    return entries
+
+
+def _resolve_dependency(dependency: Any, ids: Dict[str, int], total: int, index: int) -> int:
+    if isinstance(dependency, str) and dependency in ids:
+        resolved = ids[dependency]
+    else:
+        try:
+            resolved = int(dependency)
+        except (TypeError, ValueError) as err:
+            raise ValueError(
+                f"operation #{index} depends on unknown operation {dependency!r}"
+            ) from err
+    if resolved < 0 or resolved >= total:
+        raise ValueError(f"operation #{index} depends on unknown operation {dependency!r}")
+    if resolved == index:
+        raise ValueError(f"operation #{index} cannot depend on itself")
+    return resolved
+
+
+def plan_batch_waves(entries: Sequence[BatchEntry], sequential: bool = False) -> List[List[int]]:
+    """Group entry indexes in waves whose members can run concurrently.
+
+    ``sequential`` runs one entry per wave, in the given order except where a
+    dependency on a later entry requires moving it.
+    """
+
+    if sequential:
+        order: List[int] = []
+        pending_deps = {entry.index: set(entry.depends_on) for entry in entries}
+        while pending_deps:
+            ready = [index for index, deps in pending_deps.items() if deps.issubset(order)]
+            if not ready:
+                raise ValueError("operations contain a dependency cycle")
+            index = min(ready)
+            del pending_deps[index]
+            order.append(index)
+        return [[index] for index in order]
+
+    levels: Dict[int, int] = {}
+    pending = {entry.index: set(entry.depends_on) for entry in entries}
+    while pending:
+        ready = [index for index, deps in pending.items() if deps.issubset(levels)]
+        if not ready:
+            raise ValueError("operations contain a dependency cycle")
+        for index in ready:
+            deps = pending.pop(index)
+            levels[index] = 1 + max((levels[dep] for dep in deps), default=-1)
+
+    waves: List[List[int]] = [[] for _ in range(max(levels.values()) + 1)]
+    for index in sorted(levels):
+        waves[levels[index]].append(index)
+    return waves
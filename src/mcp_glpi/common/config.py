@@ -2,6 +2,7 @@
 
 from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 from pydantic import field_validator
@@ -20,6 +21,35 @@ class GLPIConfig(BaseSettings):
     app_token: str = ""
     user_token: str = ""
     request_timeout: int = 30
+    write_coalesce_window_ms: float = 5.0
+    write_coalesce_max_batch: int = 50
+    coalesce_reads: bool = True
+    session_pool_size: int = 4
+    session_pool_identities: int = 64
+    session_idle_timeout: float = 300.0
+    session_acquire_timeout: float = 30.0
+    session_keepalive_interval: float = 120.0
+    session_store: Optional[str] = None
+    session_store_key: str = ""
+    shutdown_timeout: float = 10.0
+    interactive_concurrency: int = 32
+    bulk_concurrency: int = 2
+    bulk_yield_timeout: float = 1.0
+    shared_store: Optional[str] = None
+    trace_responses: bool = False
+    transport: str = "live"
+    cassette: Optional[str] = None
+    replay_latency_scale: Optional[float] = None
+    metrics_file: Optional[str] = None
+    metrics_port: Optional[int] = None
+    metrics_host: str = "127.0.0.1"
+    metrics_interval: float = 15.0
+    profile_dir: Optional[str] = None
+    profile_sample_rate: float = 0.0
+    profile_tools: str = ""
+    profile_mode: str = "cpu"
+    profile_retention: int = 50
+    profile_top_allocations: int = 25
 
     model_config = SettingsConfigDict(env_prefix="GLPI_", case_sensitive=False)
 
@@ -30,6 +60,22 @@ class GLPIConfig(BaseSettings):
             raise ValueError("Token no puede estar vacio")
         return value
 
+    @field_validator("transport")
+    @classmethod
+    def transport_must_be_known(cls, value: str) -> str:
+        value = value.lower()
+        if value not in ("live", "record", "replay"):
+            raise ValueError("transport debe ser live, record o replay")
+        return value
+
+    @field_validator("profile_mode")
+    @classmethod
+    def profile_mode_must_be_known(cls, value: str) -> str:
+        value = value.lower()
+        if value not in ("cpu", "memory", "both"):
+            raise ValueError("profile_mode debe ser cpu, memory o both")
+        return value
+
     @field_validator("url")
     @classmethod
     def url_must_be_valid(cls, value: str) -> str:
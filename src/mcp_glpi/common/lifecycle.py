@@ -0,0 +1,74 @@
+"""Admission and draining of tool calls around server shutdown."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .metrics import register_stats_provider
+
+
+class InFlightCalls:
+    """Counts running tool calls and stops admitting new ones once closed."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._active = 0
+        self._closed = False
+        self._rejected = 0
+
+    @property
+    def active(self) -> int:
+        with self._condition:
+            return self._active
+
+    @property
+    def closed(self) -> bool:
+        with self._condition:
+            return self._closed
+
+    def enter(self) -> bool:
+        """Register a new call; False when the server is shutting down."""
+
+        with self._condition:
+            if self._closed:
+                self._rejected += 1
+                return False
+            self._active += 1
+            return True
+
+    def exit(self) -> None:
+        with self._condition:
+            self._active -= 1
+            if not self._active:
+                self._condition.notify_all()
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+
+    def reopen(self) -> None:
+        with self._condition:
+            self._closed = False
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Wait for running calls to finish; False if some are still running."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._active:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {"active": self._active, "rejected": self._rejected}
+
+
+in_flight_calls = InFlightCalls()
+
+register_stats_provider("in_flight", in_flight_calls.stats)
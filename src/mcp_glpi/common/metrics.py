@@ -0,0 +1,346 @@
+"""Runtime metrics for MCP tool calls, GLPI traffic, sessions and caches."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+from glpi_client.utils import LatencyHistogram, http_metrics
+
+logger = logging.getLogger(__name__)
+
+_started_at = time.time()
+_stats_providers: Dict[str, Callable[[], Dict[str, Any]]] = {}
+_metric_name_invalid = re.compile(r"[^a-zA-Z0-9_]")
+
+
+class _ToolStats:
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.errors: Dict[str, int] = {}
+        self.glpi_requests = 0
+        self.max_glpi_requests = 0
+
+
+class ToolMetrics:
+    """Thread-safe latency histograms and error counters per MCP tool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tools: Dict[str, _ToolStats] = {}
+
+    def record(
+        self,
+        tool: str,
+        duration: float,
+        error_type: Optional[str] = None,
+        round_trips: int = 0,
+    ) -> None:
+        with self._lock:
+            stats = self._tools.get(tool)
+            if stats is None:
+                stats = self._tools[tool] = _ToolStats()
+            stats.latency.observe(duration)
+            stats.glpi_requests += round_trips
+            stats.max_glpi_requests = max(stats.max_glpi_requests, round_trips)
+            if error_type is not None:
+                stats.errors[error_type] = stats.errors.get(error_type, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                tool: {
+                    "calls": stats.latency.count,
+                    "errors": sum(stats.errors.values()),
+                    "errors_by_type": dict(stats.errors),
+                    "glpi_requests": stats.glpi_requests,
+                    "max_glpi_requests_per_call": stats.max_glpi_requests,
+                    "latency": stats.latency.snapshot(),
+                }
+                for tool, stats in sorted(self._tools.items())
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tools.clear()
+
+
+tool_metrics = ToolMetrics()
+
+
+def register_stats_provider(name: str, provider: Callable[[], Dict[str, Any]]) -> None:
+    """Expose extra component stats (sessions, caches...) in collect_stats."""
+
+    _stats_providers[name] = provider
+
+
+def collect_stats() -> Dict[str, Any]:
+    components: Dict[str, Any] = {}
+    for name, provider in sorted(_stats_providers.items()):
+        try:
+            components[name] = provider()
+        except Exception:  # pragma: no cover - defensive
+            logger.debug("Stats provider %s failed", name, exc_info=True)
+    return {
+        "uptime_seconds": round(time.time() - _started_at, 3),
+        "pid": os.getpid(),
+        "tools": tool_metrics.snapshot(),
+        "glpi_endpoints": http_metrics.snapshot(),
+        **components,
+    }
+
+
+def merge_stats(workers: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine the ``collect_stats`` snapshots published by several workers.
+
+    Counters and histogram buckets are added up, ``max*`` values keep the
+    largest one and quantiles are recomputed from the merged buckets.
+    """
+
+    merged: Dict[str, Any] = {}
+    for worker in workers.values():
+        merged = _merge_values(merged, worker["stats"])
+    merged["pid"] = os.getpid()
+    merged["uptime_seconds"] = round(time.time() - _started_at, 3)
+    merged["workers"] = {
+        worker_id: {
+            "pid": worker["pid"],
+            "seconds_since_update": round(time.time() - worker["updated_at"], 3),
+            "uptime_seconds": worker["stats"].get("uptime_seconds"),
+            "calls": sum(tool["calls"] for tool in worker["stats"].get("tools", {}).values()),
+        }
+        for worker_id, worker in workers.items()
+    }
+    return merged
+
+
+def _merge_values(left: Any, right: Any, key: str = "") -> Any:
+    if isinstance(left, dict) and isinstance(right, dict):
+        if "buckets" in left and "buckets" in right:
+            return _merge_histograms(left, right)
+        merged = dict(left)
+        for name, value in right.items():
+            merged[name] = _merge_values(left[name], value, name) if name in left else value
+        return merged
+    numbers = (int, float)
+    if isinstance(left, numbers) and isinstance(right, numbers) and not isinstance(left, bool):
+        return max(left, right) if key.startswith("max") else left + right
+    return left if left is not None else right
+
+
+def _merge_histograms(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+    count = left["count"] + right["count"]
+    total = left["sum_seconds"] + right["sum_seconds"]
+    maximum = max(left["max_seconds"], right["max_seconds"])
+    buckets = {le: left["buckets"].get(le, 0) + right["buckets"].get(le, 0) for le in left["buckets"]}
+
+    def quantile(q: float) -> Optional[float]:
+        if not count:
+            return None
+        for le, cumulative in buckets.items():
+            if cumulative >= q * count:
+                return maximum if le == "+Inf" else float(le)
+        return maximum
+
+    return {
+        "count": count,
+        "sum_seconds": round(total, 6),
+        "max_seconds": maximum,
+        "avg_seconds": round(total / count, 6) if count else None,
+        "p50_seconds": quantile(0.5),
+        "p95_seconds": quantile(0.95),
+        "p99_seconds": quantile(0.99),
+        "buckets": buckets,
+    }
+
+
+def render_prometheus(stats: Optional[Dict[str, Any]] = None) -> str:
+    stats = stats if stats is not None else collect_stats()
+    lines: List[str] = [
+        "# TYPE mcp_glpi_uptime_seconds gauge",
+        f"mcp_glpi_uptime_seconds {stats['uptime_seconds']}",
+    ]
+
+    lines.append("# TYPE mcp_glpi_tool_errors_total counter")
+    for tool, tool_stats in stats["tools"].items():
+        for error_type, count in tool_stats["errors_by_type"].items():
+            lines.append(
+                f"mcp_glpi_tool_errors_total{_labels(tool=tool, type=error_type)} {count}"
+            )
+    lines.append("# TYPE mcp_glpi_tool_glpi_requests_total counter")
+    for tool, tool_stats in stats["tools"].items():
+        lines.append(
+            f"mcp_glpi_tool_glpi_requests_total{_labels(tool=tool)} {tool_stats['glpi_requests']}"
+        )
+    lines.append("# TYPE mcp_glpi_tool_latency_seconds histogram")
+    for tool, tool_stats in stats["tools"].items():
+        lines.extend(
+            _histogram_lines("mcp_glpi_tool_latency_seconds", tool_stats["latency"], tool=tool)
+        )
+
+    lines.append("# TYPE mcp_glpi_glpi_responses_total counter")
+    for key, endpoint in stats["glpi_endpoints"].items():
+        method, path = key.split(" ", 1)
+        for status, count in endpoint["status_codes"].items():
+            labels = _labels(method=method, endpoint=path, status=status)
+            lines.append(f"mcp_glpi_glpi_responses_total{labels} {count}")
+    for metric in ("bytes_sent", "bytes_received"):
+        lines.append(f"# TYPE mcp_glpi_glpi_{metric}_total counter")
+        for key, endpoint in stats["glpi_endpoints"].items():
+            method, path = key.split(" ", 1)
+            labels = _labels(method=method, endpoint=path)
+            lines.append(f"mcp_glpi_glpi_{metric}_total{labels} {endpoint[metric]}")
+    lines.append("# TYPE mcp_glpi_glpi_request_latency_seconds histogram")
+    for key, endpoint in stats["glpi_endpoints"].items():
+        method, path = key.split(" ", 1)
+        lines.extend(
+            _histogram_lines(
+                "mcp_glpi_glpi_request_latency_seconds",
+                endpoint["latency"],
+                method=method,
+                endpoint=path,
+            )
+        )
+
+    reserved = {"uptime_seconds", "pid", "tools", "glpi_endpoints", "workers"}
+    for name, component in stats.items():
+        if name in reserved or not isinstance(component, dict):
+            continue
+        for metric, value in _flatten_numbers(component, f"mcp_glpi_{name}"):
+            lines.append(f"{metric} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    escaped = (
+        '{}="{}"'.format(key, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for key, value in labels.items()
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _histogram_lines(name: str, histogram: Dict[str, Any], **labels: str) -> List[str]:
+    lines = [
+        f"{name}_bucket{_labels(**labels, le=le)} {count}"
+        for le, count in histogram["buckets"].items()
+    ]
+    lines.append(f"{name}_sum{_labels(**labels)} {histogram['sum_seconds']}")
+    lines.append(f"{name}_count{_labels(**labels)} {histogram['count']}")
+    return lines
+
+
+def _flatten_numbers(values: Dict[str, Any], prefix: str):
+    for key, value in values.items():
+        name = _metric_name_invalid.sub("_", f"{prefix}_{key}")
+        if isinstance(value, bool):
+            yield name, int(value)
+        elif isinstance(value, (int, float)):
+            yield name, value
+        elif isinstance(value, dict):
+            yield from _flatten_numbers(value, name)
+
+
+class MetricsExporter:
+    """Publishes metrics to a Prometheus text file and/or a local HTTP endpoint."""
+
+    def __init__(
+        self,
+        file_path: Optional[str] = None,
+        port: Optional[int] = None,
+        host: str = "127.0.0.1",
+        interval: float = 15.0,
+        stats_source: Callable[[], Dict[str, Any]] = collect_stats,
+    ):
+        self.file_path = file_path
+        self.stats_source = stats_source
+        self.port = port
+        self.host = host
+        self.interval = max(1.0, interval)
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def start(self) -> None:
+        if self.file_path:
+            thread = threading.Thread(
+                target=self._write_loop, name="mcp-glpi-metrics-file", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        if self.port:
+            self._server = ThreadingHTTPServer((self.host, self.port), _MetricsRequestHandler)
+            self._server.stats_source = self.stats_source
+            self._server.daemon_threads = True
+            thread = threading.Thread(
+                target=self._server.serve_forever, name="mcp-glpi-metrics-http", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+            logger.info("Metrics available at http://%s:%s/metrics", self.host, self.port)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        if self.file_path:
+            self.write_file()
+
+    def write_file(self) -> None:
+        if not self.file_path:
+            return
+        temp_path = f"{self.file_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            handle.write(render_prometheus(self.stats_source()))
+        os.replace(temp_path, self.file_path)
+
+    def _write_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.write_file()
+            except OSError:
+                logger.warning("Could not write metrics file %s", self.file_path, exc_info=True)
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802 - http.server API
+        stats_source = getattr(self.server, "stats_source", collect_stats)
+        if self.path.startswith("/metrics"):
+            body = render_prometheus(stats_source()).encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        elif self.path.startswith("/stats"):
+            body = json.dumps(stats_source(), default=str).encode("utf-8")
+            content_type = "application/json"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # noqa: A002 - http.server API
+        logger.debug("metrics endpoint: " + format, *args)
+
+
+def start_exporter_from_config(
+    config: Any, stats_source: Callable[[], Dict[str, Any]] = collect_stats
+) -> Optional[MetricsExporter]:
+    if not config.metrics_file and not config.metrics_port:
+        return None
+    exporter = MetricsExporter(
+        file_path=config.metrics_file,
+        port=config.metrics_port,
+        host=config.metrics_host,
+        interval=config.metrics_interval,
+        stats_source=stats_source,
+    )
+    exporter.start()
+    return exporter
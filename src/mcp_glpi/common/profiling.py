@@ -0,0 +1,166 @@
+"""Opt-in cProfile / tracemalloc profiling of sampled tool calls."""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import os
+import random
+import re
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+PROFILE_MODES = ("cpu", "memory", "both")
+_unsafe_filename = re.compile(r"[^a-zA-Z0-9_.-]")
+
+
+class ToolProfiler:
+    """Profiles a sample of tool calls and keeps the newest ``retention`` dumps."""
+
+    def __init__(
+        self,
+        directory: str,
+        sample_rate: float = 0.0,
+        tools: Iterable[str] = (),
+        mode: str = "cpu",
+        retention: int = 50,
+        top_allocations: int = 25,
+    ):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Invalid profile mode {mode!r}; expected one of {PROFILE_MODES}")
+        self.directory = Path(directory)
+        self.sample_rate = min(1.0, max(0.0, sample_rate))
+        self.tools = frozenset(tools)
+        self.mode = mode
+        self.retention = max(1, retention)
+        self.top_allocations = max(1, top_allocations)
+        # cProfile and tracemalloc are process-wide: profile one call at a time.
+        self._busy = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def should_profile(self, tool: str) -> bool:
+        if tool in self.tools:
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def run(self, tool: str, call: Callable[[], T]) -> T:
+        if not self._busy.acquire(blocking=False):
+            logger.debug("Skipping profile of %s: another call is being profiled", tool)
+            return call()
+        try:
+            return self._profile(tool, call)
+        finally:
+            self._busy.release()
+
+    def _profile(self, tool: str, call: Callable[[], T]) -> T:
+        cpu = cProfile.Profile() if self.mode in ("cpu", "both") else None
+        trace_memory = self.mode in ("memory", "both")
+        started_tracemalloc = trace_memory and not tracemalloc.is_tracing()
+        if started_tracemalloc:
+            tracemalloc.start()
+        start = time.perf_counter()
+        if cpu is not None:
+            cpu.enable()
+        try:
+            return call()
+        finally:
+            if cpu is not None:
+                cpu.disable()
+            duration = time.perf_counter() - start
+            snapshot = tracemalloc.take_snapshot() if trace_memory else None
+            if started_tracemalloc:
+                tracemalloc.stop()
+            try:
+                self._write(tool, duration, cpu, snapshot)
+            except OSError:
+                logger.warning("Could not write profile for %s", tool, exc_info=True)
+
+    def _write(
+        self,
+        tool: str,
+        duration: float,
+        cpu: Optional[cProfile.Profile],
+        snapshot: Optional[tracemalloc.Snapshot],
+    ) -> None:
+        stem = "{}_{}_{}".format(
+            time.strftime("%Y%m%dT%H%M%S"),
+            _unsafe_filename.sub("_", tool),
+            f"{os.getpid()}-{threading.get_ident()}-{time.monotonic_ns()}",
+        )
+        if cpu is not None:
+            path = self.directory / f"{stem}.prof"
+            cpu.dump_stats(str(path))
+            logger.info("Profiled %s in %.3fs: %s", tool, duration, path)
+            self._prune("*.prof")
+        if snapshot is not None:
+            path = self.directory / f"{stem}.alloc.txt"
+            path.write_text(self._allocation_report(tool, duration, snapshot), encoding="utf-8")
+            logger.info("Traced allocations of %s: %s", tool, path)
+            self._prune("*.alloc.txt")
+
+    def _allocation_report(
+        self, tool: str, duration: float, snapshot: tracemalloc.Snapshot
+    ) -> str:
+        snapshot = snapshot.filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            )
+        )
+        stats = snapshot.statistics("lineno")
+        total = sum(stat.size for stat in stats)
+        buffer = io.StringIO()
+        buffer.write(f"tool: {tool}\nduration_seconds: {duration:.6f}\n")
+        buffer.write(f"traced_bytes: {total}\n\n")
+        for index, stat in enumerate(stats[: self.top_allocations], start=1):
+            buffer.write(f"#{index} {stat}\n")
+        return buffer.getvalue()
+
+    def _prune(self, pattern: str) -> None:
+        dumps: List[Path] = sorted(
+            self.directory.glob(pattern), key=lambda path: (path.stat().st_mtime, path.name)
+        )
+        for path in dumps[: -self.retention]:
+            try:
+                path.unlink()
+            except OSError:
+                logger.debug("Could not remove old profile %s", path, exc_info=True)
+
+
+active_profiler: Optional[ToolProfiler] = None
+
+
+def install_profiler(profiler: Optional[ToolProfiler]) -> None:
+    global active_profiler
+    active_profiler = profiler
+
+
+def install_profiler_from_config(config: Any) -> Optional[ToolProfiler]:
+    if not config.profile_dir:
+        install_profiler(None)
+        return None
+    tools = [tool.strip() for tool in config.profile_tools.split(",") if tool.strip()]
+    profiler = ToolProfiler(
+        config.profile_dir,
+        sample_rate=config.profile_sample_rate,
+        tools=tools,
+        mode=config.profile_mode,
+        retention=config.profile_retention,
+        top_allocations=config.profile_top_allocations,
+    )
+    install_profiler(profiler)
+    logger.info(
+        "Profiling enabled (%s) into %s: sample_rate=%s tools=%s",
+        profiler.mode,
+        profiler.directory,
+        profiler.sample_rate,
+        sorted(profiler.tools),
+    )
+    return profiler
@@ -0,0 +1,87 @@
+"""Separate concurrency budgets for interactive and bulk tool calls."""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from typing import Any, Dict, Iterator
+
+import anyio
+
+from mcp_glpi.tool_catalog import BULK, INTERACTIVE
+
+from .metrics import register_stats_provider
+
+
+class WorkloadScheduler:
+    """Admits tool calls per workload and makes bulk work yield.
+
+    Each workload has its own thread limiter, so bulk calls queue among
+    themselves and never take the threads interactive calls need. While any
+    interactive call is running, every GLPI request of a bulk call waits up
+    to ``max_yield`` seconds for it to finish.
+    """
+
+    def __init__(self, interactive_slots: int = 32, bulk_slots: int = 2, max_yield: float = 1.0):
+        self._slots = {INTERACTIVE: interactive_slots, BULK: bulk_slots}
+        self._limiters: Dict[str, anyio.CapacityLimiter] = {}
+        self.max_yield = max_yield
+        self._condition = threading.Condition()
+        self._running = {INTERACTIVE: 0, BULK: 0}
+        self._admitted = {INTERACTIVE: 0, BULK: 0}
+        self._yields = 0
+        self._yield_seconds = 0.0
+
+    def configure(self, interactive_slots: int, bulk_slots: int, max_yield: float) -> None:
+        self._slots = {INTERACTIVE: max(1, interactive_slots), BULK: max(1, bulk_slots)}
+        self._limiters.clear()
+        self.max_yield = max_yield
+
+    def limiter(self, workload: str) -> anyio.CapacityLimiter:
+        """Thread limiter (and FIFO queue) of ``workload``."""
+
+        limiter = self._limiters.get(workload)
+        if limiter is None:
+            limiter = self._limiters[workload] = anyio.CapacityLimiter(self._slots[workload])
+        return limiter
+
+    @contextlib.contextmanager
+    def running(self, workload: str) -> Iterator[None]:
+        """Mark a call of ``workload`` as running in the current thread."""
+
+        with self._condition:
+            self._running[workload] += 1
+            self._admitted[workload] += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._running[workload] -= 1
+                if not self._running[INTERACTIVE]:
+                    self._condition.notify_all()
+
+    def yield_to_interactive(self) -> None:
+        """Wait (bounded) until no interactive call is running."""
+
+        with self._condition:
+            if not self._running[INTERACTIVE]:
+                return
+            started = time.monotonic()
+            self._condition.wait_for(lambda: not self._running[INTERACTIVE], self.max_yield)
+            self._yields += 1
+            self._yield_seconds += time.monotonic() - started
+
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "running": dict(self._running),
+                "admitted": dict(self._admitted),
+                "bulk_yields": self._yields,
+                "bulk_yield_seconds": round(self._yield_seconds, 3),
+            }
+
+
+tool_scheduler = WorkloadScheduler()
+
+register_stats_provider("scheduler", tool_scheduler.stats)
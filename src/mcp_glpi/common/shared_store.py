@@ -0,0 +1,118 @@
+"""SQLite (WAL) store shared by the worker processes of one server."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE TABLE IF NOT EXISTS worker_stats (
+    worker_id TEXT PRIMARY KEY,
+    pid INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    stats TEXT NOT NULL
+);
+"""
+
+
+class SharedStore:
+    """Cross-process cache entries and per-worker metric snapshots.
+
+    Each thread gets its own connection; WAL mode lets every worker read
+    while another one writes.
+    """
+
+    def __init__(self, path: str, worker_id: Optional[str] = None, timeout: float = 5.0):
+        self.path = path
+        self.worker_id = worker_id or str(os.getpid())
+        self.timeout = timeout
+        self._local = threading.local()
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        row = self._connect().execute(
+            "SELECT value, expires_at FROM kv WHERE namespace = ? AND key = ?",
+            (namespace, key),
+        ).fetchone()
+        if row is None or (row[1] is not None and row[1] < time.time()):
+            return None
+        return json.loads(row[0])
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + ttl if ttl else None
+        self._connect().execute(
+            "INSERT OR REPLACE INTO kv (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+            (namespace, key, json.dumps(value, separators=(",", ":")), expires_at),
+        )
+
+    def publish_stats(self, stats: Dict[str, Any]) -> None:
+        self._connect().execute(
+            "INSERT OR REPLACE INTO worker_stats (worker_id, pid, updated_at, stats)"
+            " VALUES (?, ?, ?, ?)",
+            (self.worker_id, os.getpid(), time.time(), json.dumps(stats, default=str)),
+        )
+
+    def worker_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Latest snapshot published by every worker, including retired ones."""
+
+        rows = self._connect().execute(
+            "SELECT worker_id, pid, updated_at, stats FROM worker_stats ORDER BY worker_id"
+        ).fetchall()
+        return {
+            worker_id: {"pid": pid, "updated_at": updated_at, "stats": json.loads(stats)}
+            for worker_id, pid, updated_at, stats in rows
+        }
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+active_store: Optional[SharedStore] = None
+
+
+def install_store(path: Optional[str], worker_id: Optional[str] = None) -> Optional[SharedStore]:
+    global active_store
+    active_store = SharedStore(path, worker_id) if path else None
+    if active_store is not None:
+        logger.info("Shared store %s for worker %s", path, active_store.worker_id)
+    return active_store
+
+
+def cluster_stats() -> Dict[str, Any]:
+    """Stats of this process, merged with every worker's when a store is active."""
+
+    from .metrics import collect_stats, merge_stats
+
+    local = collect_stats()
+    store = active_store
+    if store is None:
+        return local
+    store.publish_stats(local)
+    return merge_stats(store.worker_stats())
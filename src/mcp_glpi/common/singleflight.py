@@ -0,0 +1,86 @@
+"""Coalescing of identical tool calls that are in flight at the same time."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, Type, TypeVar
+
+from .metrics import register_stats_provider
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Runs one call per key and hands its result to concurrent duplicates.
+
+    Only calls that overlap in time are shared; nothing is cached once the
+    first call finishes. An exception raised by the leading call is raised
+    in every caller waiting on it, except for ``retry_on`` types: those are
+    specific to the leader (a cancelled client, for instance), so waiters
+    run the call again instead.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._stats = {"leaders": 0, "shared": 0}
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], T],
+        retry_on: Tuple[Type[BaseException], ...] = (),
+    ) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._stats["leaders"] += 1
+                leader = True
+            else:
+                call.waiters += 1
+                self._stats["shared"] += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if retry_on and isinstance(call.error, retry_on):
+                return self.do(key, fn, retry_on)
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            if call.waiters:
+                logger.debug("Shared one call with %s waiters", call.waiters)
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._calls)}
+
+
+read_calls = SingleFlight()
+
+register_stats_provider("singleflight", read_calls.stats)
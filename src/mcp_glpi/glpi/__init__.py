@@ -1,3 +1,10 @@
-from . import changes, session, tickets
+import importlib
 
-__all__ = ["changes", "session", "tickets"]
+__all__ = ["changes", "identity", "pool", "session", "tickets"]
+
+
+def __getattr__(name: str):
+    # Submodules pull in glpi_client and requests; load them on first use
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
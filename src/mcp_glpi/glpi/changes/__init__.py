@@ -12,15 +12,22 @@ from .common import (
     URGENCY_LABELS,
     ChangeCreationResult,
     ChangeList,
+    ChangeLookup,
     ChangeMutationResult,
     _normalize_enum_value,
 )
 from .create import create_change
 from .delete import delete_change
 from .links import link_ticket, unlink_ticket
-from .read import all_changes, fetch_changes, list_changes_as_table
+from .read import (
+    all_changes,
+    fetch_changes,
+    fetch_changes_by_ids,
+    get_changes,
+    list_changes_as_table,
+)
 from .solutions import add_solution
-from .update import update_change
+from .update import bulk_update_changes, update_change
 
 __all__ = [
     "DEFAULT_FIELDS",
@@ -31,6 +38,7 @@ __all__ = [
     "URGENCY_LABELS",
     "ChangeCreationResult",
     "ChangeList",
+    "ChangeLookup",
     "ChangeMutationResult",
     "_normalize_enum_value",
     "add_followup",
@@ -38,9 +46,12 @@ __all__ = [
     "all_changes",
     "assign_change_groups",
     "assign_change_users",
+    "bulk_update_changes",
     "create_change",
     "delete_change",
     "fetch_changes",
+    "fetch_changes_by_ids",
+    "get_changes",
     "link_ticket",
     "list_changes_as_table",
     "unlink_ticket",
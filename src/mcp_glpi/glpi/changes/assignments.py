@@ -23,7 +23,7 @@ def assign_change_users(
     payload_to_send = compact_payload(normalized)
 
     with open_handler() as handler:
-        response = handler.add_items("Change_User", payload_to_send)
+        response = handler.add_items_coalesced("Change_User", payload_to_send)
 
     return ChangeMutationResult(
         action="assign_change_users",
@@ -49,7 +49,7 @@ def assign_change_groups(
     payload_to_send = compact_payload(normalized)
 
     with open_handler() as handler:
-        response = handler.add_items("Change_Group", payload_to_send)
+        response = handler.add_items_coalesced("Change_Group", payload_to_send)
 
     return ChangeMutationResult(
         action="assign_change_groups",
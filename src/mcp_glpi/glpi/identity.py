@@ -0,0 +1,79 @@
+"""Per-client GLPI credentials for servers shared by several MCP clients."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Mapping, Optional
+
+USER_TOKEN_HEADER = "x-glpi-user-token"
+APP_TOKEN_HEADER = "x-glpi-app-token"
+ENTITY_HEADER = "x-glpi-entity"
+PROFILE_HEADER = "x-glpi-profile"
+
+
+@dataclass(frozen=True)
+class ClientCredentials:
+    """Credentials, active profile and entity sent by one MCP client.
+
+    Missing tokens fall back to the server configuration.
+    """
+
+    user_token: Optional[str] = None
+    app_token: Optional[str] = None
+    entity_id: Optional[int] = None
+    profile_id: Optional[int] = None
+
+
+_client_credentials: ContextVar[Optional[ClientCredentials]] = ContextVar(
+    "glpi_client_credentials", default=None
+)
+
+
+def current_credentials() -> Optional[ClientCredentials]:
+    return _client_credentials.get()
+
+
+@contextmanager
+def client_credentials(credentials: Optional[ClientCredentials]) -> Iterator[None]:
+    """Use ``credentials`` for every GLPI session opened in this context."""
+
+    token = _client_credentials.set(credentials)
+    try:
+        yield
+    finally:
+        _client_credentials.reset(token)
+
+
+def credentials_from_headers(headers: Mapping[str, str]) -> Optional[ClientCredentials]:
+    """Read client credentials from HTTP headers.
+
+    The user token comes from ``X-GLPI-User-Token`` or a GLPI style
+    ``Authorization: user_token <token>`` header. Returns None when the
+    request carries none of the supported headers.
+    """
+
+    user_token = headers.get(USER_TOKEN_HEADER)
+    if not user_token:
+        scheme, _, value = (headers.get("authorization") or "").partition(" ")
+        if scheme.lower() == "user_token" and value.strip():
+            user_token = value.strip()
+    app_token = headers.get(APP_TOKEN_HEADER) or None
+    entity_id = _int_header(headers, ENTITY_HEADER)
+    profile_id = _int_header(headers, PROFILE_HEADER)
+    if user_token is None and app_token is None and entity_id is None and profile_id is None:
+        return None
+    return ClientCredentials(
+        user_token=user_token, app_token=app_token, entity_id=entity_id, profile_id=profile_id
+    )
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    value = headers.get(name)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
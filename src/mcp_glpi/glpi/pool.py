@@ -0,0 +1,661 @@
+"""GLPI session reuse: per-identity pools and sessions shared by one scope."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from glpi_client import GLPIError, GLPIRequestError
+from glpi_client.utils import cancellation_shield, current_cancellation
+from glpi_client.core import (
+    RecordingTransport,
+    ReplayTransport,
+    SessionTokenStore,
+    set_default_token_store,
+    set_default_transport,
+)
+
+from ..common.config import get_config
+from ..common.metrics import register_stats_provider
+from .identity import current_credentials
+
+logger = logging.getLogger(__name__)
+
+_stats_lock = threading.Lock()
+_stats = {"handlers_opened": 0, "shared_sessions_opened": 0, "shared_borrows": 0}
+
+
+def _count(name: str) -> None:
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def session_stats() -> dict:
+    with _stats_lock:
+        return dict(_stats)
+
+
+class _BorrowedHandler:
+    """Context manager that lends a shared handler without closing its session."""
+
+    def __init__(self, handler: Any):
+        self._handler = handler
+
+    def __enter__(self):
+        return self._handler
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class SharedSession:
+    """Lazily opened GLPI session reused by every operation of a scope."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._handler: Optional[Any] = None
+        self._context: Optional[Any] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._handler is not None
+
+    def borrow(self, handler_cls: Callable[..., Any]) -> _BorrowedHandler:
+        with self._lock:
+            if self._handler is None:
+                self._context = open_session(handler_cls)
+                self._handler = self._context.__enter__()
+                _enable_write_coalescing(self._handler)
+                _count("shared_sessions_opened")
+                logger.debug("Opened shared GLPI session")
+        _count("shared_borrows")
+        return _BorrowedHandler(self._handler)
+
+    def close(self) -> None:
+        handler = self._handler
+        # Pending inserts and the session release run even for a cancelled call
+        with cancellation_shield():
+            try:
+                if handler is not None and hasattr(handler, "disable_write_coalescing"):
+                    # The handler may go back to a pool shared with one-off calls
+                    handler.disable_write_coalescing()
+            finally:
+                with self._lock:
+                    context, self._context, self._handler = self._context, None, None
+                if context is not None:
+                    context.__exit__(None, None, None)
+                    logger.debug("Closed shared GLPI session")
+
+
+_active_session: ContextVar[Optional[SharedSession]] = ContextVar(
+    "glpi_shared_session", default=None
+)
+
+
+class _ScopedHandler:
+    """Opens the wrapped handler's session and switches its profile and entity."""
+
+    def __init__(self, handler: Any, profile_id: Optional[int], entity_id: Optional[int]):
+        self._handler = handler
+        self._profile_id = profile_id
+        self._entity_id = entity_id
+
+    def __enter__(self):
+        handler = self._handler.__enter__()
+        try:
+            # Changing the profile resets the active entity, so it goes first
+            if self._profile_id is not None:
+                handler.change_active_profile(self._profile_id)
+            if self._entity_id is not None:
+                handler.change_active_entity(self._entity_id)
+        except BaseException:
+            self._handler.__exit__(None, None, None)
+            raise
+        return handler
+
+    def __exit__(self, exc_type, exc, tb):
+        return self._handler.__exit__(exc_type, exc, tb)
+
+
+def _login_credentials() -> Tuple[str, str, str, Optional[int], Optional[int]]:
+    """URL, app token, user token, profile and entity for the current client."""
+
+    config = get_config()
+    client = current_credentials()
+    if client is None:
+        return config.url, config.app_token, config.user_token, None, None
+    return (
+        config.url,
+        client.app_token or config.app_token,
+        client.user_token or config.user_token,
+        client.profile_id,
+        client.entity_id,
+    )
+
+
+def build_handler(handler_cls: Callable[..., Any]):
+    url, app_token, user_token, profile_id, entity_id = _login_credentials()
+    _count("handlers_opened")
+    handler = handler_cls(url, app_token, user_token, False)
+    if profile_id is not None or entity_id is not None:
+        return _ScopedHandler(handler, profile_id, entity_id)
+    return handler
+
+
+def session_identity() -> str:
+    """Stable digest of the credentials a new handler would log in with."""
+
+    credentials = "\0".join(str(part) for part in _login_credentials())
+    return hashlib.sha256(credentials.encode("utf-8")).hexdigest()[:16]
+
+
+def _session_invalid(exc: Optional[BaseException]) -> bool:
+    return isinstance(exc, GLPIRequestError) and exc.error_code == 401
+
+
+class _PooledSession:
+    """Open session and the profile/entity it was last switched to.
+
+    ``None`` means the context GLPI chose at login.
+    """
+
+    __slots__ = ("context", "handler", "last_used", "next_ping", "profile_id", "entity_id")
+
+    def __init__(self, context: Any, handler: Any):
+        self.context = context
+        self.handler = handler
+        self.last_used = time.monotonic()
+        self.next_ping = float("inf")
+        self.profile_id: Optional[int] = None
+        self.entity_id: Optional[int] = None
+
+    def _resets_profile(self, profile_id: Optional[int], entity_id: Optional[int]) -> bool:
+        # Selecting a profile again is also the only way back to its default entity
+        return profile_id is not None and (
+            profile_id != self.profile_id or (entity_id is None and self.entity_id is not None)
+        )
+
+    def switch_cost(self, profile_id: Optional[int], entity_id: Optional[int]) -> Optional[int]:
+        """Context switches needed to serve a call, or None if it cannot be."""
+
+        resets_profile = self._resets_profile(profile_id, entity_id)
+        if not resets_profile:
+            if profile_id is None and self.profile_id is not None:
+                return None
+            if entity_id is None and self.entity_id is not None:
+                return None
+        current_entity = None if resets_profile else self.entity_id
+        return int(resets_profile) + int(entity_id is not None and entity_id != current_entity)
+
+    def switch(self, profile_id: Optional[int], entity_id: Optional[int]) -> None:
+        if self._resets_profile(profile_id, entity_id):
+            self.handler.change_active_profile(profile_id)
+            self.profile_id, self.entity_id = profile_id, None
+        if entity_id is not None and entity_id != self.entity_id:
+            self.handler.change_active_entity(entity_id)
+            self.entity_id = entity_id
+
+
+class _Identity:
+    """Idle sessions and the concurrency cap of one GLPI login."""
+
+    def __init__(self, key: Tuple[Any, str, str, str], max_sessions: int):
+        self.key = key
+        self.slots = threading.BoundedSemaphore(max_sessions)
+        self.idle: List[_PooledSession] = []
+        # Leases holding or waiting for a session; pins the identity in the pool
+        self.leases = 0
+
+
+class _PooledHandler:
+    """Context manager that leases a pooled session for one operation."""
+
+    def __init__(self, pool: "SessionPool", handler_cls: Callable[..., Any]):
+        self._pool = pool
+        self._handler_cls = handler_cls
+        self._lease: Optional[Tuple[_Identity, _PooledSession]] = None
+
+    def __enter__(self):
+        self._lease = self._pool._checkout(self._handler_cls, *_login_credentials())
+        return self._lease[1].handler
+
+    def __exit__(self, exc_type, exc, tb):
+        identity, session = self._lease
+        self._lease = None
+        self._pool._checkin(identity, session, discard=_session_invalid(exc))
+        return False
+
+
+class SessionPool:
+    """GLPI sessions kept open between tool calls, one pool per identity.
+
+    An identity is the handler class plus URL, app token and user token,
+    so callers never receive a session opened with someone else's rights.
+    Each identity has at most ``max_sessions`` sessions leased at once;
+    further callers wait up to ``acquire_timeout`` seconds. The least
+    recently used idle identities are dropped beyond ``max_identities``,
+    and a background thread kills sessions idle for longer than
+    ``idle_timeout``.
+
+    With ``keepalive_interval`` set, the same thread pings idle sessions
+    (``getActiveProfile``) before GLPI can expire them and replaces the
+    ones it already dropped, so calls never land on a dead token. Pings
+    are spread with a random jitter of up to 20%.
+
+    Sessions remember the profile and entity they were switched to. A call
+    gets an idle session already in its context when there is one,
+    otherwise the one needing the fewest switches; the switched session
+    keeps its new context for later calls.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 4,
+        max_identities: int = 64,
+        idle_timeout: float = 300.0,
+        acquire_timeout: float = 30.0,
+        keepalive_interval: float = 0.0,
+    ):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self.max_sessions = max_sessions
+        self.max_identities = max(1, max_identities)
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self.keepalive_interval = keepalive_interval
+        self._lock = threading.Lock()
+        self._identities: "OrderedDict[Hashable, _Identity]" = OrderedDict()
+        self._closed = False
+        self._stop = threading.Event()
+        self._sweeper: Optional[threading.Thread] = None
+        self._stats = {
+            "opened": 0,
+            "reused": 0,
+            "waits": 0,
+            "discarded": 0,
+            "expired": 0,
+            "evicted": 0,
+            "context_switches": 0,
+            "keepalives": 0,
+            "refreshed": 0,
+        }
+
+    def lease(self, handler_cls: Callable[..., Any]) -> _PooledHandler:
+        return _PooledHandler(self, handler_cls)
+
+    def _checkout(
+        self,
+        handler_cls: Callable[..., Any],
+        url: str,
+        app_token: str,
+        user_token: str,
+        profile_id: Optional[int],
+        entity_id: Optional[int],
+    ) -> Tuple[_Identity, _PooledSession]:
+        key = (handler_cls, url, app_token, user_token)
+        with self._lock:
+            if self._closed:
+                raise GLPIError("GLPI session pool is closed")
+            identity = self._identities.get(key)
+            if identity is None:
+                identity = self._identities[key] = _Identity(key, self.max_sessions)
+            self._identities.move_to_end(key)
+            identity.leases += 1
+            evicted = self._evict_locked()
+        self._close(evicted)
+
+        if not identity.slots.acquire(blocking=False):
+            with self._lock:
+                self._stats["waits"] += 1
+            try:
+                acquired = self._wait_for_slot(identity)
+            except BaseException:
+                acquired = False
+                raise
+            finally:
+                if not acquired:
+                    with self._lock:
+                        identity.leases -= 1
+            if not acquired:
+                raise GLPIError(
+                    f"Timed out waiting for a GLPI session ({self.max_sessions} in use)"
+                )
+
+        with self._lock:
+            session = self._pick_locked(identity, profile_id, entity_id)
+            if session is not None:
+                self._stats["reused"] += 1
+        try:
+            if session is None:
+                session = self._open(key)
+            if session.switch_cost(profile_id, entity_id):
+                with self._lock:
+                    self._stats["context_switches"] += 1
+                session.switch(profile_id, entity_id)
+        except BaseException:
+            if session is not None:
+                # Its active context is unknown now
+                self._close([session])
+            identity.slots.release()
+            with self._lock:
+                identity.leases -= 1
+            raise
+        return identity, session
+
+    def _wait_for_slot(self, identity: _Identity) -> bool:
+        token = current_cancellation()
+        if token is None:
+            return identity.slots.acquire(timeout=self.acquire_timeout)
+        # Poll so a cancelled call stops waiting for a session
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            token.raise_if_cancelled()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if identity.slots.acquire(timeout=min(remaining, 0.05)):
+                return True
+
+    def _open(self, key: Tuple[Any, str, str, str]) -> _PooledSession:
+        handler_cls, url, app_token, user_token = key
+        _count("handlers_opened")
+        handler = handler_cls(url, app_token, user_token, False)
+        session = _PooledSession(handler, handler.__enter__())
+        with self._lock:
+            self._stats["opened"] += 1
+        self._start_sweeper()
+        return session
+
+    def _schedule_ping(self, session: _PooledSession) -> None:
+        if self.keepalive_interval > 0:
+            jitter = random.uniform(0.8, 1.0)
+            session.next_ping = time.monotonic() + self.keepalive_interval * jitter
+
+    @staticmethod
+    def _pick_locked(
+        identity: _Identity, profile_id: Optional[int], entity_id: Optional[int]
+    ) -> Optional[_PooledSession]:
+        best: Optional[_PooledSession] = None
+        best_cost: Optional[int] = None
+        # Most recently used first
+        for session in reversed(identity.idle):
+            cost = session.switch_cost(profile_id, entity_id)
+            if cost is not None and (best_cost is None or cost < best_cost):
+                best, best_cost = session, cost
+                if cost == 0:
+                    break
+        if best is not None:
+            identity.idle.remove(best)
+        return best
+
+    def _checkin(self, identity: _Identity, session: _PooledSession, discard: bool = False) -> None:
+        session.last_used = time.monotonic()
+        self._schedule_ping(session)
+        with self._lock:
+            identity.leases -= 1
+            if discard:
+                self._stats["discarded"] += 1
+            keep = not (discard or self._closed)
+            if keep:
+                identity.idle.append(session)
+        identity.slots.release()
+        if not keep:
+            self._close([session])
+
+    def _evict_locked(self) -> List[_PooledSession]:
+        evicted: List[_PooledSession] = []
+        if len(self._identities) <= self.max_identities:
+            return evicted
+        for key, identity in list(self._identities.items()):
+            if len(self._identities) <= self.max_identities:
+                break
+            if identity.leases:
+                continue
+            del self._identities[key]
+            evicted.extend(identity.idle)
+            self._stats["evicted"] += 1
+        return evicted
+
+    def expire_idle(self, now: Optional[float] = None) -> int:
+        """Kill sessions idle for longer than ``idle_timeout``; return how many."""
+
+        cutoff = (time.monotonic() if now is None else now) - self.idle_timeout
+        expired: List[_PooledSession] = []
+        with self._lock:
+            for key, identity in list(self._identities.items()):
+                fresh = [session for session in identity.idle if session.last_used > cutoff]
+                expired.extend(session for session in identity.idle if session.last_used <= cutoff)
+                identity.idle = fresh
+                if not fresh and not identity.leases:
+                    del self._identities[key]
+            self._stats["expired"] += len(expired)
+        self._close(expired)
+        return len(expired)
+
+    def keep_alive(self, now: Optional[float] = None) -> int:
+        """Ping idle sessions that are due and replace dead ones; return pings sent."""
+
+        now = time.monotonic() if now is None else now
+        due: List[Tuple[_Identity, _PooledSession]] = []
+        with self._lock:
+            for identity in self._identities.values():
+                for session in [s for s in identity.idle if s.next_ping <= now]:
+                    # Out of the idle list while pinging; the lease pins the identity
+                    identity.idle.remove(session)
+                    identity.leases += 1
+                    due.append((identity, session))
+        for identity, session in due:
+            fresh = self._refresh(identity, session)
+            with self._lock:
+                identity.leases -= 1
+                if fresh is not None and not self._closed:
+                    # Keepalives do not count as use: it stays least preferred
+                    identity.idle.insert(0, fresh)
+                    fresh = None
+            if fresh is not None:
+                self._close([fresh])
+        return len(due)
+
+    def _refresh(self, identity: _Identity, session: _PooledSession) -> Optional[_PooledSession]:
+        with self._lock:
+            self._stats["keepalives"] += 1
+        try:
+            alive = session.handler.is_session_active()
+        except Exception:
+            alive = False
+        if alive:
+            self._schedule_ping(session)
+            return session
+
+        logger.info("Pooled GLPI session expired; opening a replacement")
+        self._close([session])
+        replacement = None
+        try:
+            replacement = self._open(identity.key)
+            replacement.switch(session.profile_id, session.entity_id)
+        except Exception:
+            logger.warning("Could not replace an expired GLPI session", exc_info=True)
+            if replacement is not None:
+                self._close([replacement])
+            return None
+        replacement.last_used = session.last_used
+        self._schedule_ping(replacement)
+        with self._lock:
+            self._stats["refreshed"] += 1
+        return replacement
+
+    def _start_sweeper(self) -> None:
+        if self._sweeper is not None or (self.idle_timeout <= 0 and self.keepalive_interval <= 0):
+            return
+        with self._lock:
+            if self._sweeper is not None:
+                return
+            self._sweeper = threading.Thread(
+                target=self._sweep, name="glpi-session-pool", daemon=True
+            )
+        self._sweeper.start()
+
+    def _sweep(self) -> None:
+        periods = [self.idle_timeout / 2, self.keepalive_interval / 4]
+        interval = min(max(min(p for p in periods if p > 0), 1.0), 60.0)
+        while not self._stop.wait(interval):
+            try:
+                if self.idle_timeout > 0:
+                    self.expire_idle()
+                if self.keepalive_interval > 0:
+                    self.keep_alive()
+            except Exception:  # pragma: no cover - defensive
+                logger.warning("GLPI session pool maintenance failed", exc_info=True)
+
+    def _close(self, sessions: List[_PooledSession]) -> None:
+        if len(sessions) > 1:
+            # killSession round trips are independent; do not pay them in series
+            workers = min(len(sessions), 8)
+            with ThreadPoolExecutor(workers, thread_name_prefix="glpi-session-close") as executor:
+                list(executor.map(self._close_one, sessions))
+        elif sessions:
+            self._close_one(sessions[0])
+
+    @staticmethod
+    def _close_one(session: _PooledSession) -> None:
+        try:
+            flush = getattr(session.handler, "flush_writes", None)
+            if flush is not None:
+                flush()
+            session.context.__exit__(None, None, None)
+        except Exception:
+            logger.warning("Failed to close pooled GLPI session", exc_info=True)
+
+    def close(self) -> None:
+        """Kill every idle session; sessions still leased are killed on return."""
+
+        with self._lock:
+            self._closed = True
+            idle = [session for identity in self._identities.values() for session in identity.idle]
+            self._identities.clear()
+        self._stop.set()
+        self._close(idle)
+        if idle:
+            logger.info("Closed %s pooled GLPI sessions", len(idle))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "identities": len(self._identities),
+                "idle": sum(len(identity.idle) for identity in self._identities.values()),
+                "leased": sum(identity.leases for identity in self._identities.values()),
+            }
+
+
+_pool_lock = threading.Lock()
+_session_pool: Optional[SessionPool] = None
+
+
+def session_pool() -> Optional[SessionPool]:
+    """Process wide pool built from the config; None when pooling is off."""
+
+    global _session_pool
+    if _session_pool is None:
+        config = get_config()
+        if config.session_pool_size <= 0:
+            return None
+        with _pool_lock:
+            if _session_pool is None:
+                _session_pool = SessionPool(
+                    max_sessions=config.session_pool_size,
+                    max_identities=config.session_pool_identities,
+                    idle_timeout=config.session_idle_timeout,
+                    acquire_timeout=config.session_acquire_timeout,
+                    keepalive_interval=config.session_keepalive_interval,
+                )
+    return _session_pool
+
+
+def close_session_pool() -> None:
+    global _session_pool
+    with _pool_lock:
+        pool, _session_pool = _session_pool, None
+    if pool is not None:
+        pool.close()
+
+
+def _pool_stats() -> Dict[str, Any]:
+    pool = _session_pool
+    return pool.stats() if pool is not None else {}
+
+
+def open_session(handler_cls: Callable[..., Any]):
+    """Context manager yielding a logged in handler, pooled when enabled."""
+
+    pool = session_pool()
+    if pool is not None:
+        return pool.lease(handler_cls)
+    return build_handler(handler_cls)
+
+
+def _enable_write_coalescing(handler: Any) -> None:
+    config = get_config()
+    if config.write_coalesce_window_ms <= 0 or not hasattr(handler, "enable_write_coalescing"):
+        return
+    handler.enable_write_coalescing(
+        window=config.write_coalesce_window_ms / 1000.0,
+        max_batch=config.write_coalesce_max_batch,
+    )
+
+
+def install_transport_from_config(config: Any) -> None:
+    if config.transport == "live":
+        set_default_transport(None)
+        return
+    if not config.cassette:
+        raise ValueError(f"GLPI_CASSETTE is required for transport {config.transport!r}")
+    if config.transport == "record":
+        transport = RecordingTransport(config.cassette)
+    else:
+        transport = ReplayTransport(config.cassette, latency_scale=config.replay_latency_scale)
+    set_default_transport(lambda: transport)
+    logger.info("GLPI transport %s using cassette %s", config.transport, config.cassette)
+
+
+def install_token_store_from_config(config: Any) -> None:
+    if not config.session_store:
+        set_default_token_store(None)
+        return
+    set_default_token_store(SessionTokenStore(config.session_store, config.session_store_key))
+    logger.info("GLPI session tokens persisted in %s", config.session_store)
+
+
+def reuse_or_build_handler(handler_cls: Callable[..., Any]):
+    shared = _active_session.get()
+    if shared is not None:
+        return shared.borrow(handler_cls)
+    return open_session(handler_cls)
+
+
+@contextmanager
+def shared_session() -> Iterator[SharedSession]:
+    current = _active_session.get()
+    if current is not None:
+        yield current
+        return
+
+    session = SharedSession()
+    token = _active_session.set(session)
+    try:
+        yield session
+    finally:
+        _active_session.reset(token)
+        session.close()
+
+
+register_stats_provider("sessions", session_stats)
+register_stats_provider("session_pool", _pool_stats)
@@ -2,14 +2,13 @@
 
 from glpi_client import RequestHandler as GLPIRequestHandler
 
-from ...common.config import get_config
+from ..pool import reuse_or_build_handler
 
 
 def open_handler():
     from . import RequestHandler
 
-    config = get_config()
-    return RequestHandler(config.url, config.app_token, config.user_token, False)
+    return reuse_or_build_handler(RequestHandler)
 
 
 RequestHandler = GLPIRequestHandler
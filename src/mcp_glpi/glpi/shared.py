@@ -2,11 +2,39 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from glpi_client import ResponseRange
 
+from ..common import shared_store
+from ..common.metrics import register_stats_provider
+
+# Search option ids shared by every CommonITILObject (Ticket, Change, Problem)
+ITIL_SEARCH_OPTIONS: Dict[str, int] = {
+    "name": 1,
+    "id": 2,
+    "priority": 3,
+    "urgency": 10,
+    "impact": 11,
+    "status": 12,
+    "date": 15,
+    "closedate": 16,
+    "solvedate": 17,
+    "date_mod": 19,
+    "content": 21,
+}
+
+MAX_BULK_ITEMS = 1000
+BULK_CHUNK_SIZE = 50
+BULK_CREATE_CHUNK_SIZE = 25
+BULK_MAX_WORKERS = 4
+
+_search_options_cache: Dict[Tuple[str, str], Dict[str, int]] = {}
+_search_options_lock = threading.Lock()
+_search_options_stats = {"hits": 0, "misses": 0, "shared_hits": 0}
+
 
 def normalize_label_key(value: str) -> str:
     return "".join(ch for ch in value.lower() if ch.isalnum())
@@ -45,6 +73,21 @@ def ensure_optional_dict(value: Any, field_name: str) -> Optional[Dict[str, Any]
     raise ValueError(f"{field_name} must be an object if provided")
 
 
+def normalize_id_list(value: Any, field_name: str) -> List[int]:
+    if value is None:
+        raise ValueError(f"{field_name} is required")
+    if isinstance(value, (int, float, str)) and not isinstance(value, bool):
+        raw_values: List[Any] = [value]
+    elif isinstance(value, Iterable) and not isinstance(value, dict):
+        raw_values = list(value)
+    else:
+        raise ValueError(f"{field_name} must be a list of identifiers")
+    if not raw_values:
+        raise ValueError(f"{field_name} cannot be empty")
+    ids = [ensure_positive_int(item, field_name) for item in raw_values]
+    return list(dict.fromkeys(ids))
+
+
 def prepare_bool_flag(value: Any) -> Any:
     if isinstance(value, bool):
         return 1 if value else 0
@@ -87,6 +130,26 @@ def normalize_enum_value(
     raise ValueError(f"Unsupported value for {field_name}: {value}")
 
 
+class EnumResolver:
+    """Memoizes enum normalization so repeated labels are resolved only once."""
+
+    def __init__(self, enum_fields: Dict[str, Dict[int, str]]):
+        self._enum_fields = enum_fields
+        self._cache: Dict[Tuple[str, Any], Optional[int]] = {}
+
+    def resolve(self, field_name: str, value: Any) -> Optional[int]:
+        key = (field_name, value)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return normalize_enum_value(value, self._enum_fields[field_name], field_name)
+        resolved = normalize_enum_value(value, self._enum_fields[field_name], field_name)
+        self._cache[key] = resolved
+        return resolved
+
+
 def translate_enum(value: Any, labels: Dict[int, str]) -> Any:
     try:
         return labels[int(value)]
@@ -105,6 +168,70 @@ def range_to_dict(range_: Optional[ResponseRange]) -> Optional[Dict[str, int]]:
     }
 
 
+def resolve_search_option_ids(
+    handler: Any,
+    item_type: str,
+    fields: Sequence[str],
+) -> List[int]:
+    option_ids: List[int] = []
+    unknown: List[str] = []
+    for name in fields:
+        if name in ITIL_SEARCH_OPTIONS:
+            option_ids.append(ITIL_SEARCH_OPTIONS[name])
+        else:
+            unknown.append(name)
+    if unknown:
+        options = _load_search_options(handler, item_type)
+        option_ids.extend(options[name] for name in unknown if name in options)
+    return list(dict.fromkeys(option_ids))
+
+
+def _load_search_options(handler: Any, item_type: str) -> Dict[str, int]:
+    cache_key = (getattr(handler, "host_url", ""), item_type)
+    with _search_options_lock:
+        cached = _search_options_cache.get(cache_key)
+        _search_options_stats["hits" if cached is not None else "misses"] += 1
+    if cached is not None:
+        return cached
+
+    store = shared_store.active_store
+    store_key = "|".join(cache_key)
+    if store is not None:
+        options = store.get("search_options", store_key)
+        if options is not None:
+            with _search_options_lock:
+                _search_options_cache[cache_key] = options
+                _search_options_stats["shared_hits"] += 1
+            return options
+
+    options: Dict[str, int] = {}
+    prefix = f"{item_type}."
+    for key, option in handler.get_search_options(item_type).items():
+        if not str(key).isdecimal() or not isinstance(option, dict):
+            continue
+        uid = option.get("uid") or ""
+        if uid.startswith(prefix):
+            options.setdefault(uid[len(prefix):], int(key))
+    with _search_options_lock:
+        _search_options_cache[cache_key] = options
+    if store is not None:
+        store.set("search_options", store_key, options)
+    return options
+
+
+def cache_stats() -> Dict[str, Any]:
+    with _search_options_lock:
+        return {
+            "search_options": {
+                **_search_options_stats,
+                "entries": len(_search_options_cache),
+            }
+        }
+
+
+register_stats_provider("caches", cache_stats)
+
+
 def merge_non_null_values(
     payload: Dict[str, Any],
     additional_fields: Optional[Dict[str, Any]],
@@ -146,6 +273,61 @@ def normalize_update_fields(
     return sanitized
 
 
+def normalize_bulk_updates(
+    updates: Any,
+    enum_fields: Dict[str, Dict[int, str]],
+    *,
+    id_field: str,
+    ids: Any = None,
+    fields: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    if updates is not None and (ids is not None or fields is not None):
+        raise ValueError("use either updates or ids with fields, not both")
+
+    entries: List[Tuple[Any, Any]] = []
+    if updates is None:
+        if ids is None or fields is None:
+            raise ValueError("updates or ids with fields are required")
+        shared = normalize_update_fields(fields, enum_fields)
+        payloads = [{"id": item_id, **shared} for item_id in normalize_id_list(ids, "ids")]
+    else:
+        if isinstance(updates, dict):
+            entries = list(updates.items())
+        elif isinstance(updates, (list, tuple)):
+            for index, entry in enumerate(updates, start=1):
+                if not isinstance(entry, dict):
+                    raise ValueError(f"update #{index} must be an object")
+                working = dict(entry)
+                item_id = None
+                for key in (id_field, "id"):
+                    if key in working:
+                        item_id = working.pop(key)
+                        break
+                entry_fields = working.pop("fields", working)
+                entries.append((item_id, entry_fields))
+        else:
+            raise ValueError("updates must be a list or an object keyed by id")
+        if not entries:
+            raise ValueError("updates cannot be empty")
+
+        payloads = []
+        seen = set()
+        for index, (item_id, entry_fields) in enumerate(entries, start=1):
+            item_id_int = ensure_positive_int(item_id, f"{id_field} of update #{index}")
+            if item_id_int in seen:
+                raise ValueError(f"{id_field} {item_id_int} is repeated")
+            seen.add(item_id_int)
+            try:
+                sanitized = normalize_update_fields(entry_fields, enum_fields)
+            except ValueError as err:
+                raise ValueError(f"update #{index} ({id_field}={item_id_int}): {err}") from err
+            payloads.append({"id": item_id_int, **sanitized})
+
+    if len(payloads) > MAX_BULK_ITEMS:
+        raise ValueError(f"cannot process more than {MAX_BULK_ITEMS} items at once")
+    return payloads
+
+
 def normalize_actor_entries(
     item_id: int,
     entries: Union[Dict[str, Any], Sequence[Any], Any],
@@ -247,6 +429,24 @@ class EntityList:
         return "\n".join(table_lines)
 
 
+@dataclass
+class EntityLookup(EntityList):
+    missing: List[int] = field(default_factory=list)
+
+    def as_dict(self, fields: Sequence[str]) -> Dict[str, Any]:
+        return {
+            self.item_key: [self.prepare_item(item, fields) for item in self.items],
+            "missing": list(self.missing),
+        }
+
+    def to_table(self, fields: Sequence[str]) -> str:
+        table = super().to_table(fields)
+        if not self.missing:
+            return table
+        missing = ", ".join(str(item_id) for item_id in self.missing)
+        return f"{table}\n\nMissing: {missing}"
+
+
 @dataclass
 class EntityCreationResult:
     entity_label: str
@@ -292,3 +492,27 @@ class EntityMutationResult:
 
     def summary(self) -> str:
         return self.description
+
+
+@dataclass
+class EntityBulkResult:
+    action: str
+    entity_label: str
+    verb: str
+    payloads: List[Dict[str, Any]]
+    outcomes: List[Dict[str, Any]]
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for outcome in self.outcomes if outcome.get("ok"))
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "action": self.action,
+            "succeeded": self.succeeded,
+            "failed": len(self.outcomes) - self.succeeded,
+            "results": self.outcomes,
+        }
+
+    def summary(self) -> str:
+        return f"{self.verb} {self.succeeded} of {len(self.outcomes)} {self.entity_label}(s)"
@@ -12,15 +12,22 @@ from .common import (
     URGENCY_LABELS,
     TicketCreationResult,
     TicketList,
+    TicketLookup,
     TicketMutationResult,
     _normalize_enum_value,
 )
-from .create import create_ticket
+from .create import build_ticket_payload, bulk_create_tickets, create_ticket
 from .delete import delete_ticket
 from .links import link_change, unlink_change
-from .read import all_tickets, fetch_tickets, list_tickets_as_table
+from .read import (
+    all_tickets,
+    fetch_tickets,
+    fetch_tickets_by_ids,
+    get_tickets,
+    list_tickets_as_table,
+)
 from .solutions import add_solution
-from .update import update_ticket
+from .update import bulk_update_tickets, update_ticket
 
 __all__ = [
     "DEFAULT_FIELDS",
@@ -31,6 +38,7 @@ __all__ = [
     "URGENCY_LABELS",
     "TicketCreationResult",
     "TicketList",
+    "TicketLookup",
     "TicketMutationResult",
     "_normalize_enum_value",
     "add_followup",
@@ -38,9 +46,14 @@ __all__ = [
     "all_tickets",
     "assign_ticket_groups",
     "assign_ticket_users",
+    "build_ticket_payload",
+    "bulk_create_tickets",
+    "bulk_update_tickets",
     "create_ticket",
     "delete_ticket",
     "fetch_tickets",
+    "fetch_tickets_by_ids",
+    "get_tickets",
     "link_change",
     "list_tickets_as_table",
     "unlink_change",
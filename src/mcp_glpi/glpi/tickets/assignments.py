@@ -23,7 +23,7 @@ def assign_ticket_users(
     payload_to_send = compact_payload(normalized)
 
     with open_handler() as handler:
-        response = handler.add_items("Ticket_User", payload_to_send)
+        response = handler.add_items_coalesced("Ticket_User", payload_to_send)
 
     return TicketMutationResult(
         action="assign_ticket_users",
@@ -49,7 +49,7 @@ def assign_ticket_groups(
     payload_to_send = compact_payload(normalized)
 
     with open_handler() as handler:
-        response = handler.add_items("Group_Ticket", payload_to_send)
+        response = handler.add_items_coalesced("Group_Ticket", payload_to_send)
 
     return TicketMutationResult(
         action="assign_ticket_groups",
@@ -29,7 +29,7 @@ def add_followup(
     merge_non_null_values(payload, additional_fields)
 
     with open_handler() as handler:
-        response = handler.add_items("ITILFollowup", payload)
+        response = handler.add_items_coalesced("ITILFollowup", payload)
 
     return TicketMutationResult(
         action="add_ticket_comment",
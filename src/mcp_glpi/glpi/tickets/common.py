@@ -7,8 +7,15 @@ from typing import Any, Dict, Optional, Sequence
 
 from glpi_client import RequestHandler as GLPIRequestHandler
 
-from ...common.config import get_config
-from ..shared import EntityCreationResult, EntityList, EntityMutationResult, normalize_enum_value, translate_enum
+from ..pool import reuse_or_build_handler
+from ..shared import (
+    EntityCreationResult,
+    EntityList,
+    EntityLookup,
+    EntityMutationResult,
+    normalize_enum_value,
+    translate_enum,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -64,8 +71,7 @@ ENUM_FIELDS = {
 def open_handler():
     from . import RequestHandler
 
-    config = get_config()
-    return RequestHandler(config.url, config.app_token, config.user_token, False)
+    return reuse_or_build_handler(RequestHandler)
 
 
 def prepare_ticket(ticket: Dict[str, Any], fields: Sequence[str]) -> Dict[str, Any]:
@@ -103,6 +109,23 @@ class TicketList(EntityList):
         return super().to_table(fields)
 
 
+class TicketLookup(EntityLookup):
+    def __init__(self, items, missing):
+        super().__init__(
+            item_key="tickets",
+            items=items,
+            response_range=None,
+            prepare_item=prepare_ticket,
+            missing=missing,
+        )
+
+    def as_dict(self, fields: Sequence[str] = DEFAULT_FIELDS) -> Dict[str, Any]:
+        return super().as_dict(fields)
+
+    def to_table(self, fields: Sequence[str] = DEFAULT_FIELDS) -> str:
+        return super().to_table(fields)
+
+
 class TicketCreationResult(EntityCreationResult):
     def __init__(self, payload: Dict[str, Any], response: Dict[str, Any]):
         super().__init__(entity_label="Ticket", payload=payload, response=response)
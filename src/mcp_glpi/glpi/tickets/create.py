@@ -2,21 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional, Union
-
-from ..shared import merge_non_null_values, normalize_enum_value
-from .common import (
-    IMPACT_LABELS,
-    PRIORITY_LABELS,
-    STATUS_LABELS,
-    URGENCY_LABELS,
-    TicketCreationResult,
-    logger,
-    open_handler,
+from typing import Any, Dict, Optional, Sequence, Union
+
+from ..shared import (
+    BULK_CREATE_CHUNK_SIZE,
+    BULK_MAX_WORKERS,
+    MAX_BULK_ITEMS,
+    EntityBulkResult,
+    EnumResolver,
+    merge_non_null_values,
 )
+from .common import ENUM_FIELDS, TicketCreationResult, logger, open_handler
 
 
-def create_ticket(
+def build_ticket_payload(
     name: str,
     content: str = "",
     *,
@@ -27,7 +26,8 @@ def create_ticket(
     category_id: Optional[int] = None,
     entity_id: Optional[int] = None,
     additional_fields: Optional[Dict[str, object]] = None,
-) -> TicketCreationResult:
+    enums: Optional[EnumResolver] = None,
+) -> Dict[str, object]:
     if not name or not name.strip():
         raise ValueError("name is required to create a ticket")
 
@@ -36,15 +36,16 @@ def create_ticket(
         "content": content or "",
     }
 
+    resolver = enums or EnumResolver(ENUM_FIELDS)
     try:
-        if status is not None:
-            payload["status"] = normalize_enum_value(status, STATUS_LABELS, "status")
-        if impact is not None:
-            payload["impact"] = normalize_enum_value(impact, IMPACT_LABELS, "impact")
-        if priority is not None:
-            payload["priority"] = normalize_enum_value(priority, PRIORITY_LABELS, "priority")
-        if urgency is not None:
-            payload["urgency"] = normalize_enum_value(urgency, URGENCY_LABELS, "urgency")
+        for field_name, value in (
+            ("status", status),
+            ("impact", impact),
+            ("priority", priority),
+            ("urgency", urgency),
+        ):
+            if value is not None:
+                payload[field_name] = resolver.resolve(field_name, value)
     except ValueError as exc:
         logger.debug("Enum normalization failed: %s", exc)
         raise
@@ -55,8 +56,86 @@ def create_ticket(
         payload["entities_id"] = int(entity_id)
 
     merge_non_null_values(payload, additional_fields)
+    return payload
+
+
+def create_ticket(
+    name: str,
+    content: str = "",
+    *,
+    status: Optional[Union[int, str]] = None,
+    impact: Optional[Union[int, str]] = None,
+    priority: Optional[Union[int, str]] = None,
+    urgency: Optional[Union[int, str]] = None,
+    category_id: Optional[int] = None,
+    entity_id: Optional[int] = None,
+    additional_fields: Optional[Dict[str, object]] = None,
+) -> TicketCreationResult:
+    payload = build_ticket_payload(
+        name,
+        content,
+        status=status,
+        impact=impact,
+        priority=priority,
+        urgency=urgency,
+        category_id=category_id,
+        entity_id=entity_id,
+        additional_fields=additional_fields,
+    )
 
     with open_handler() as handler:
         response = handler.create_ticket(**payload)
 
     return TicketCreationResult(payload=payload, response=response)
+
+
+def bulk_create_tickets(
+    tickets: Sequence[Dict[str, Any]],
+    *,
+    chunk_size: int = BULK_CREATE_CHUNK_SIZE,
+    max_workers: int = BULK_MAX_WORKERS,
+) -> EntityBulkResult:
+    if not isinstance(tickets, (list, tuple)) or not tickets:
+        raise ValueError("tickets must be a non-empty list")
+    if len(tickets) > MAX_BULK_ITEMS:
+        raise ValueError(f"cannot process more than {MAX_BULK_ITEMS} items at once")
+
+    enums = EnumResolver(ENUM_FIELDS)
+    payloads = []
+    for index, entry in enumerate(tickets, start=1):
+        if not isinstance(entry, dict):
+            raise ValueError(f"ticket #{index} must be an object")
+        name = entry.get("name")
+        content = entry.get("content")
+        try:
+            payloads.append(
+                build_ticket_payload(
+                    None if name is None else str(name),
+                    "" if content is None else str(content),
+                    status=entry.get("status"),
+                    impact=entry.get("impact"),
+                    priority=entry.get("priority"),
+                    urgency=entry.get("urgency"),
+                    category_id=entry.get("category_id"),
+                    entity_id=entry.get("entity_id"),
+                    additional_fields=entry.get("additional"),
+                    enums=enums,
+                )
+            )
+        except (TypeError, ValueError) as err:
+            raise ValueError(f"ticket #{index}: {err}") from err
+
+    with open_handler() as handler:
+        outcomes = handler.create_tickets(
+            payloads,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+        )
+
+    return EntityBulkResult(
+        action="bulk_create_tickets",
+        entity_label="ticket",
+        verb="Created",
+        payloads=payloads,
+        outcomes=outcomes,
+    )
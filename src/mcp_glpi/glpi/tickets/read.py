@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Optional, Sequence, Union
 
 from glpi_client import ResponseRange, SortOrder
 
-from .common import DEFAULT_FIELDS, TicketList, open_handler
+from ..shared import normalize_id_list, resolve_search_option_ids
+from .common import DEFAULT_FIELDS, TicketList, TicketLookup, open_handler
 
 
 def fetch_tickets(
@@ -19,21 +20,27 @@ def fetch_tickets(
     include_deleted: bool = False,
 ) -> TicketList:
     order_enum = SortOrder(order) if isinstance(order, str) else order
-    range_tuple: Optional[Tuple[int, int]] = None
-    if limit is not None and limit > 0:
-        range_tuple = (offset, offset + limit - 1)
     filters_to_use = filters or None
+    options = dict(
+        expand_dropdowns=expand_dropdowns,
+        sort_by=sort_by,
+        order=order_enum,
+        filter_by=filters_to_use,
+        is_deleted=include_deleted,
+    )
+    paged = limit is not None and limit > 0
     with open_handler() as handler:
-        items = handler.get_many_items(
-            "Ticket",
-            expand_dropdowns=expand_dropdowns,
-            sort_by=sort_by,
-            order=order_enum,
-            range_=range_tuple,
-            filter_by=filters_to_use,
-            is_deleted=include_deleted,
-        )
+        if paged:
+            # Limits above GLPI's Accept-Range span several pages
+            items = handler.get_many_items_paged("Ticket", offset, limit, **options)
+        else:
+            items = handler.get_many_items("Ticket", **options)
         response_range: Optional[ResponseRange] = getattr(handler, "response_range", None)
+    if paged and response_range is not None:
+        # Report the whole span fetched, not just its last page
+        response_range = ResponseRange(
+            offset, response_range.end, response_range.count, response_range.max
+        )
     return TicketList(items=items, response_range=response_range)
 
 
@@ -86,3 +93,30 @@ def all_tickets(
     if output == "raw":
         return ticket_list.items
     return ticket_list.as_dict(selected_fields)
+
+
+def fetch_tickets_by_ids(
+    ids: Any,
+    fields: Optional[Sequence[str]] = None,
+) -> TicketLookup:
+    id_list = normalize_id_list(ids, "ids")
+    selected_fields = fields or DEFAULT_FIELDS
+    with open_handler() as handler:
+        option_ids = resolve_search_option_ids(handler, "Ticket", selected_fields)
+        result = handler.get_items_by_ids("Ticket", id_list, fields=option_ids)
+    return TicketLookup(items=result["items"], missing=result["missing"])
+
+
+def get_tickets(
+    ids: Any,
+    output: str = "dict",
+    fields: Optional[Sequence[str]] = None,
+):
+    lookup = fetch_tickets_by_ids(ids, fields=fields)
+
+    selected_fields = fields or DEFAULT_FIELDS
+    if output == "table":
+        return lookup.to_table(selected_fields)
+    if output == "raw":
+        return {"tickets": lookup.items, "missing": lookup.missing}
+    return lookup.as_dict(selected_fields)
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from ..shared import ensure_positive_int, normalize_update_fields
+from ..shared import (
+    BULK_CHUNK_SIZE,
+    BULK_MAX_WORKERS,
+    EntityBulkResult,
+    ensure_positive_int,
+    normalize_bulk_updates,
+    normalize_update_fields,
+)
 from .common import ENUM_FIELDS, TicketMutationResult, open_handler
 
 
@@ -26,3 +33,36 @@ def update_ticket(
         payload=payload,
         response=response,
     )
+
+
+def bulk_update_tickets(
+    updates: Any = None,
+    *,
+    ids: Any = None,
+    fields: Optional[Dict[str, Any]] = None,
+    chunk_size: int = BULK_CHUNK_SIZE,
+    max_workers: int = BULK_MAX_WORKERS,
+) -> EntityBulkResult:
+    payloads = normalize_bulk_updates(
+        updates,
+        ENUM_FIELDS,
+        id_field="ticket_id",
+        ids=ids,
+        fields=fields,
+    )
+
+    with open_handler() as handler:
+        outcomes = handler.update_items_chunked(
+            "Ticket",
+            payloads,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+        )
+
+    return EntityBulkResult(
+        action="bulk_update_tickets",
+        entity_label="ticket",
+        verb="Updated",
+        payloads=payloads,
+        outcomes=outcomes,
+    )
@@ -1,18 +1,25 @@
 #!/usr/bin/env python3
-"""MCP server exposing GLPI tools over stdio."""
+"""MCP server exposing GLPI tools over stdio or streamable HTTP."""
 
 import asyncio
+import contextlib
+import json
 import logging
-from typing import Any, Dict, List, Sequence
+import os
+import signal
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
 
+import anyio
 import click
 import mcp.server
 import mcp.server.stdio
 import mcp.types as types
 from mcp.server.models import InitializationOptions
 
-import mcp_glpi.GLPITools as GLPITools
-import mcp_glpi.GLPiHandler as GLPiHandler
+from mcp_glpi.tool_catalog import TOOL_SPECS, compile_catalog
 
 
 SERVER_VERSION = "2.0.0"
@@ -35,20 +42,161 @@ class GLPIMCPServer:
     """MCP server entry point."""
 
     def __init__(self):
-        self.app = mcp.server.Server("mcp-glpi")
+        self.app = mcp.server.Server("mcp-glpi", version=SERVER_VERSION)
+        self._list_tools_result: Optional[types.ServerResult] = None
         self._setup_handlers()
 
     def _setup_handlers(self) -> None:
         @self.app.list_tools()
-        async def handle_list_tools() -> List[types.Tool]:
-            return GLPITools.tools
+        async def handle_list_tools() -> types.ListToolsResult:
+            return compile_catalog().result
 
-        @self.app.call_tool()
+        # The catalog is fixed for the life of the process. The first
+        # tools/list also fills the SDK tool cache; afterwards the same
+        # prebuilt ServerResult is returned as is.
+        build_list_tools_result = self.app.request_handlers[types.ListToolsRequest]
+
+        async def cached_list_tools(request: types.ListToolsRequest) -> types.ServerResult:
+            if self._list_tools_result is None:
+                self._list_tools_result = await build_list_tools_result(request)
+            return self._list_tools_result
+
+        self.app.request_handlers[types.ListToolsRequest] = cached_list_tools
+
+        # Arguments are validated by CommandHandler with validators compiled
+        # once per tool; the SDK would recompile the schema on every call.
+        @self.app.call_tool(validate_input=False)
         async def handle_call_tool(
             name: str,
             arguments: Dict[str, Any],
         ) -> Sequence[types.TextContent | types.ImageContent | types.EmbeddedResource]:
-            return GLPiHandler.CommandHandler(command=name, arguments=arguments).execute()
+            # Deferred: the handler imports requests, pydantic-settings and
+            # every ticket/change module, none of which ``initialize`` needs.
+            from glpi_client.utils import (
+                CancellationToken,
+                cancellation_scope,
+                pacing_scope,
+                progress_scope,
+            )
+            from mcp_glpi.GLPiHandler import CommandHandler
+            from mcp_glpi.common.lifecycle import in_flight_calls
+            from mcp_glpi.common.scheduling import tool_scheduler
+            from mcp_glpi.glpi.identity import client_credentials
+            from mcp_glpi.tool_catalog import BULK, classify_workload
+
+            # Handlers block on HTTP; run them in worker threads so concurrent
+            # calls overlap and identical reads can share one GLPI round trip.
+            handler = CommandHandler(command=name, arguments=arguments)
+            token = CancellationToken()
+            relay = self._progress_relay()
+            responder = self._request_responder()
+            workload = classify_workload(name, arguments)
+
+            def run():
+                with contextlib.ExitStack() as stack:
+                    stack.enter_context(cancellation_scope(token))
+                    if relay is not None:
+                        stack.enter_context(progress_scope(relay))
+                    stack.enter_context(tool_scheduler.running(workload))
+                    if workload == BULK:
+                        stack.enter_context(pacing_scope(tool_scheduler.yield_to_interactive))
+                    return handler.execute()
+
+            # On an MCP cancel the SDK cancels this task. The thread cannot be
+            # interrupted mid-request, so flag it instead: it stops before its
+            # next page, sub-request or retry and returns its session. Closing
+            # the transport cancels the task too; that call keeps running and
+            # shutdown_process drains it.
+            try:
+                with client_credentials(self._request_credentials()):
+                    # Interactive and bulk calls queue for separate thread budgets
+                    return await anyio.to_thread.run_sync(
+                        run,
+                        abandon_on_cancel=True,
+                        limiter=tool_scheduler.limiter(workload),
+                    )
+            except anyio.get_cancelled_exc_class():
+                if responder is not None and responder.cancelled and not in_flight_calls.closed:
+                    token.cancel()
+                raise
+
+    def _progress_relay(self) -> Optional["_ProgressRelay"]:
+        """Progress sink for the current call, if the client asked for one."""
+
+        try:
+            context = self.app.request_context
+        except LookupError:
+            return None
+        progress_token = context.meta.progressToken if context.meta else None
+        if progress_token is None:
+            return None
+        return _ProgressRelay(context.session, progress_token, context.request_id)
+
+    def _request_responder(self) -> Optional[Any]:
+        """SDK responder of the current request; it records client cancels."""
+
+        try:
+            context = self.app.request_context
+        except LookupError:
+            return None
+        # The session tracks its requests in flight until they respond; the
+        # responder's scope is only cancelled by notifications/cancelled
+        return getattr(context.session, "_in_flight", {}).get(context.request_id)
+
+    def _request_credentials(self):
+        """GLPI credentials sent by the HTTP client of the current request."""
+
+        try:
+            request = self.app.request_context.request
+        except LookupError:
+            return None
+        headers = getattr(request, "headers", None)
+        if headers is None:
+            return None
+        from mcp_glpi.glpi.identity import credentials_from_headers
+
+        return credentials_from_headers(headers)
+
+    async def run_http(
+        self,
+        host: str,
+        port: int,
+        path: str = "/mcp",
+        sockets: Optional[List[Any]] = None,
+        graceful_timeout: Optional[float] = None,
+    ) -> None:
+        """Serve every MCP client from this process over streamable HTTP.
+
+        ``sockets`` are already bound listeners (used by worker processes);
+        ``host`` and ``port`` are then only used for logging.
+        """
+
+        import uvicorn
+        from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+        from starlette.applications import Starlette
+        from starlette.routing import Route
+
+        manager = StreamableHTTPSessionManager(app=self.app)
+
+        @contextlib.asynccontextmanager
+        async def lifespan(_app):
+            async with manager.run():
+                logger.info("Servidor MCP HTTP escuchando en http://%s:%s%s", host, port, path)
+                yield
+
+        # Route treats a non-function endpoint as a raw ASGI app
+        endpoint = _ASGIEndpoint(manager.handle_request)
+        app = Starlette(routes=[Route(path, endpoint=endpoint)], lifespan=lifespan)
+        server = uvicorn.Server(
+            uvicorn.Config(
+                app,
+                host=host,
+                port=port,
+                log_level="info",
+                timeout_graceful_shutdown=graceful_timeout,
+            )
+        )
+        await server.serve(sockets=sockets)
 
     async def run(self) -> None:
         async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
@@ -66,21 +214,212 @@ class GLPIMCPServer:
             )
 
 
-server_instance = GLPIMCPServer()
+class _ProgressRelay:
+    """Forwards progress reported by handler threads as MCP notifications.
+
+    Reports arrive from worker and fan-out threads; they are scheduled on the
+    event loop without waiting, at most one per ``min_interval`` except the
+    final one, and never with a lower progress than the last one sent.
+    """
+
+    min_interval = 0.25
+
+    def __init__(self, session: Any, progress_token: Any, request_id: Any):
+        self._loop = asyncio.get_running_loop()
+        self._session = session
+        self._progress_token = progress_token
+        self._request_id = request_id
+        self._lock = threading.Lock()
+        self._last_progress: Optional[float] = None
+        self._last_sent = float("-inf")
+
+    def __call__(self, progress: float, total: Optional[float], message: str) -> None:
+        with self._lock:
+            if self._last_progress is not None and progress <= self._last_progress:
+                return
+            now = time.monotonic()
+            final = total is not None and progress >= total
+            if not final and now - self._last_sent < self.min_interval:
+                return
+            self._last_progress = progress
+            self._last_sent = now
+            notification = self._session.send_progress_notification(
+                self._progress_token,
+                progress,
+                total=total,
+                message=message,
+                related_request_id=self._request_id,
+            )
+            try:
+                asyncio.run_coroutine_threadsafe(notification, self._loop)
+            except RuntimeError:
+                # The loop is gone (abandoned call after shutdown)
+                notification.close()
+
+
+class _ASGIEndpoint:
+    def __init__(self, handler):
+        self._handler = handler
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self._handler(scope, receive, send)
+
+
+_server_instance = None
+
+
+def get_server() -> GLPIMCPServer:
+    global _server_instance
+    if _server_instance is None:
+        _server_instance = GLPIMCPServer()
+    return _server_instance
+
+
+def __getattr__(name: str):
+    if name == "server_instance":
+        return get_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def exit_on_sigterm() -> None:
+    """Turn SIGTERM into SystemExit so ``finally`` blocks run.
+
+    uvicorn re-raises the signal once it has shut down; with the default
+    disposition that would kill the process before its cleanup.
+    """
+
+    def _exit(signum, frame):
+        raise SystemExit(128 + signum)
+
+    signal.signal(signal.SIGTERM, _exit)
+
+
+def configure_process(config: Any) -> None:
+    """Install the profiler, scheduler budgets, GLPI transport and session store."""
+
+    from mcp_glpi.common.profiling import install_profiler_from_config
+    from mcp_glpi.common.scheduling import tool_scheduler
+
+    install_profiler_from_config(config)
+    tool_scheduler.configure(
+        config.interactive_concurrency,
+        config.bulk_concurrency,
+        config.bulk_yield_timeout,
+    )
+    # The pool module imports glpi_client; skip it unless used
+    if config.transport != "live":
+        from mcp_glpi.glpi.pool import install_transport_from_config
+
+        install_transport_from_config(config)
+    if config.session_store:
+        from mcp_glpi.glpi.pool import install_token_store_from_config
+
+        install_token_store_from_config(config)
+
+
+def shutdown_process(config: Any) -> None:
+    """Drain tool calls, close pooled GLPI sessions and log the final stats.
+
+    New calls are rejected from here on; running ones get up to
+    ``config.shutdown_timeout`` seconds to finish before their sessions are
+    killed.
+    """
+
+    from mcp_glpi.common import lifecycle, metrics
+
+    in_flight = lifecycle.in_flight_calls
+    in_flight.close()
+    if not in_flight.wait_idle(config.shutdown_timeout):
+        logger.warning("Apagando con %s llamadas todavia en curso", in_flight.active)
+    # Only loaded once a tool has run; nothing to close otherwise
+    pool = sys.modules.get("mcp_glpi.glpi.pool")
+    if pool is not None:
+        pool.close_session_pool()
+    logger.info("Estadisticas finales: %s", json.dumps(metrics.collect_stats(), default=str))
 
 
 @click.command()
 @click.option("--verbose", "-v", is_flag=True, help="Habilitar logging detallado")
-def main(verbose: bool) -> None:
+@click.option(
+    "--transport",
+    type=click.Choice(["stdio", "http"]),
+    default="stdio",
+    show_default=True,
+    help="stdio (un cliente por proceso) o streamable HTTP (muchos clientes)",
+)
+@click.option("--host", default="127.0.0.1", show_default=True, help="Direccion HTTP")
+@click.option("--port", type=int, default=8000, show_default=True, help="Puerto HTTP")
+@click.option("--path", "http_path", default="/mcp", show_default=True, help="Ruta del endpoint MCP")
+@click.option("--workers", type=click.IntRange(min=1), default=1, show_default=True, help="Procesos worker para --transport http")
+@click.option("--max-requests", type=click.IntRange(min=0), default=0, show_default=True, help="Reciclar cada worker tras N llamadas (0 = nunca)")
+@click.option("--max-memory-mb", type=click.IntRange(min=0), default=0, show_default=True, help="Reciclar un worker cuyo RSS supere N MiB (0 = nunca)")
+@click.option("--recycle-grace", type=float, default=30.0, show_default=True, help="Segundos que un worker reciclado sigue atendiendo sus sesiones")
+def main(
+    verbose: bool,
+    transport: str,
+    host: str,
+    port: int,
+    http_path: str,
+    workers: int,
+    max_requests: int,
+    max_memory_mb: int,
+    recycle_grace: float,
+) -> None:
     """Start the MCP GLPI server."""
 
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
     logger.info("Iniciando servidor MCP GLPI")
-    logger.info("Herramientas disponibles: %s", [tool.name for tool in GLPITools.tools])
+    logger.info("Herramientas disponibles: %s", [spec.name for spec in TOOL_SPECS])
+
+    from mcp_glpi.common.config import get_config
+
+    config = get_config()
+    exit_on_sigterm()
+    if transport == "http" and workers > 1:
+        from mcp_glpi.workers import WorkerOptions, run_workers
+
+        run_workers(
+            WorkerOptions(
+                workers=workers,
+                path=http_path,
+                verbose=verbose,
+                max_requests=max_requests,
+                max_memory_mb=max_memory_mb,
+                recycle_grace=recycle_grace,
+            ),
+            host,
+            port,
+        )
+        return
+
+    configure_process(config)
+    exporter = None
+    if config.metrics_file or config.metrics_port:
+        from mcp_glpi.common.metrics import start_exporter_from_config
 
-    asyncio.run(server_instance.run())
+        exporter = start_exporter_from_config(config)
+    exit_code = None
+    try:
+        if transport == "http":
+            asyncio.run(get_server().run_http(host, port, http_path))
+        else:
+            asyncio.run(get_server().run())
+    except SystemExit as exc:
+        if transport == "http":
+            raise
+        exit_code = exc.code
+    finally:
+        shutdown_process(config)
+        if exporter is not None:
+            exporter.stop()
+    if exit_code is not None:
+        # Stopped by a signal: the stdio reader thread is still blocked on
+        # stdin and would keep the interpreter from exiting.
+        sys.stdout.flush()
+        logging.shutdown()
+        os._exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -3,18 +3,71 @@
 from __future__ import annotations
 
 import copy
+import hashlib
+import json
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple
 
 import mcp.types as types
 
 
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+# Listings and lookups of more rows than this are scheduled as bulk work
+BULK_ROW_THRESHOLD = 200
+
+
 @dataclass(frozen=True)
 class ToolSpec:
     name: str
     description: str
-    input_schema: Dict[str, Any]
+    input_schema: Mapping[str, Any]
     handler_name: str
+    # Read-only tools never change GLPI; identical concurrent calls share one result
+    read_only: bool = False
+    # "bulk" calls get their own small concurrency budget and hold back their
+    # GLPI requests while interactive calls are running
+    workload: str = INTERACTIVE
+
+    def __post_init__(self):
+        # Schema helpers share nested dicts between tools; freeze them so
+        # nothing can mutate one tool's schema through another.
+        object.__setattr__(self, "input_schema", _freeze(self.input_schema))
+
+    def workload_for(self, arguments: Mapping[str, Any]) -> str:
+        """Workload of one call: the tool's own, or bulk for large requests."""
+
+        if self.workload == BULK:
+            return BULK
+        limit = arguments.get("limit")
+        if isinstance(limit, str) and limit.isdigit():
+            limit = int(limit)
+        if isinstance(limit, int) and limit > BULK_ROW_THRESHOLD:
+            return BULK
+        ids = arguments.get("ids")
+        if isinstance(ids, str):
+            ids = ids.split(",")
+        if isinstance(ids, (list, tuple)) and len(ids) > BULK_ROW_THRESHOLD:
+            return BULK
+        return INTERACTIVE
 
 
 _listing_properties = {
@@ -157,6 +210,23 @@ def _listing_schema(description: str) -> Dict[str, Any]:
     }
 
 
+def _lookup_schema(item_label: str, description: str) -> Dict[str, Any]:
+    return {
+        "type": "object",
+        "properties": {
+            "ids": {
+                "type": "array",
+                "items": {"type": ["integer", "string"]},
+                "description": f"Identificadores de los {item_label} a recuperar",
+            },
+            "output": copy.deepcopy(_listing_properties["output"]),
+            "fields": copy.deepcopy(_listing_properties["fields"]),
+        },
+        "required": ["ids"],
+        "description": description,
+    }
+
+
 def _creation_schema(description: str) -> Dict[str, Any]:
     properties = copy.deepcopy(_creation_properties)
     properties["pr_links"] = copy.deepcopy(_pr_links_property)
@@ -168,6 +238,32 @@ def _creation_schema(description: str) -> Dict[str, Any]:
     }
 
 
+def _bulk_creation_schema(item_label: str, description: str) -> Dict[str, Any]:
+    item_properties = copy.deepcopy(_creation_properties)
+    return {
+        "type": "object",
+        "properties": {
+            item_label: {
+                "type": "array",
+                "minItems": 1,
+                "items": {
+                    "type": "object",
+                    "properties": item_properties,
+                    "required": ["name"],
+                },
+                "description": f"Listado de {item_label} a crear",
+            },
+            "chunk_size": {
+                "type": ["integer", "null"],
+                "minimum": 1,
+                "description": "Cantidad de elementos por request POST",
+            },
+        },
+        "required": [item_label],
+        "description": description,
+    }
+
+
 def _comment_schema(item_field: str, item_label: str) -> Dict[str, Any]:
     properties = {
         item_field: {
@@ -330,6 +426,104 @@ def _update_schema(item_field: str, item_label: str) -> Dict[str, Any]:
     }
 
 
+def _batch_schema() -> Dict[str, Any]:
+    return {
+        "type": "object",
+        "properties": {
+            "operations": {
+                "type": "array",
+                "minItems": 1,
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "tool": {
+                            "type": "string",
+                            "description": "Nombre de la herramienta a ejecutar",
+                        },
+                        "arguments": {
+                            "type": "object",
+                            "additionalProperties": True,
+                            "description": "Argumentos de la herramienta",
+                        },
+                        "id": {
+                            "type": ["string", "null"],
+                            "description": "Identificador opcional para referenciar la operacion",
+                        },
+                        "depends_on": {
+                            "type": "array",
+                            "items": {"type": ["integer", "string"]},
+                            "description": "Indices o ids de operaciones que deben terminar antes",
+                        },
+                    },
+                    "required": ["tool"],
+                },
+                "description": "Operaciones a ejecutar en una sola solicitud",
+            },
+            "sequential": {
+                "type": _def_bool,
+                "description": "Ejecutar las operaciones en orden, una a la vez",
+            },
+            "stop_on_error": {
+                "type": _def_bool,
+                "description": "Omitir las operaciones pendientes despues del primer error",
+            },
+            "max_concurrency": {
+                "type": ["integer", "null"],
+                "minimum": 1,
+                "description": "Cantidad maxima de operaciones simultaneas",
+            },
+        },
+        "required": ["operations"],
+        "description": "Ejecuta varias herramientas compartiendo una sesion GLPI",
+    }
+
+
+def _bulk_update_schema(item_field: str, item_label: str) -> Dict[str, Any]:
+    return {
+        "type": "object",
+        "properties": {
+            "updates": {
+                "description": (
+                    f"Cambios por {item_label}: lista de objetos con '{item_field}' y 'fields', "
+                    "u objeto {id: fields}"
+                ),
+                "anyOf": [
+                    {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                item_field: {"type": ["integer", "string"]},
+                                "fields": {"type": "object", "additionalProperties": True},
+                            },
+                            "required": [item_field],
+                            "additionalProperties": True,
+                        },
+                    },
+                    {"type": "object", "additionalProperties": {"type": "object"}},
+                ],
+            },
+            "ids": {
+                "type": "array",
+                "items": {"type": ["integer", "string"]},
+                "description": f"Identificadores de {item_label} que reciben los mismos 'fields'",
+            },
+            "fields": {
+                "type": "object",
+                "additionalProperties": True,
+                "description": "Campos a aplicar a todos los 'ids'",
+            },
+            "chunk_size": {
+                "type": ["integer", "null"],
+                "minimum": 1,
+                "description": "Cantidad de elementos por request PATCH",
+            },
+        },
+        "required": [],
+        "description": "Usar 'updates' o la combinacion 'ids' + 'fields'",
+    }
+
+
 TOOL_SPECS: List[ToolSpec] = [
     ToolSpec(
         name="echo",
@@ -346,29 +540,72 @@ TOOL_SPECS: List[ToolSpec] = [
         },
         handler_name="_echo",
     ),
+    ToolSpec(
+        name="batch",
+        description=(
+            "Ejecuta varias herramientas en una sola solicitud reutilizando la sesion GLPI; "
+            "las operaciones independientes corren en paralelo"
+        ),
+        input_schema=_batch_schema(),
+        handler_name="_batch",
+    ),
     ToolSpec(
         name="validate_session",
         description="Muestra informacion sobre el estado de la sesion con GLPI",
         input_schema={"type": "object", "properties": {}, "required": []},
         handler_name="validate_session",
+        read_only=True,
+    ),
+    ToolSpec(
+        name="server_stats",
+        description="Metricas del servidor: latencia por herramienta, trafico por endpoint GLPI, sesiones y caches",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "format": {
+                    "type": "string",
+                    "enum": ["json", "prometheus"],
+                    "description": "Formato de salida; por defecto 'json'",
+                }
+            },
+            "required": [],
+        },
+        handler_name="_server_stats",
     ),
     ToolSpec(
         name="my_profiles",
         description="Lista los perfiles del usuario logueado y las entidades asociadas",
         input_schema={"type": "object", "properties": {}, "required": []},
         handler_name="_my_profiles",
+        read_only=True,
     ),
     ToolSpec(
         name="list_tickets",
         description="Lista tickets de GLPI con opciones de filtrado basicas; responde JSON por defecto",
         input_schema=_listing_schema("Parametros para listar tickets usando glpi_client"),
         handler_name="_list_tickets",
+        read_only=True,
     ),
     ToolSpec(
         name="list_changes",
         description="Lista cambios de GLPI con opciones de filtrado basicas; responde JSON por defecto",
         input_schema=_listing_schema("Parametros para listar cambios usando glpi_client"),
         handler_name="_list_changes",
+        read_only=True,
+    ),
+    ToolSpec(
+        name="get_tickets",
+        description="Recupera varios tickets por id en una sola consulta; informa los ids no encontrados",
+        input_schema=_lookup_schema("tickets", "Parametros para recuperar tickets por id"),
+        handler_name="_get_tickets",
+        read_only=True,
+    ),
+    ToolSpec(
+        name="get_changes",
+        description="Recupera varios cambios por id en una sola consulta; informa los ids no encontrados",
+        input_schema=_lookup_schema("cambios", "Parametros para recuperar cambios por id"),
+        handler_name="_get_changes",
+        read_only=True,
     ),
     ToolSpec(
         name="create_ticket",
@@ -378,6 +615,16 @@ TOOL_SPECS: List[ToolSpec] = [
         ),
         handler_name="_create_ticket",
     ),
+    ToolSpec(
+        name="bulk_create_tickets",
+        description="Crea muchos tickets con POST por bloques; devuelve los ids creados en orden",
+        input_schema=_bulk_creation_schema(
+            "tickets",
+            "Todos los tickets se validan antes de enviar cualquier request",
+        ),
+        handler_name="_bulk_create_tickets",
+        workload=BULK,
+    ),
     ToolSpec(
         name="create_change",
         description="Crea un cambio en GLPI usando glpi_client",
@@ -494,15 +741,70 @@ TOOL_SPECS: List[ToolSpec] = [
         input_schema=_update_schema("ticket_id", "ticket"),
         handler_name="_update_ticket",
     ),
+    ToolSpec(
+        name="bulk_update_tickets",
+        description="Actualiza muchos tickets con PATCH por bloques; devuelve el resultado por id",
+        input_schema=_bulk_update_schema("ticket_id", "ticket"),
+        handler_name="_bulk_update_tickets",
+        workload=BULK,
+    ),
+    ToolSpec(
+        name="bulk_update_changes",
+        description="Actualiza muchos cambios con PATCH por bloques; devuelve el resultado por id",
+        input_schema=_bulk_update_schema("change_id", "cambio"),
+        handler_name="_bulk_update_changes",
+        workload=BULK,
+    ),
 ]
 
 
+TOOL_SPECS_BY_NAME = {spec.name: spec for spec in TOOL_SPECS}
+
+
+def classify_workload(name: str, arguments: Mapping[str, Any]) -> str:
+    """Workload of a tools/call; unknown tools are left to fail as interactive."""
+
+    spec = TOOL_SPECS_BY_NAME.get(name)
+    if spec is None:
+        return INTERACTIVE
+    return spec.workload_for(arguments or {})
+
+
 def build_tools() -> List[types.Tool]:
     return [
         types.Tool(
             name=spec.name,
             description=spec.description,
-            inputSchema=copy.deepcopy(spec.input_schema),
+            inputSchema=_thaw(spec.input_schema),
+            annotations=types.ToolAnnotations(readOnlyHint=True) if spec.read_only else None,
         )
         for spec in TOOL_SPECS
     ]
+
+
+@dataclass(frozen=True)
+class ToolCatalog:
+    tools: Tuple[types.Tool, ...]
+    result: types.ListToolsResult
+    serialized: bytes
+    content_hash: str
+
+
+@lru_cache(maxsize=1)
+def compile_catalog() -> ToolCatalog:
+    """Build the published tool list once, with its JSON form and hash."""
+
+    tools = build_tools()
+    serialized = json.dumps(
+        [tool.model_dump(mode="json", by_alias=True, exclude_none=True) for tool in tools],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+    content_hash = hashlib.sha256(serialized).hexdigest()
+    return ToolCatalog(
+        tools=tuple(tools),
+        result=types.ListToolsResult(tools=tools, _meta={"catalogHash": content_hash}),
+        serialized=serialized,
+        content_hash=content_hash,
+    )
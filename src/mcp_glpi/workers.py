@@ -0,0 +1,527 @@
+"""Multi-process HTTP serving: a sticky proxy in front of worker processes.
+
+The parent process accepts client connections and forwards each request to
+the worker that owns its MCP session (``mcp-session-id``). New sessions go
+to the live worker with the fewest sessions. Workers share GLPI caches and
+publish metrics through a SQLite (WAL) store. A worker that passes its
+request count or memory limit stops taking new sessions, a replacement is
+started, and the old one exits once its sessions end or the grace period
+expires.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import random
+import socket
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+MCP_SESSION_HEADER = "mcp-session-id"
+# Headers that describe one connection and must not be forwarded
+_HOP_BY_HOP = frozenset(
+    {
+        b"connection",
+        b"keep-alive",
+        b"transfer-encoding",
+        b"te",
+        b"trailer",
+        b"upgrade",
+        b"host",
+        b"content-length",
+        b"proxy-authorization",
+        b"proxy-connection",
+    }
+)
+
+
+@dataclass(frozen=True)
+class WorkerOptions:
+    workers: int = 2
+    path: str = "/mcp"
+    verbose: bool = False
+    max_requests: int = 0
+    max_memory_mb: int = 0
+    recycle_grace: float = 30.0
+    stats_interval: float = 1.0
+    session_idle_timeout: float = 1800.0
+
+
+class _Worker:
+    def __init__(self, index: int, process: Any, conn: Connection):
+        self.index = index
+        self.process = process
+        self.conn = conn
+        self.port: Optional[int] = None
+        self.ready = threading.Event()
+        self.retiring_since: Optional[float] = None
+        self.terminating = False
+        self.replacement: Optional["_Worker"] = None
+        self.sessions: Set[str] = set()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def accepting(self) -> bool:
+        return self.ready.is_set() and self.retiring_since is None and self.process.is_alive()
+
+
+class WorkerSupervisor:
+    """Starts, monitors, recycles and routes to the worker processes."""
+
+    def __init__(self, options: WorkerOptions, store_path: str):
+        self.options = options
+        self.store_path = store_path
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._workers: List[_Worker] = []
+        self._sessions: Dict[str, Tuple[_Worker, float]] = {}
+        self._round_robin = itertools.count()
+        self._stop = threading.Event()
+        self._monitor_thread: Optional[threading.Thread] = None
+        self.stats = {"spawned": 0, "recycled": 0, "crashed": 0}
+
+    def start(self, timeout: float = 60.0) -> None:
+        with self._lock:
+            for index in range(self.options.workers):
+                self._workers.append(self._spawn(index))
+        self._monitor_thread = threading.Thread(
+            target=self._monitor, name="mcp-glpi-supervisor", daemon=True
+        )
+        self._monitor_thread.start()
+        deadline = time.monotonic() + timeout
+        for worker in list(self._workers):
+            if not worker.ready.wait(max(0.0, deadline - time.monotonic())):
+                self.stop()
+                raise RuntimeError(f"Worker {worker.index} did not start within {timeout}s")
+
+    def stop(self) -> None:
+        self._stop.set()
+        # Stop monitoring first so exiting workers are not restarted
+        if self._monitor_thread is not None:
+            self._monitor_thread.join(5)
+        with self._lock:
+            workers = list(self._workers)
+        for worker in workers:
+            if worker.process.is_alive():
+                worker.process.terminate()
+        for worker in workers:
+            worker.process.join(self.options.recycle_grace + 5)
+            if worker.process.is_alive():
+                worker.process.kill()
+
+    # -- routing ------------------------------------------------------------
+
+    def route(self, session_id: Optional[str]) -> Optional[_Worker]:
+        """Worker owning ``session_id``, or the least loaded one for a new session."""
+
+        with self._lock:
+            if session_id:
+                entry = self._sessions.get(session_id)
+                if entry is None:
+                    return None
+                self._sessions[session_id] = (entry[0], time.monotonic())
+                return entry[0]
+            candidates = [worker for worker in self._workers if worker.accepting]
+            if not candidates:
+                # Replacements still starting: keep using the retiring workers
+                candidates = [
+                    worker
+                    for worker in self._workers
+                    if worker.ready.is_set() and not worker.terminating and worker.process.is_alive()
+                ]
+            if not candidates:
+                return None
+            turn = next(self._round_robin)
+            return min(
+                candidates,
+                key=lambda worker: (len(worker.sessions), (worker.index - turn) % len(candidates)),
+            )
+
+    def bind(self, session_id: str, worker: _Worker) -> None:
+        with self._lock:
+            self._sessions[session_id] = (worker, time.monotonic())
+            worker.sessions.add(session_id)
+
+    def unbind(self, session_id: str) -> None:
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+            if entry is not None:
+                entry[0].sessions.discard(session_id)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "sessions": len(self._sessions),
+                "workers": {
+                    str(worker.index): {
+                        "pid": worker.process.pid,
+                        "sessions": len(worker.sessions),
+                        "retiring": worker.retiring_since is not None,
+                    }
+                    for worker in self._workers
+                },
+            }
+
+    # -- lifecycle ----------------------------------------------------------
+
+    def _spawn(self, index: int) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(index, child_conn, self.options, self.store_path),
+            name=f"mcp-glpi-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self.stats["spawned"] += 1
+        logger.info("Started worker %s (pid %s)", index, process.pid)
+        return _Worker(index, process, parent_conn)
+
+    def _monitor(self) -> None:
+        while not self._stop.is_set():
+            with self._lock:
+                connections = {
+                    worker.conn: worker for worker in self._workers if not worker.conn.closed
+                }
+            if connections:
+                for conn in wait(list(connections), timeout=0.5):
+                    self._receive(connections[conn])
+            else:
+                self._stop.wait(0.5)
+            if self._stop.is_set():
+                break
+            with self._lock:
+                self._reap()
+                self._prune_sessions()
+
+    def _receive(self, worker: _Worker) -> None:
+        try:
+            kind, value = worker.conn.recv()
+        except (EOFError, OSError):
+            worker.conn.close()
+            return
+        if kind == "ready":
+            worker.port = value
+            worker.ready.set()
+            logger.info("Worker %s listening on port %s", worker.index, value)
+        elif kind == "recycle":
+            with self._lock:
+                self._retire(worker, value)
+
+    def _retire(self, worker: _Worker, reason: str) -> None:
+        if worker.retiring_since is not None or worker not in self._workers:
+            return
+        worker.retiring_since = time.monotonic()
+        self.stats["recycled"] += 1
+        logger.info("Recycling worker %s (pid %s): %s", worker.index, worker.process.pid, reason)
+        worker.replacement = self._spawn(worker.index)
+        self._workers.append(worker.replacement)
+
+    def _reap(self) -> None:
+        now = time.monotonic()
+        for worker in list(self._workers):
+            if worker.retiring_since is not None:
+                if worker.process.is_alive():
+                    replacement = worker.replacement
+                    if replacement is not None and not replacement.ready.is_set():
+                        if replacement.process.is_alive():
+                            # Keep serving new sessions until the replacement is up
+                            continue
+                    idle = not worker.sessions
+                    expired = now - worker.retiring_since > self.options.recycle_grace
+                    if not worker.terminating and (idle or expired):
+                        # uvicorn drains open requests on SIGTERM
+                        worker.terminating = True
+                        worker.process.terminate()
+                    continue
+                self._drop(worker)
+            elif worker.process.exitcode is not None:
+                logger.warning(
+                    "Worker %s (pid %s) exited with %s; restarting",
+                    worker.index,
+                    worker.process.pid,
+                    worker.process.exitcode,
+                )
+                self.stats["crashed"] += 1
+                self._drop(worker)
+                self._workers.append(self._spawn(worker.index))
+
+    def _drop(self, worker: _Worker) -> None:
+        self._workers.remove(worker)
+        for session_id in worker.sessions:
+            self._sessions.pop(session_id, None)
+        worker.sessions.clear()
+        worker.conn.close()
+
+    def _prune_sessions(self) -> None:
+        cutoff = time.monotonic() - self.options.session_idle_timeout
+        for session_id, (worker, last_seen) in list(self._sessions.items()):
+            if last_seen < cutoff:
+                del self._sessions[session_id]
+                worker.sessions.discard(session_id)
+
+
+class StickyProxy:
+    """ASGI app forwarding each request to the worker that owns its session."""
+
+    def __init__(self, supervisor: WorkerSupervisor):
+        import httpx
+
+        self.supervisor = supervisor
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(None),
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=256),
+        )
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            return
+        import httpx
+        from starlette.background import BackgroundTask
+        from starlette.requests import Request
+        from starlette.responses import JSONResponse, StreamingResponse
+
+        request = Request(scope, receive)
+        session_id = request.headers.get(MCP_SESSION_HEADER)
+        worker = self.supervisor.route(session_id)
+        if worker is None:
+            # 404 tells MCP clients to start a new session
+            status, message = (404, "Session not found") if session_id else (503, "No workers available")
+            response = JSONResponse(
+                {"jsonrpc": "2.0", "id": None, "error": {"code": -32001, "message": message}},
+                status_code=status,
+            )
+            await response(scope, receive, send)
+            return
+
+        url = worker.url + scope.get("raw_path", scope["path"].encode()).decode("latin-1")
+        if scope.get("query_string"):
+            url += "?" + scope["query_string"].decode("latin-1")
+        headers = [(k, v) for k, v in scope["headers"] if k.lower() not in _HOP_BY_HOP]
+        try:
+            upstream = await self.client.send(
+                self.client.build_request(
+                    request.method, url, headers=headers, content=await request.body()
+                ),
+                stream=True,
+            )
+        except httpx.TransportError as exc:
+            logger.warning("Worker %s unreachable: %s", worker.index, exc)
+            response = JSONResponse(
+                {"jsonrpc": "2.0", "id": None, "error": {"code": -32603, "message": "Worker unavailable"}},
+                status_code=502,
+            )
+            await response(scope, receive, send)
+            return
+
+        new_session = upstream.headers.get(MCP_SESSION_HEADER)
+        if new_session and not session_id:
+            self.supervisor.bind(new_session, worker)
+        elif session_id and request.method == "DELETE" and upstream.status_code < 300:
+            self.supervisor.unbind(session_id)
+        elif session_id and upstream.status_code == 404:
+            self.supervisor.unbind(session_id)
+
+        response = StreamingResponse(
+            upstream.aiter_raw(),
+            status_code=upstream.status_code,
+            headers={
+                key: value
+                for key, value in upstream.headers.items()
+                if key.lower().encode() not in _HOP_BY_HOP
+            },
+            background=BackgroundTask(upstream.aclose),
+        )
+        await response(scope, receive, send)
+
+
+def run_workers(options: WorkerOptions, host: str, port: int) -> None:
+    """Serve ``options.workers`` worker processes behind a sticky proxy."""
+
+    import uvicorn
+
+    from mcp_glpi.common.config import get_config
+    from mcp_glpi.common.metrics import merge_stats, register_stats_provider
+    from mcp_glpi.common.metrics import start_exporter_from_config
+    from mcp_glpi.common.shared_store import SharedStore
+
+    config = get_config()
+    temporary = config.shared_store is None
+    store_path = config.shared_store or os.path.join(
+        tempfile.gettempdir(), f"mcp-glpi-{os.getpid()}.sqlite3"
+    )
+    store = SharedStore(store_path, worker_id="supervisor")
+    supervisor = WorkerSupervisor(options, store_path)
+    register_stats_provider("supervisor", supervisor.snapshot)
+    supervisor.start()
+    exporter = start_exporter_from_config(
+        config, stats_source=lambda: merge_stats(store.worker_stats())
+    )
+    proxy = StickyProxy(supervisor)
+    server = uvicorn.Server(
+        uvicorn.Config(proxy, host=host, port=port, lifespan="off", log_level="info")
+    )
+    logger.info(
+        "Servidor MCP HTTP con %s workers en http://%s:%s%s",
+        options.workers,
+        host,
+        port,
+        options.path,
+    )
+    try:
+        asyncio.run(_serve_proxy(server, proxy))
+    finally:
+        if exporter is not None:
+            exporter.stop()
+        supervisor.stop()
+        store.close()
+        if temporary:
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(store_path + suffix)
+                except OSError:
+                    pass
+
+
+async def _serve_proxy(server: Any, proxy: StickyProxy) -> None:
+    try:
+        await server.serve()
+    finally:
+        await proxy.client.aclose()
+
+
+# -- worker process ----------------------------------------------------------
+
+
+def _rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/status", encoding="ascii") as handle:
+            for line in handle:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - Windows
+        return None
+    # Peak rather than current RSS, in KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+class _WorkerReporter:
+    """Publishes this worker's stats and asks for recycling past its limits."""
+
+    def __init__(self, conn: Connection, store: Any, options: WorkerOptions):
+        self.conn = conn
+        self.store = store
+        self.options = options
+        # Jitter keeps workers started together from recycling together
+        self.max_requests = (
+            options.max_requests + random.randint(0, options.max_requests // 10)
+            if options.max_requests
+            else 0
+        )
+        self._stop = threading.Event()
+        self._recycle_requested = False
+        self._thread = threading.Thread(target=self._run, name="mcp-glpi-worker-stats", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join(5)
+        self.publish()
+
+    def publish(self) -> Dict[str, Any]:
+        from mcp_glpi.common.metrics import collect_stats
+
+        stats = collect_stats()
+        self.store.publish_stats(stats)
+        return stats
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.options.stats_interval):
+            try:
+                stats = self.publish()
+            except Exception:  # pragma: no cover - defensive
+                logger.debug("Could not publish worker stats", exc_info=True)
+                continue
+            reason = self._recycle_reason(stats)
+            if reason and not self._recycle_requested:
+                self._recycle_requested = True
+                try:
+                    self.conn.send(("recycle", reason))
+                except OSError:
+                    return
+
+    def _recycle_reason(self, stats: Dict[str, Any]) -> Optional[str]:
+        calls = sum(tool["calls"] for tool in stats["tools"].values())
+        if self.max_requests and calls >= self.max_requests:
+            return f"{calls} calls (limit {self.max_requests})"
+        if self.options.max_memory_mb:
+            rss = _rss_bytes()
+            if rss is not None and rss > self.options.max_memory_mb * 1_048_576:
+                return f"RSS {rss / 1_048_576:.0f}MiB (limit {self.options.max_memory_mb}MiB)"
+        return None
+
+
+def _worker_main(index: int, conn: Connection, options: WorkerOptions, store_path: str) -> None:
+    from mcp_glpi.common import shared_store
+    from mcp_glpi.common.config import get_config
+    from mcp_glpi.server import (
+        configure_process,
+        exit_on_sigterm,
+        get_server,
+        shutdown_process,
+    )
+
+    exit_on_sigterm()
+    if options.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+    config = get_config()
+    configure_process(config)
+    store = shared_store.install_store(store_path, worker_id=f"{index}-{os.getpid()}")
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1024)
+    port = listener.getsockname()[1]
+
+    reporter = _WorkerReporter(conn, store, options)
+    conn.send(("ready", port))
+    reporter.start()
+    try:
+        asyncio.run(
+            get_server().run_http(
+                "127.0.0.1",
+                port,
+                options.path,
+                sockets=[listener],
+                graceful_timeout=options.recycle_grace,
+            )
+        )
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        shutdown_process(config)
+        reporter.stop()
+        conn.close()
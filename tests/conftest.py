@@ -22,3 +22,93 @@ import importlib
 
 importlib.invalidate_caches()
 importlib.import_module("mcp_glpi")
+
+import json
+import re
+
+import pytest
+
+
+class FakeGLPIResponse:
+    def __init__(self, status_code, payload, body=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.content = json.dumps(payload).encode()
+        self.text = self.content.decode()
+        self.headers = {}
+        self.url = ''
+        self.request = type('Request', (), {'body': body, 'headers': {}, 'method': ''})()
+
+    def json(self):
+        return self._payload
+
+
+class FakeGLPISession:
+    """In-memory stand-in for requests.Session speaking the GLPI REST API."""
+
+    def __init__(self):
+        self.requests = []
+        self._next_id = 100
+
+    def _endpoint(self, url):
+        return url.split('/apirest.php/', 1)[-1]
+
+    def get(self, url, **kwargs):
+        endpoint = self._endpoint(url)
+        self.requests.append(('GET', endpoint))
+        if endpoint == 'initSession':
+            return FakeGLPIResponse(200, {'session_token': 'fake-session'})
+        if endpoint == 'killSession':
+            return FakeGLPIResponse(200, {})
+        if endpoint.startswith('search/'):
+            params = kwargs.get('params') or []
+            ids = [value for key, value in params if re.search(r'\[value\]$', key)]
+            item_type = endpoint.split('/', 1)[1]
+            return FakeGLPIResponse(
+                200,
+                {'data': [{f'{item_type}.id': id_, f'{item_type}.name': f'#{id_}'} for id_ in ids]},
+            )
+        match = re.match(r'(\w+)/(\d+)$', endpoint)
+        if match:
+            return FakeGLPIResponse(200, {'id': int(match.group(2)), 'name': f'#{match.group(2)}'})
+        return FakeGLPIResponse(200, [])
+
+    def post(self, url, json=None, **kwargs):
+        self.requests.append(('POST', self._endpoint(url)))
+        items = json.get('input', {}) if json else {}
+        if isinstance(items, list):
+            payload = [self._created() for _ in items]
+        else:
+            payload = self._created()
+        return FakeGLPIResponse(201, payload, body=b'{}')
+
+    def patch(self, url, json=None, **kwargs):
+        self.requests.append(('PATCH', self._endpoint(url)))
+        return FakeGLPIResponse(
+            200, [{str(item['id']): True, 'message': ''} for item in json['input']], body=b'{}'
+        )
+
+    def delete(self, url, json=None, **kwargs):
+        self.requests.append(('DELETE', self._endpoint(url)))
+        return FakeGLPIResponse(200, [])
+
+    def _created(self):
+        self._next_id += 1
+        return {'id': self._next_id, 'message': ''}
+
+
+@pytest.fixture
+def fake_glpi(monkeypatch):
+    from glpi_client.core import base
+
+    session = FakeGLPISession()
+    monkeypatch.setattr(base.requests, 'Session', lambda: session)
+    return session
+
+
+@pytest.fixture(autouse=True)
+def _close_session_pool():
+    yield
+    from mcp_glpi.glpi import pool
+
+    pool.close_session_pool()
@@ -0,0 +1,65 @@
+import copy
+
+from glpi_client import RequestHandler
+
+from benchmarks.fake_glpi import FakeGLPIServer
+from benchmarks.run import SCENARIOS, compare_results, run_benchmarks
+from mcp_glpi.common.config import get_config
+
+
+def test_fake_server_pages_listings_with_content_range():
+    with FakeGLPIServer(items=30, max_range=10) as server:
+        with RequestHandler(server.url, 'app', 'user', False) as handler:
+            page = handler.get_many_items('Ticket', range_=(0, 19))
+            response_range = handler.response_range
+            found = handler.get_items_by_ids('Ticket', [2, 4, 99])
+        counts = server.request_counts()
+
+    assert len(page) == 10
+    assert (response_range.start, response_range.end, response_range.count) == (0, 9, 30)
+    assert [item['id'] for item in found['items']] == [2, 4]
+    assert found['missing'] == [99]
+    assert counts['GET search/Ticket'] == 1
+
+
+def test_benchmark_results_compare_against_baseline(monkeypatch):
+    monkeypatch.setenv('GLPI_URL', 'http://localhost')
+    scenarios = [scenario for scenario in SCENARIOS if scenario.name == 'create_ticket']
+    try:
+        results = run_benchmarks(scenarios, concurrency=2, iterations=5, items=10)
+    finally:
+        get_config.cache_clear()
+
+    result = results['scenarios']['create_ticket']
+    assert result['calls'] == 5
+    assert result['errors'] == 0
+    # Pooled sessions: only the calls that open a session pay initSession
+    assert result['http_calls_per_call']['max'] <= 2
+    assert compare_results(results, results) == []
+
+    mean = result['http_calls_per_call']['mean']
+    baseline = copy.deepcopy(results)
+    baseline['scenarios']['create_ticket']['http_calls_per_call']['mean'] = 0.5
+    assert compare_results(results, baseline) == [f'create_ticket: http_calls_per_call 0.5 -> {mean}']
+
+
+def test_load_generator_drives_server_over_stdio():
+    import asyncio
+
+    from benchmarks.loadgen import parse_mix, run_load
+
+    with FakeGLPIServer(items=500) as server:
+        report = asyncio.run(
+            run_load(
+                server.url,
+                parse_mix('list_tickets=1,create_ticket=1'),
+                concurrency=2,
+                duration=0.5,
+                sample_interval=0.1,
+            )
+        )
+
+    assert report['calls'] > 0
+    assert report['errors'] == 0
+    assert set(report['tools']) <= {'list_tickets', 'create_ticket'}
+    assert report['rss']['samples']
@@ -0,0 +1,127 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+import requests
+
+from benchmarks.fake_glpi import FakeGLPIServer
+from glpi_client import GLPICancelledError, RequestHandler
+from glpi_client.utils import CancellationToken, cancellation_scope, retry_on_failure
+from tests.test_http_server import ROOT
+
+
+def test_cancelled_scope_stops_requests_and_retry_waits():
+    token = CancellationToken()
+    attempts = []
+
+    @retry_on_failure(max_retries=3, delay=5.0)
+    def flaky():
+        attempts.append(time.monotonic())
+        raise requests.ConnectionError('GLPI unreachable')
+
+    threading.Timer(0.1, token.cancel).start()
+    started = time.monotonic()
+    with cancellation_scope(token), pytest.raises(GLPICancelledError):
+        flaky()
+    assert len(attempts) == 1
+    assert time.monotonic() - started < 2
+
+    with FakeGLPIServer(items=5) as glpi:
+        with RequestHandler(glpi.url, 'app', 'user', False) as handler:
+            with cancellation_scope(token), pytest.raises(GLPICancelledError):
+                handler.get_items_by_ids('Ticket', [1, 2, 3])
+        counts = glpi.request_counts()
+    assert 'GET search/Ticket' not in counts
+    assert counts['GET killSession'] == 1
+
+
+def _message(payload):
+    return (json.dumps(payload) + '\n').encode()
+
+
+def _start_bulk_update(glpi):
+    """Start a stdio server and send it a 400-ticket bulk update (8 PATCH chunks)."""
+    env = {
+        **os.environ,
+        'GLPI_URL': glpi.url,
+        'PYTHONPATH': str(ROOT / 'src'),
+    }
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'mcp_glpi.server'],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=env,
+    )
+    process.stdin.write(_message({
+        'jsonrpc': '2.0', 'id': 1, 'method': 'initialize',
+        'params': {
+            'protocolVersion': '2025-06-18',
+            'capabilities': {},
+            'clientInfo': {'name': 'test', 'version': '1'},
+        },
+    }))
+    process.stdin.write(_message({'jsonrpc': '2.0', 'method': 'notifications/initialized'}))
+    process.stdin.flush()
+    process.stdout.readline()
+
+    # sent 4 chunks at a time
+    process.stdin.write(_message({
+        'jsonrpc': '2.0', 'id': 2, 'method': 'tools/call',
+        'params': {
+            'name': 'bulk_update_tickets',
+            'arguments': {'ids': list(range(1, 401)), 'fields': {'status': 2}},
+        },
+    }))
+    process.stdin.flush()
+    deadline = time.monotonic() + 30
+    while not glpi.request_counts().get('GET initSession'):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    time.sleep(0.2)  # the first wave of PATCH requests is now in flight
+    return process
+
+
+def test_mcp_cancel_stops_pending_bulk_chunks():
+    with FakeGLPIServer(items=400, latency=0.5) as glpi:
+        process = _start_bulk_update(glpi)
+        try:
+            process.stdin.write(_message({
+                'jsonrpc': '2.0', 'method': 'notifications/cancelled',
+                'params': {'requestId': 2, 'reason': 'test'},
+            }))
+            process.stdin.flush()
+            time.sleep(2)
+            counts = glpi.request_counts()
+        finally:
+            process.stdin.close()
+            process.wait(timeout=30)
+
+    assert counts['PATCH Ticket'] == 4
+
+
+def test_closing_stdin_drains_running_bulk_call():
+    with FakeGLPIServer(items=400, latency=0.5) as glpi:
+        process = _start_bulk_update(glpi)
+        process.stdin.close()
+        assert process.wait(timeout=30) == 0
+        counts = glpi.request_counts()
+    assert counts['PATCH Ticket'] == 8
+    assert counts['GET killSession'] == 1
+
+
+def test_cancelled_leader_still_sends_coalesced_inserts():
+    token = CancellationToken()
+    token.cancel()
+    with FakeGLPIServer(items=0) as glpi:
+        with RequestHandler(glpi.url, 'app', 'user', False) as handler:
+            handler.enable_write_coalescing(window=0.05)
+            with cancellation_scope(token):
+                created = handler.add_items_coalesced('Ticket', {'name': 'a'})
+        counts = glpi.request_counts()
+    assert created['id']
+    assert counts['POST Ticket'] == 1
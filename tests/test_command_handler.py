@@ -125,6 +125,59 @@ def test_list_tickets_defaults_to_dict_output(monkeypatch):
     assert captured['output'] == 'dict'
 
 
+def test_get_tickets_passes_ids_and_fields(monkeypatch):
+    captured = {}
+
+    def fake_get_tickets(**kwargs):
+        captured.update(kwargs)
+        return {'tickets': [{'id': 1}], 'missing': [2]}
+
+    monkeypatch.setattr(glpi_tickets, 'get_tickets', fake_get_tickets)
+
+    response = CommandHandler(
+        'get_tickets',
+        {'ticket_ids': [1, 2], 'fields': ['id', 'name']},
+    ).execute()
+
+    payload = _extract_json(response)
+    assert payload['ok'] is True
+    assert payload['data'] == {'tickets': [{'id': 1}], 'missing': [2]}
+    assert captured == {'ids': [1, 2], 'output': 'dict', 'fields': ['id', 'name']}
+
+
+def test_get_changes_requires_ids():
+    response = CommandHandler('get_changes', {}).execute()
+    payload = _extract_json(response)
+    assert payload['ok'] is False
+    assert payload['error']['type'] == 'validation_error'
+
+
+def test_arguments_failing_the_schema_are_reported():
+    response = CommandHandler('list_tickets', {'limit': 'many'}).execute()
+    payload = _extract_json(response)
+    assert payload['ok'] is False
+    assert payload['error']['type'] == 'validation_error'
+    assert payload['error']['message'].startswith('Invalid argument: limit:')
+    assert payload['error']['details'] == {'path': ['limit']}
+
+
+def test_compiled_arguments_resolve_aliases_and_coerce():
+    from mcp_glpi.arguments import compiled_arguments
+
+    compiled = compiled_arguments()
+    normalized = compiled['update_ticket'].normalize(
+        {'tickets_id': '7', 'updates': '{"status": 2}'}
+    )
+    assert normalized['ticket_id'] == '7'
+    assert normalized['fields'] == {'status': 2}
+    compiled['update_ticket'].validate(normalized)
+
+    # bulk tools declare ``updates`` themselves, so it is not an alias of ``fields``
+    bulk = compiled['bulk_update_tickets'].normalize({'updates': {'1': {'status': 2}}})
+    assert 'fields' not in bulk
+    assert compiled['add_ticket_comment'].normalize({'is_private': 'no'})['is_private'] is False
+
+
 def test_create_ticket_wraps_result_with_summary(monkeypatch):
     captured = {}
 
@@ -227,3 +280,185 @@ def test_update_change_merges_pr_links(monkeypatch):
     assert merged_fields is not original_fields
     assert merged_fields['status'] == 3
     assert merged_fields['controlistcontent'] == '<p>existing</p><p>https://example.com/pr/3</p>'
+
+
+def test_batch_runs_operations_and_skips_failed_dependencies():
+    response = CommandHandler(
+        'batch',
+        {
+            'operations': [
+                {'tool': 'echo', 'arguments': {'message': 'uno'}, 'id': 'first'},
+                {'tool': 'nope', 'id': 'broken'},
+                {'tool': 'echo', 'arguments': {'message': 'dos'}, 'depends_on': ['first']},
+                {'tool': 'echo', 'arguments': {'message': 'tres'}, 'depends_on': ['broken']},
+            ]
+        },
+    ).execute()
+
+    payload = _extract_json(response)
+    assert payload['ok'] is True
+    assert payload['summary'] == '2 de 4 operaciones completadas'
+    results = payload['data']['results']
+    assert [result['index'] for result in results] == [0, 1, 2, 3]
+    assert results[0]['data'] == {'message': 'uno'}
+    assert results[1]['error']['type'] == 'unknown_command'
+    assert results[2]['data'] == {'message': 'dos'}
+    assert results[3]['error']['type'] == 'skipped'
+
+
+def test_batch_rejects_dependency_cycles():
+    response = CommandHandler(
+        'batch',
+        {
+            'operations': [
+                {'tool': 'echo', 'id': 'a', 'depends_on': ['b']},
+                {'tool': 'echo', 'id': 'b', 'depends_on': ['a']},
+            ]
+        },
+    ).execute()
+
+    payload = _extract_json(response)
+    assert payload['ok'] is False
+    assert payload['error']['type'] == 'validation_error'
+
+
+def test_sequential_batch_orders_forward_dependencies_and_rejects_cycles():
+    response = CommandHandler(
+        'batch',
+        {
+            'sequential': True,
+            'operations': [
+                {'tool': 'echo', 'arguments': {'message': 'uno'}, 'depends_on': [1]},
+                {'tool': 'echo', 'arguments': {'message': 'dos'}},
+            ],
+        },
+    ).execute()
+
+    payload = _extract_json(response)
+    assert payload['summary'] == '2 de 2 operaciones completadas'
+    assert [result['data']['message'] for result in payload['data']['results']] == ['uno', 'dos']
+
+    response = CommandHandler(
+        'batch',
+        {
+            'sequential': True,
+            'operations': [
+                {'tool': 'echo', 'depends_on': [1]},
+                {'tool': 'echo', 'depends_on': [0]},
+            ],
+        },
+    ).execute()
+    assert _extract_json(response)['error']['type'] == 'validation_error'
+
+
+def test_batch_shares_one_glpi_session(monkeypatch):
+    opened = []
+
+    class DummyHandler:
+        def __init__(self, *args, **kwargs):
+            opened.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def update_items(self, table, payloads):
+            return [{str(payloads[0]['id']): True, 'message': ''}]
+
+    monkeypatch.setattr(glpi_tickets, 'RequestHandler', DummyHandler)
+
+    response = CommandHandler(
+        'batch',
+        {
+            'operations': [
+                {'tool': 'update_ticket', 'arguments': {'ticket_id': 1, 'fields': {'status': 2}}},
+                {'tool': 'update_ticket', 'arguments': {'ticket_id': 2, 'fields': {'status': 2}}},
+            ]
+        },
+    ).execute()
+
+    payload = _extract_json(response)
+    assert [result['ok'] for result in payload['data']['results']] == [True, True]
+    assert len(opened) == 1
+
+
+def test_identical_concurrent_reads_share_one_call(monkeypatch):
+    import threading
+    import time
+
+    from mcp_glpi.common import singleflight
+
+    calls = []
+    release = threading.Event()
+
+    def fake_all_tickets(**kwargs):
+        calls.append(kwargs)
+        release.wait(5)
+        return [{'id': 1}]
+
+    monkeypatch.setattr(glpi_tickets, 'all_tickets', fake_all_tickets)
+    shared_before = singleflight.read_calls.stats()['shared']
+    responses = []
+
+    def call(arguments):
+        responses.append(_extract_json(CommandHandler('list_tickets', arguments).execute()))
+
+    threads = [
+        threading.Thread(target=call, args=({'limit': 5},)),
+        threading.Thread(target=call, args=({'limit': '5', 'debug_trace': False},)),
+    ]
+    threads[0].start()
+    while not calls:
+        time.sleep(0.001)
+    threads[1].start()
+    deadline = time.monotonic() + 5
+    while singleflight.read_calls.stats()['shared'] == shared_before:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert [payload['data'] for payload in responses] == [[{'id': 1}], [{'id': 1}]]
+
+    # Once the first call is over, the next one goes to GLPI again
+    CommandHandler('list_tickets', {'limit': 5}).execute()
+    assert len(calls) == 2
+
+
+def test_shutdown_drains_running_calls_and_rejects_new_ones(monkeypatch):
+    import threading
+
+    from mcp_glpi.common.lifecycle import in_flight_calls
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_all_tickets(**kwargs):
+        started.set()
+        release.wait(5)
+        return [{'id': 1}]
+
+    monkeypatch.setattr(glpi_tickets, 'all_tickets', slow_all_tickets)
+    responses = []
+    running = threading.Thread(
+        target=lambda: responses.append(_extract_json(CommandHandler('list_tickets', {}).execute()))
+    )
+    running.start()
+    started.wait(5)
+    in_flight_calls.close()
+    try:
+        rejected = _extract_json(CommandHandler('echo', {'message': 'late'}).execute())
+        assert rejected['error']['type'] == 'shutting_down'
+        assert in_flight_calls.wait_idle(0.05) is False
+
+        release.set()
+        assert in_flight_calls.wait_idle(5) is True
+    finally:
+        in_flight_calls.reopen()
+        running.join(5)
+
+    assert responses[0]['ok'] is True
@@ -0,0 +1,212 @@
+import threading
+
+import pytest
+
+from glpi_client import GLPIRequestError, RequestHandler
+from glpi_client.core import WriteCoalescer
+
+
+class DummyResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = '' if payload is None else str(payload)
+        self.url = 'http://glpi/apirest.php/Ticket/1'
+        self.headers = {}
+        self.request = type('Request', (), {'headers': {}, 'body': None, 'method': 'GET'})()
+
+    def json(self):
+        return self._payload
+
+
+def _handler():
+    return RequestHandler('http://glpi', 'app-token', 'user-token', False)
+
+
+def test_get_items_by_ids_uses_chunked_search_in_request_order(monkeypatch):
+    handler = _handler()
+    calls = []
+
+    def fake_search_items(item_type, filters=None, range_=None, force_display=None, uid_cols=False):
+        calls.append({'filters': filters, 'range': range_, 'force_display': force_display})
+        return {
+            'data': [
+                {'Ticket.id': f['value'], 'Ticket.name': f"T{f['value']}"}
+                for f in filters
+                if f['value'] != 3
+            ]
+        }
+
+    monkeypatch.setattr(handler, 'search_items', fake_search_items)
+
+    result = handler.get_items_by_ids('Ticket', [5, 3, 1, 5, 2], fields=[1], chunk_size=2)
+
+    assert [item['id'] for item in result['items']] == [5, 1, 2]
+    assert result['items'][0]['name'] == 'T5'
+    assert result['missing'] == [3]
+    assert len(calls) == 2
+    assert all(f['link'] == 'OR' and f['field'] == 2 for f in calls[0]['filters'])
+    assert calls[0]['range'] == (0, 1)
+    assert calls[0]['force_display'] == [2, 1]
+
+
+def test_get_items_by_ids_falls_back_to_concurrent_get_item(monkeypatch):
+    handler = _handler()
+
+    def fake_get_item(item_type, id_):
+        if id_ == 2:
+            raise GLPIRequestError(DummyResponse(404, ['ERROR_ITEM_NOT_FOUND']))
+        return {'id': id_}
+
+    def fail_search(*args, **kwargs):
+        pytest.fail('search_items should not be used above the threshold')
+
+    monkeypatch.setattr(handler, 'get_item', fake_get_item)
+    monkeypatch.setattr(handler, 'search_items', fail_search)
+
+    result = handler.get_items_by_ids('Ticket', [4, 2, 9], search_threshold=2, max_workers=2)
+
+    assert result == {'items': [{'id': 4}, {'id': 9}], 'missing': [2]}
+
+
+def test_update_items_chunked_reports_per_item_outcomes(monkeypatch):
+    handler = _handler()
+    chunks = []
+
+    def fake_update_items(item_type, data):
+        chunks.append([item['id'] for item in data])
+        if data[0]['id'] == 3:
+            raise GLPIRequestError(DummyResponse(400, ['ERROR_GLPI_UPDATE']))
+        return [{str(item['id']): item['id'] != 2, 'message': ''} for item in data]
+
+    monkeypatch.setattr(handler, 'update_items', fake_update_items)
+
+    outcomes = handler.update_items_chunked(
+        'Ticket',
+        [{'id': i, 'status': 6} for i in range(1, 6)],
+        chunk_size=2,
+        max_workers=2,
+    )
+
+    assert sorted(chunks) == [[1, 2], [3, 4], [5]]
+    assert [o['id'] for o in outcomes] == [1, 2, 3, 4, 5]
+    assert [o['ok'] for o in outcomes] == [True, False, False, False, True]
+    assert 'ERROR_GLPI_UPDATE' in outcomes[2]['message']
+
+
+def test_add_items_chunked_returns_created_ids_in_order(monkeypatch):
+    handler = _handler()
+
+    def fake_add_items(item_type, data):
+        return [
+            {'id': False, 'message': 'denied'} if item['name'] == 'bad' else {'id': item['n'], 'message': ''}
+            for item in data
+        ]
+
+    monkeypatch.setattr(handler, 'add_items', fake_add_items)
+
+    outcomes = handler.create_tickets(
+        [{'name': 'ok', 'n': 10}, {'name': 'bad', 'n': 0}, {'name': 'ok', 'n': 12}],
+        chunk_size=2,
+    )
+
+    assert [(o['id'], o['ok']) for o in outcomes] == [(10, True), (None, False), (12, True)]
+    assert outcomes[1]['message'] == 'denied'
+
+
+def test_write_coalescer_merges_concurrent_inserts_and_fans_out_responses():
+    sent = []
+
+    def fake_send(item_type, entries):
+        sent.append((item_type, list(entries)))
+        return [{'id': entry['n'], 'message': ''} for entry in entries]
+
+    coalescer = WriteCoalescer(fake_send, window=0.5, max_batch=4)
+    results = {}
+    barrier = threading.Barrier(3)
+
+    def worker(n):
+        barrier.wait()
+        data = {'n': n} if n != 2 else [{'n': 20}, {'n': 21}]
+        results[n] = coalescer.add('ITILFollowup', data)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in (1, 2, 3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(sent) == 1
+    assert sorted(entry['n'] for entry in sent[0][1]) == [1, 3, 20, 21]
+    assert results[1] == {'id': 1, 'message': ''}
+    assert results[2] == [{'id': 20, 'message': ''}, {'id': 21, 'message': ''}]
+    assert results[3] == {'id': 3, 'message': ''}
+
+
+def test_add_items_coalesced_propagates_batch_errors(monkeypatch):
+    handler = _handler()
+
+    def failing_add_items(item_type, data):
+        raise GLPIRequestError(DummyResponse(400, ['ERROR']))
+
+    monkeypatch.setattr(handler, 'add_items', failing_add_items)
+    handler.enable_write_coalescing(window=0.0)
+
+    with pytest.raises(GLPIRequestError):
+        handler.add_items_coalesced('Ticket_User', {'users_id': 1})
+
+
+def test_session_token_store_reuses_sessions_across_handlers(tmp_path):
+    from benchmarks.fake_glpi import FakeGLPIServer
+    from glpi_client.core import SessionTokenStore, set_default_token_store
+
+    path = tmp_path / 'sessions.json'
+    set_default_token_store(SessionTokenStore(str(path)))
+    try:
+        with FakeGLPIServer(items=5) as glpi:
+            def fetch():
+                with RequestHandler(glpi.url, 'app', 'user', False) as handler:
+                    item_id = handler.get_item('Ticket', 1)['id']
+                    return handler.session_token, item_id
+
+            first_token, _ = fetch()
+            assert fetch() == (first_token, 1)  # restored, no new login
+            assert glpi.logins['user'] == 1
+            assert glpi.request_counts().get('GET killSession', 0) == 0
+            assert first_token not in path.read_text()
+
+            glpi._sessions.clear()  # expired on the GLPI side
+            renewed_token, item_id = fetch()
+            assert item_id == 1
+            assert renewed_token != first_token
+            assert glpi.logins['user'] == 2
+
+            with RequestHandler(glpi.url, 'app', 'user', False) as handler:
+                handler.change_active_entity(2)
+            assert glpi.request_counts()['GET killSession'] == 1
+            assert fetch()[0] not in (first_token, renewed_token)
+    finally:
+        set_default_token_store(None)
+
+
+def test_response_range_is_per_thread_on_a_shared_handler():
+    from benchmarks.fake_glpi import FakeGLPIServer
+
+    ranges = {}
+    barrier = threading.Barrier(2)
+    with FakeGLPIServer(items=30) as glpi:
+        with RequestHandler(glpi.url, 'app', 'user', False) as handler:
+            def listing(start, end):
+                handler.get_many_items('Ticket', range_=(start, end))
+                barrier.wait()
+                ranges[start] = handler.response_range
+
+            threads = [
+                threading.Thread(target=listing, args=args) for args in ((0, 4), (10, 19))
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+    assert (ranges[0].start, ranges[0].end) == (0, 4)
+    assert (ranges[10].start, ranges[10].end) == (10, 19)
@@ -0,0 +1,89 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import anyio
+import pytest
+
+from benchmarks.fake_glpi import FakeGLPIServer
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_port(port, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            pytest.fail(f'server exited with {process.returncode}')
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.2):
+                return
+        except OSError:
+            time.sleep(0.05)
+    pytest.fail('server did not start listening')
+
+
+async def _call(url, headers, tool, arguments):
+    from mcp import ClientSession
+    from mcp.client.streamable_http import streamablehttp_client
+
+    async with streamablehttp_client(url, headers=headers) as (read, write, _):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            result = await session.call_tool(tool, arguments)
+    return json.loads(result.content[0].text)
+
+
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+def test_http_server_isolates_client_credentials():
+    port = _free_port()
+    with FakeGLPIServer(items=20) as glpi:
+        env = {
+            **os.environ,
+            'GLPI_URL': glpi.url,
+            'GLPI_APP_TOKEN': 'server-app-token',
+            'GLPI_USER_TOKEN': 'server-user-token',
+            'PYTHONPATH': str(ROOT / 'src'),
+        }
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'mcp_glpi.server', '--transport', 'http', '--port', str(port)],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            _wait_for_port(port, process)
+            url = f'http://127.0.0.1:{port}/mcp'
+
+            async def scenario():
+                return [
+                    await _call(url, {}, 'list_tickets', {'limit': 2}),
+                    await _call(
+                        url,
+                        {'X-GLPI-User-Token': 'alice', 'X-GLPI-Entity': '3'},
+                        'list_tickets',
+                        {'limit': 2},
+                    ),
+                    await _call(
+                        url, {'Authorization': 'user_token bob'}, 'list_tickets', {'limit': 2}
+                    ),
+                ]
+
+            payloads = anyio.run(scenario)
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+
+    assert [payload['ok'] for payload in payloads] == [True, True, True]
+    assert set(glpi.logins) == {'server-user-token', 'alice', 'bob'}
+    assert glpi.entity_changes == {('alice', 3): 1}
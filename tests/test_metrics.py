@@ -0,0 +1,68 @@
+import json
+
+from glpi_client import RequestHandler
+from glpi_client.core import RequestsTransport
+from glpi_client.utils import http_metrics
+
+from mcp_glpi.GLPiHandler import CommandHandler
+from mcp_glpi.common import metrics
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self._payload = payload
+        self.content = json.dumps(payload).encode()
+        self.text = self.content.decode()
+        self.headers = {}
+        self.request = type('Request', (), {'body': None})()
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    def get(self, url, **kwargs):
+        if url.endswith('initSession'):
+            return FakeResponse(200, {'session_token': 'abc'})
+        return FakeResponse(200, {'id': int(url.rsplit('/', 1)[-1])})
+
+
+def test_tool_calls_are_recorded_with_errors():
+    metrics.tool_metrics.reset()
+
+    CommandHandler('echo', {'message': 'hola'}).execute()
+    CommandHandler('get_tickets', {}).execute()
+
+    stats = metrics.collect_stats()
+    assert stats['tools']['echo']['calls'] == 1
+    assert stats['tools']['echo']['errors'] == 0
+    assert stats['tools']['get_tickets']['errors_by_type'] == {'validation_error': 1}
+    assert 'sessions' in stats and 'caches' in stats
+
+    text = metrics.render_prometheus(stats)
+    assert 'mcp_glpi_tool_latency_seconds_count{tool="echo"} 1' in text
+    assert 'mcp_glpi_tool_errors_total{tool="get_tickets",type="validation_error"} 1' in text
+
+
+def test_glpi_requests_are_recorded_per_endpoint():
+    http_metrics.reset()
+    handler = RequestHandler('http://glpi', 'app', 'user', False)
+    handler.transport = RequestsTransport(FakeSession())
+
+    handler.init_session()
+    handler.get_item('Ticket', 5)
+    handler.get_item('Ticket', 6)
+
+    snapshot = http_metrics.snapshot()
+    assert snapshot['GET initSession']['requests'] == 1
+    assert snapshot['GET Ticket/{id}']['requests'] == 2
+    assert snapshot['GET Ticket/{id}']['status_codes'] == {'200': 2}
+    assert snapshot['GET Ticket/{id}']['bytes_received'] > 0
+
+
+def test_server_stats_tool_supports_prometheus_output():
+    response = CommandHandler('server_stats', {'format': 'prometheus'}).execute()
+    payload = json.loads(response[0].text)
+    assert payload['ok'] is True
+    assert payload['data'].startswith('# TYPE mcp_glpi_uptime_seconds gauge')
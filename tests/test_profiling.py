@@ -0,0 +1,26 @@
+from mcp_glpi.GLPiHandler import CommandHandler
+from mcp_glpi.common import profiling
+
+
+def test_named_tools_are_profiled_with_bounded_retention(tmp_path, monkeypatch):
+    profiler = profiling.ToolProfiler(str(tmp_path), tools=['echo'], mode='both', retention=2)
+    monkeypatch.setattr(profiling, 'active_profiler', profiler)
+
+    for _ in range(3):
+        CommandHandler('echo', {'message': 'hola'}).execute()
+    CommandHandler('list_tools_unknown', {}).execute()
+
+    assert len(list(tmp_path.glob('*_echo_*.prof'))) == 2
+    reports = list(tmp_path.glob('*_echo_*.alloc.txt'))
+    assert len(reports) == 2
+    assert reports[0].read_text(encoding='utf-8').startswith('tool: echo')
+
+
+def test_sampling_and_disabled_profiler(tmp_path, monkeypatch):
+    profiler = profiling.ToolProfiler(str(tmp_path), sample_rate=0.0)
+    assert profiler.should_profile('echo') is False
+    assert profiling.ToolProfiler(str(tmp_path), sample_rate=1.0).should_profile('echo')
+
+    monkeypatch.setattr(profiling, 'active_profiler', None)
+    CommandHandler('echo', {'message': 'hola'}).execute()
+    assert list(tmp_path.iterdir()) == []
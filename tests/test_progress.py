@@ -0,0 +1,88 @@
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.fake_glpi import FakeGLPIServer
+from glpi_client import RequestHandler
+from glpi_client.utils import progress_scope
+from tests.test_http_server import ROOT
+
+
+def test_paged_listing_and_chunks_report_progress():
+    reports = []
+    with FakeGLPIServer(items=250, max_range=100) as glpi:
+        with RequestHandler(glpi.url, 'app', 'user', False) as handler:
+            with progress_scope(lambda done, total, message: reports.append((done, total))):
+                items = handler.get_many_items_paged('Ticket', 20, 500)
+                assert reports == [(100, 230), (200, 230), (230, 230)]
+                assert len({item['id'] for item in items}) == 230
+                assert handler.response_range.end == 249
+
+                reports.clear()
+                payloads = [{'id': id_, 'status': 2} for id_ in range(1, 121)]
+                handler.update_items_chunked('Ticket', payloads, chunk_size=50)
+        counts = glpi.request_counts()
+    assert counts['GET Ticket'] == 3
+    # chunks finish in any order; the running total only grows
+    assert len(reports) == 3
+    assert reports == sorted(reports)
+    assert reports[-1] == (120, 120)
+
+
+def _message(payload):
+    return (json.dumps(payload) + '\n').encode()
+
+
+def test_mcp_list_sends_progress_notifications():
+    with FakeGLPIServer(items=2500, max_range=1000, latency=0.3) as glpi:
+        env = {
+            **os.environ,
+            'GLPI_URL': glpi.url,
+            'PYTHONPATH': str(ROOT / 'src'),
+        }
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'mcp_glpi.server'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+        )
+        try:
+            process.stdin.write(_message({
+                'jsonrpc': '2.0', 'id': 1, 'method': 'initialize',
+                'params': {
+                    'protocolVersion': '2025-06-18',
+                    'capabilities': {},
+                    'clientInfo': {'name': 'test', 'version': '1'},
+                },
+            }))
+            process.stdin.write(_message({'jsonrpc': '2.0', 'method': 'notifications/initialized'}))
+            process.stdin.write(_message({
+                'jsonrpc': '2.0', 'id': 2, 'method': 'tools/call',
+                'params': {
+                    'name': 'list_tickets',
+                    'arguments': {'limit': 3000, 'sort_by': 'id', 'order': 'ASC'},
+                    '_meta': {'progressToken': 'listing'},
+                },
+            }))
+            process.stdin.flush()
+            process.stdout.readline()
+            progress = []
+            while True:
+                message = json.loads(process.stdout.readline())
+                if message.get('id') == 2:
+                    break
+                if message.get('method') == 'notifications/progress':
+                    progress.append(message['params'])
+        finally:
+            process.stdin.close()
+            process.wait(timeout=30)
+
+    payload = json.loads(message['result']['content'][0]['text'])
+    assert len(payload['data']['tickets']) == 2500
+    assert payload['data']['range']['start'] == 0
+    assert {params['progressToken'] for params in progress} == {'listing'}
+    assert [(params['progress'], params['total']) for params in progress] == [
+        (1000, 2500), (2000, 2500), (2500, 2500),
+    ]
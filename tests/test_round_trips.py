@@ -0,0 +1,127 @@
+import json
+import time
+
+from glpi_client.utils import start_trace
+
+from mcp_glpi.GLPiHandler import CommandHandler
+from mcp_glpi.glpi import pool
+from mcp_glpi.glpi.identity import ClientCredentials, client_credentials
+
+
+def _run(command, arguments):
+    with start_trace() as trace:
+        response = CommandHandler(command, arguments).execute()
+    return json.loads(response[0].text), trace
+
+
+def test_create_ticket_round_trip_budget(fake_glpi):
+    payload, trace = _run('create_ticket', {'name': 'Demo'})
+
+    assert payload['ok'] is True
+    assert trace.round_trips <= 3
+    assert [call.endpoint for call in trace.calls] == ['initSession', 'Ticket']
+
+    payload, trace = _run('create_ticket', {'name': 'Again'})
+    assert [call.endpoint for call in trace.calls] == ['Ticket']
+
+
+def test_session_pool_separates_identities_and_expires_idle_sessions(fake_glpi):
+    _run('create_ticket', {'name': 'Default'})
+    with client_credentials(ClientCredentials(user_token='alice')):
+        _run('create_ticket', {'name': 'Alice'})
+    _run('create_ticket', {'name': 'Default again'})
+
+    session_pool = pool.session_pool()
+    assert session_pool.stats()['identities'] == 2
+    assert session_pool.stats()['opened'] == 2
+    assert session_pool.expire_idle(now=time.monotonic() + 3600) == 2
+    assert fake_glpi.requests.count(('GET', 'killSession')) == 2
+    assert session_pool.stats()['identities'] == 0
+
+
+def test_get_tickets_uses_a_single_search_request(fake_glpi):
+    payload, trace = _run('get_tickets', {'ids': list(range(1, 21))})
+
+    assert len(payload['data']['tickets']) == 20
+    assert trace.round_trips <= 3
+
+
+def test_batch_shares_session_round_trips(fake_glpi):
+    payload, trace = _run(
+        'batch',
+        {
+            'operations': [
+                {'tool': 'update_ticket', 'arguments': {'ticket_id': i, 'fields': {'status': 2}}}
+                for i in range(1, 6)
+            ]
+        },
+    )
+
+    assert payload['ok'] is True
+    assert trace.round_trips <= 7
+
+
+def test_debug_trace_flag_returns_trace_in_response(fake_glpi):
+    payload, _ = _run('create_ticket', {'name': 'Demo', 'debug_trace': True})
+
+    assert payload['trace']['round_trips'] == 2
+    assert payload['trace']['calls'][1]['method'] == 'POST'
+    assert payload['trace']['calls'][1]['retry'] == 0
+
+
+def test_pooled_sessions_keep_their_profile_and_entity(fake_glpi):
+    def run_as(profile_id=None, entity_id=None):
+        credentials = ClientCredentials(profile_id=profile_id, entity_id=entity_id)
+        with client_credentials(credentials):
+            return _run('create_ticket', {'name': 'Scoped'})[1]
+
+    first = run_as(entity_id=3)
+    again = run_as(entity_id=3)
+    other = run_as(entity_id=5)
+    profiled = run_as(profile_id=4)
+    default = run_as()
+
+    assert [call.endpoint for call in first.calls] == [
+        'initSession',
+        'changeActiveEntities',
+        'Ticket',
+    ]
+    assert [call.endpoint for call in again.calls] == ['Ticket']
+    assert [call.endpoint for call in other.calls] == ['changeActiveEntities', 'Ticket']
+    assert [call.endpoint for call in profiled.calls] == ['changeActiveProfile', 'Ticket']
+    # No way back to the login context of a switched session: open a new one
+    assert [call.endpoint for call in default.calls] == ['initSession', 'Ticket']
+    assert pool.session_pool().stats()['context_switches'] == 3
+
+
+def test_keepalive_pings_idle_sessions_and_replaces_expired_ones(monkeypatch):
+    from benchmarks.fake_glpi import FakeGLPIServer
+    from glpi_client import RequestHandler
+    from mcp_glpi.common.config import get_config
+
+    with FakeGLPIServer(items=5) as glpi:
+        monkeypatch.setenv('GLPI_URL', glpi.url)
+        get_config.cache_clear()
+        try:
+            session_pool = pool.SessionPool(keepalive_interval=60)
+            with client_credentials(ClientCredentials(entity_id=2)):
+                with session_pool.lease(RequestHandler) as handler:
+                    first_token = handler.session_token
+
+            later = time.monotonic() + 120
+            assert session_pool.keep_alive(now=later) == 1
+            assert glpi.request_counts()['GET getActiveProfile'] == 1
+
+            glpi._sessions.clear()  # GLPI dropped the session
+            assert session_pool.keep_alive(now=later + 120) == 1
+            with client_credentials(ClientCredentials(entity_id=2)):
+                with session_pool.lease(RequestHandler) as handler:
+                    assert handler.session_token != first_token
+                    assert handler.get_item('Ticket', 1)['id'] == 1
+            session_pool.close()
+        finally:
+            get_config.cache_clear()
+
+    assert session_pool.stats()['refreshed'] == 1
+    assert sum(glpi.logins.values()) == 2
+    assert sum(glpi.entity_changes.values()) == 2
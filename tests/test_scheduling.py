@@ -0,0 +1,59 @@
+import threading
+import time
+
+from benchmarks.fake_glpi import FakeGLPIServer
+from glpi_client import RequestHandler
+from glpi_client.utils import pacing_scope
+from mcp_glpi.common.scheduling import WorkloadScheduler
+from mcp_glpi.tool_catalog import BULK, INTERACTIVE, classify_workload
+
+
+def test_classify_workload_from_spec_and_argument_size():
+    assert classify_workload('bulk_update_tickets', {'ids': [1], 'fields': {}}) == BULK
+    assert classify_workload('list_tickets', {'limit': 20}) == INTERACTIVE
+    assert classify_workload('list_tickets', {'limit': '5000'}) == BULK
+    assert classify_workload('get_tickets', {'ids': list(range(300))}) == BULK
+    assert classify_workload('get_tickets', {'ids': '1,2,3'}) == INTERACTIVE
+    assert classify_workload('no_such_tool', {}) == INTERACTIVE
+
+
+def test_bulk_requests_wait_for_interactive_calls():
+    scheduler = WorkloadScheduler(max_yield=5.0)
+    interactive_started = threading.Event()
+    interactive_done = threading.Event()
+
+    def interactive_call():
+        with scheduler.running(INTERACTIVE):
+            interactive_started.set()
+            interactive_done.wait()
+
+    with FakeGLPIServer(items=100) as glpi:
+        with RequestHandler(glpi.url, 'app', 'user', False) as handler:
+            threading.Thread(target=interactive_call).start()
+            interactive_started.wait()
+
+            def bulk_call():
+                with scheduler.running(BULK), pacing_scope(scheduler.yield_to_interactive):
+                    payloads = [{'id': id_, 'status': 2} for id_ in range(1, 101)]
+                    handler.update_items_chunked('Ticket', payloads, chunk_size=50)
+
+            bulk = threading.Thread(target=bulk_call)
+            bulk.start()
+            time.sleep(0.3)
+            assert 'PATCH Ticket' not in glpi.request_counts()
+            assert scheduler.stats()['running'] == {INTERACTIVE: 1, BULK: 1}
+
+            interactive_done.set()
+            bulk.join(timeout=10)
+        counts = glpi.request_counts()
+    assert counts['PATCH Ticket'] == 2
+    assert 0 < scheduler.stats()['bulk_yield_seconds'] < 5
+
+
+def test_bulk_yield_is_bounded():
+    scheduler = WorkloadScheduler(max_yield=0.05)
+    with scheduler.running(INTERACTIVE):
+        started = time.monotonic()
+        scheduler.yield_to_interactive()
+        assert time.monotonic() - started < 1
+    assert scheduler.stats()['bulk_yields'] == 1
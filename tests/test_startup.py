@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / 'src'
+# Self time (microseconds) allowed for our own modules when importing the server
+OWN_IMPORT_BUDGET_US = 50_000
+DEFERRED_MODULES = (
+    'requests',
+    'glpi_client',
+    'mcp_glpi.GLPiHandler',
+    'mcp_glpi.GLPITools',
+    'mcp_glpi.glpi.tickets',
+    'mcp_glpi.glpi.changes',
+)
+
+
+def _import_times(module):
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, [str(SRC_DIR), os.environ.get('PYTHONPATH')]))}
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def test_server_import_defers_glpi_stack():
+    times = _import_times('mcp_glpi.server')
+
+    assert 'mcp_glpi.server' in times
+    assert [name for name in DEFERRED_MODULES if name in times] == []
+    own = sum(self_us for name, (self_us, _) in times.items() if name.startswith('mcp_glpi'))
+    assert own < OWN_IMPORT_BUDGET_US
+
+
+def test_server_instance_and_tools_are_built_lazily():
+    import mcp_glpi.GLPITools as tools
+    import mcp_glpi.server as server
+
+    assert server.server_instance is server.get_server()
+    assert tools.tools is tools.get_tools()
+
+
+def test_list_tools_reuses_prebuilt_result():
+    import asyncio
+
+    import mcp.types as types
+
+    from mcp_glpi.server import GLPIMCPServer
+    from mcp_glpi.tool_catalog import TOOL_SPECS, compile_catalog
+
+    server = GLPIMCPServer()
+    handler = server.app.request_handlers[types.ListToolsRequest]
+
+    first = asyncio.run(handler(None))
+    second = asyncio.run(handler(None))
+
+    assert first is second
+    assert len(first.root.tools) == len(TOOL_SPECS)
+    assert first.root.meta == {'catalogHash': compile_catalog().content_hash}
+    assert set(server.app._tool_cache) == {spec.name for spec in TOOL_SPECS}
+
+
+def test_tool_specs_are_immutable():
+    import pytest
+
+    from mcp_glpi.tool_catalog import TOOL_SPECS
+
+    with pytest.raises(TypeError):
+        TOOL_SPECS[0].input_schema['properties'] = {}
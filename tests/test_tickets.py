@@ -179,3 +179,126 @@ def test_delete_ticket_converts_flags(monkeypatch):
     assert captured['purge'] is True
     assert captured['log'] is False
     assert result.summary() == 'Deleted ticket 15'
+
+
+def test_fetch_tickets_by_ids_resolves_fields_and_reports_missing(monkeypatch):
+    captured = {}
+
+    class DummyHandler:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def get_items_by_ids(self, item_type, ids, fields=None):
+            captured['item_type'] = item_type
+            captured['ids'] = ids
+            captured['fields'] = fields
+            return {'items': [{'id': 7, 'name': 'Demo', 'status': 6}], 'missing': [8]}
+
+    monkeypatch.setattr(tickets, 'RequestHandler', DummyHandler)
+
+    result = tickets.get_tickets(ids=['7', 8, 7], fields=['id', 'name', 'status'])
+
+    assert captured['item_type'] == 'Ticket'
+    assert captured['ids'] == [7, 8]
+    assert captured['fields'] == [2, 1, 12]
+    assert result == {
+        'tickets': [{'id': 7, 'name': 'Demo', 'status': 'Closed'}],
+        'missing': [8],
+    }
+
+
+def test_fetch_tickets_by_ids_rejects_invalid_ids():
+    with pytest.raises(ValueError):
+        tickets.fetch_tickets_by_ids([])
+
+    with pytest.raises(ValueError):
+        tickets.fetch_tickets_by_ids(['abc'])
+
+
+def test_bulk_update_tickets_applies_shared_fields(monkeypatch):
+    captured = {}
+
+    class DummyHandler:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def update_items_chunked(self, table, payloads, chunk_size, max_workers):
+            captured['table'] = table
+            captured['payloads'] = payloads
+            return [{'id': p['id'], 'ok': p['id'] != 3, 'message': ''} for p in payloads]
+
+    monkeypatch.setattr(tickets, 'RequestHandler', DummyHandler)
+
+    result = tickets.bulk_update_tickets(ids=[1, '2', 3], fields={'status': 'Closed', 'skip': None})
+
+    assert captured['table'] == 'Ticket'
+    assert captured['payloads'] == [
+        {'id': 1, 'status': 6},
+        {'id': 2, 'status': 6},
+        {'id': 3, 'status': 6},
+    ]
+    assert result.as_dict()['failed'] == 1
+    assert result.summary() == 'Updated 2 of 3 ticket(s)'
+
+
+def test_bulk_update_tickets_validates_per_item_updates():
+    with pytest.raises(ValueError, match='update #2'):
+        tickets.bulk_update_tickets(
+            [
+                {'ticket_id': 1, 'fields': {'priority': 'High'}},
+                {'ticket_id': 2, 'fields': {'status': 'nope'}},
+            ]
+        )
+
+    with pytest.raises(ValueError):
+        tickets.bulk_update_tickets([{'ticket_id': 1, 'fields': {}}], ids=[1], fields={'status': 1})
+
+
+def test_bulk_create_tickets_validates_all_before_sending(monkeypatch):
+    sent = []
+
+    class DummyHandler:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def create_tickets(self, payloads, chunk_size, max_workers):
+            sent.extend(payloads)
+            return [{'id': 100 + i, 'ok': True, 'message': ''} for i in range(len(payloads))]
+
+    monkeypatch.setattr(tickets, 'RequestHandler', DummyHandler)
+
+    with pytest.raises(ValueError, match='ticket #2'):
+        tickets.bulk_create_tickets([{'name': 'A'}, {'name': 'B', 'urgency': 'nope'}])
+    assert sent == []
+
+    result = tickets.bulk_create_tickets(
+        [
+            {'name': ' A ', 'urgency': 'High', 'entity_id': '2'},
+            {'name': 'B', 'urgency': 'high', 'additional': {'custom': 1}},
+        ]
+    )
+
+    assert sent == [
+        {'name': 'A', 'content': '', 'urgency': 1, 'entities_id': 2},
+        {'name': 'B', 'content': '', 'urgency': 1, 'custom': 1},
+    ]
+    assert [outcome['id'] for outcome in result.outcomes] == [100, 101]
+    assert result.summary() == 'Created 2 of 2 ticket(s)'
@@ -0,0 +1,41 @@
+import json
+
+from glpi_client import RequestHandler
+from glpi_client.core import RecordingTransport, ReplayTransport
+
+from benchmarks.fake_glpi import FakeGLPIServer
+
+
+def _workload(handler):
+    tickets = handler.get_many_items('Ticket', range_=(0, 4))
+    created = handler.add_items('Ticket', {'name': 'Grabado'})
+    return tickets, created, handler.response_range
+
+
+def test_recorded_traffic_replays_without_server(tmp_path):
+    cassette = str(tmp_path / 'glpi.jsonl.gz')
+    with FakeGLPIServer(items=10) as server:
+        with RequestHandler(server.url, 'app', 'user', False, RecordingTransport(cassette)) as handler:
+            recorded = _workload(handler)
+
+    replay = ReplayTransport(cassette, strict=True)
+    with RequestHandler('http://offline', 'app', 'user', False, replay) as handler:
+        replayed = _workload(handler)
+
+    assert replayed[0] == recorded[0]
+    assert replayed[1] == recorded[1]
+    assert replayed[2].count == 10
+
+
+def test_cassette_scrubs_tokens(tmp_path):
+    cassette = tmp_path / 'glpi.jsonl'
+    with FakeGLPIServer(items=1) as server:
+        with RequestHandler(server.url, 'app-secret', 'user-secret', False, RecordingTransport(str(cassette))) as handler:
+            handler.get_full_session()
+
+    content = cassette.read_text(encoding='utf-8')
+    assert 'secret' not in content
+    assert 'fake-' not in content
+    first = json.loads(content.splitlines()[0])
+    assert first['path'] == 'initSession'
+    assert first['json'] == {'session_token': '***'}
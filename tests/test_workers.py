@@ -0,0 +1,103 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import anyio
+import pytest
+
+from benchmarks.fake_glpi import FakeGLPIServer
+from mcp_glpi.common.metrics import merge_stats
+from mcp_glpi.common.shared_store import SharedStore
+from tests.test_http_server import ROOT, _free_port, _wait_for_port
+
+
+def test_shared_store_and_merged_worker_stats(tmp_path):
+    path = str(tmp_path / 'store.sqlite3')
+    first = SharedStore(path, worker_id='0-1')
+    second = SharedStore(path, worker_id='1-2')
+    first.set('search_options', 'http://glpi|Ticket', {'name': 1})
+    assert second.get('search_options', 'http://glpi|Ticket') == {'name': 1}
+    assert second.get('search_options', 'missing') is None
+
+    def stats(calls, seconds):
+        histogram = {
+            'count': calls,
+            'sum_seconds': seconds,
+            'max_seconds': seconds,
+            'buckets': {'0.1': calls, '1.0': calls, '+Inf': calls},
+        }
+        return {
+            'uptime_seconds': 1.0,
+            'tools': {'list_tickets': {'calls': calls, 'errors': 0, 'max_glpi_requests_per_call': calls, 'latency': histogram}},
+            'caches': {'search_options': {'hits': calls}},
+        }
+
+    first.publish_stats(stats(2, 0.05))
+    second.publish_stats(stats(3, 0.5))
+    merged = merge_stats(second.worker_stats())
+
+    tool = merged['tools']['list_tickets']
+    assert tool['calls'] == 5
+    assert tool['max_glpi_requests_per_call'] == 3
+    assert tool['latency']['buckets'] == {'0.1': 5, '1.0': 5, '+Inf': 5}
+    assert tool['latency']['p50_seconds'] == 0.1
+    assert merged['caches']['search_options']['hits'] == 5
+    assert set(merged['workers']) == {'0-1', '1-2'}
+
+
+async def _session_calls(url, calls):
+    from mcp import ClientSession
+    from mcp.client.streamable_http import streamablehttp_client
+
+    payloads = []
+    async with streamablehttp_client(url) as (read, write, _):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            for tool, arguments in calls:
+                result = await session.call_tool(tool, arguments)
+                payloads.append(json.loads(result.content[0].text))
+    return payloads
+
+
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+def test_workers_keep_sessions_sticky_and_recycle():
+    port = _free_port()
+    with FakeGLPIServer(items=20) as glpi:
+        env = {
+            **os.environ,
+            'GLPI_URL': glpi.url,
+            'PYTHONPATH': str(ROOT / 'src'),
+        }
+        process = subprocess.Popen(
+            [
+                sys.executable, '-m', 'mcp_glpi.server', '--transport', 'http',
+                '--port', str(port), '--workers', '2', '--max-requests', '3',
+                '--recycle-grace', '2',
+            ],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            _wait_for_port(port, process)
+            url = f'http://127.0.0.1:{port}/mcp'
+            calls = [('list_tickets', {'limit': 1})] * 4
+            first = anyio.run(_session_calls, url, calls)
+            second = anyio.run(_session_calls, url, calls)
+            assert all(payload['ok'] for payload in first + second)
+
+            # Both workers passed --max-requests; wait for their replacements
+            deadline = time.monotonic() + 30
+            while True:
+                stats = anyio.run(_session_calls, url, [('server_stats', {})])[0]['data']
+                if len(stats['workers']) >= 3 or time.monotonic() > deadline:
+                    break
+                time.sleep(0.5)
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+    assert len(stats['workers']) >= 3
+    assert stats['tools']['list_tickets']['calls'] == 8